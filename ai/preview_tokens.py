@@ -0,0 +1,67 @@
+"""
+ai/preview_tokens.py
+
+meal-analyze 프리뷰 결과를 서명 토큰에 담아 클라이언트에 준다.
+
+- issue(user_id, payload): 계산 결과(라벨/총합 영양소/food_id/사진 경로 등) + 사용자 id 를 서명 → 토큰
+- load(token, user_id): 서명/만료/발급 사용자 확인 후 결과 복원 (캐시 조회 없음)
+- claim/finish/release: 같은 토큰으로 두 번 커밋해도 MealItem 은 한 번만 생성
+  (cache.add 로 선점, 완료 후 meal_item_id 기록 → 재요청엔 같은 결과 반환)
+
+결과는 토큰 안에 있으므로 어느 워커(LocMem 포함)에서 커밋해도 동작하고, 서명 때문에 숫자를 바꿀 수 없다.
+중복 커밋 방지(claim)만 캐시를 쓰므로 LocMem 에서는 워커가 다르면 중복 감지가 안 될 수 있다.
+"""
+from uuid import uuid4
+
+from django.conf import settings
+from django.core import signing
+from django.core.cache import cache
+
+SALT = "ai.meal-preview"
+# 커밋 진행 중 표시 (완료 후엔 meal_item_id 로 교체)
+IN_PROGRESS = "pending"
+
+
+class PreviewTokenError(Exception):
+    """서명 불일치/만료/다른 사용자."""
+
+
+def _ttl():
+    return int(getattr(settings, "AI_PREVIEW_TOKEN_TTL", 600))
+
+
+def _claim_key(nonce):
+    return f"ai:preview:{nonce}:commit"
+
+
+def issue(user_id, payload):
+    return signing.dumps({"n": uuid4().hex, "u": user_id, "p": payload}, salt=SALT, compress=True)
+
+
+def load(token, user_id):
+    """반환: (nonce, payload). 실패 시 PreviewTokenError."""
+    try:
+        data = signing.loads(token, salt=SALT, max_age=_ttl())
+    except signing.BadSignature as e:  # SignatureExpired 포함
+        raise PreviewTokenError(str(e)) from e
+    if data.get("u") != user_id or not isinstance(data.get("p"), dict):
+        raise PreviewTokenError("token user mismatch")
+    return data["n"], data["p"]
+
+
+def claim(nonce):
+    """
+    커밋 선점. 반환: None(선점 성공) | IN_PROGRESS(다른 요청이 처리 중) | meal_item_id(이미 완료).
+    """
+    if cache.add(_claim_key(nonce), IN_PROGRESS, _ttl()):
+        return None
+    return cache.get(_claim_key(nonce), IN_PROGRESS)
+
+
+def finish(nonce, meal_item_id):
+    cache.set(_claim_key(nonce), meal_item_id, _ttl())
+
+
+def release(nonce):
+    """커밋 실패 시 선점 해제 → 재시도 가능."""
+    cache.delete(_claim_key(nonce))
@@ -1,3 +1,80 @@
-from django.test import TestCase
+import pytest
+from django.core.cache import cache
 
-# Create your tests here.
+from ai import preview_tokens
+from intakes.models import Food, MealItem
+
+COMMIT_URL = "/api/ai/meal-commit/"
+
+
+@pytest.fixture
+def preview(user):
+    cache.clear()
+    food = Food.objects.create(
+        name="비빔밥", kcal_per_100g=150, protein_g_per_100g=5, carb_g_per_100g=22, fat_g_per_100g=4
+    )
+    payload = {
+        "label_ko": "비빔밥",
+        "macros": {"calories": 600.0, "protein": 20.0, "carb": 90.0, "fat": 15.0},
+        "meal_type": "점심",
+        "source": "db",
+        "food_id": food.id,
+        "photo_name": None,
+    }
+    return preview_tokens.issue(user.id, payload)
+
+
+@pytest.mark.django_db
+def test_commit_from_preview_token_is_idempotent(auth_client, preview):
+    r1 = auth_client.post(COMMIT_URL, {"preview_token": preview, "servings": 1.5}, format="json")
+    assert r1.status_code == 200, r1.content
+    item = MealItem.objects.get(pk=r1.json()["meal_item_id"])
+    # 서버에 보관된 계산 결과 × servings, Food 재조회 없이 food_id 그대로
+    assert (item.name, item.kcal, item.protein_g) == ("비빔밥", 900.0, 30.0)
+    assert item.food.name == "비빔밥" and item.meal.meal_type == "점심"
+    # 화면 기록 카드는 실제 저장값으로 그림
+    assert r1.json()["item"] == {
+        "label_ko": "비빔밥", "meal_type": "점심",
+        "macros": {"calories": 900.0, "protein": 30.0, "carb": 135.0, "fat": 22.5},
+    }
+
+    r2 = auth_client.post(COMMIT_URL, {"preview_token": preview}, format="json")
+    assert r2.status_code == 200
+    assert r2.json()["duplicate"] is True
+    assert r2.json()["meal_item_id"] == item.id
+    assert r2.json()["updated_consumed"] == r1.json()["updated_consumed"]
+    assert r2.json()["item"] == r1.json()["item"]
+    assert MealItem.objects.count() == 1
+
+
+@pytest.mark.django_db
+def test_commit_rejects_tampered_or_foreign_token(auth_client, preview, django_user_model):
+    assert auth_client.post(COMMIT_URL, {"preview_token": preview + "x"}, format="json").status_code == 410
+
+    other = django_user_model.objects.create_user(username="bob", password="pw1234!")
+    foreign = preview_tokens.issue(other.id, {"label_ko": "라면", "macros": {"calories": 500}})
+    assert auth_client.post(COMMIT_URL, {"preview_token": foreign}, format="json").status_code == 410
+
+    r = auth_client.post(COMMIT_URL, {"preview_token": preview, "meal_type": "야식"}, format="json")
+    assert r.status_code == 400
+    assert MealItem.objects.count() == 0
+
+
+@pytest.mark.django_db
+def test_token_carries_payload_without_shared_cache(auth_client, preview):
+    # 다른 워커(LocMem)에서 커밋하는 상황: 캐시에 아무것도 없어도 토큰만으로 저장
+    cache.clear()
+    r = auth_client.post(COMMIT_URL, {"preview_token": preview}, format="json")
+    assert r.status_code == 200, r.content
+    assert r.json()["item"]["macros"]["calories"] == 600.0
+
+
+@pytest.mark.django_db
+def test_client_macros_commit_is_gated(auth_client, settings):
+    body = {"label_ko": "라면", "meal_type": "저녁", "macros": {"calories": 1, "protein": 0, "carb": 0, "fat": 0}}
+    assert auth_client.post(COMMIT_URL, body, format="json").status_code == 400
+    assert MealItem.objects.count() == 0
+
+    settings.AI_MEAL_COMMIT_ALLOW_CLIENT_MACROS = True
+    r = auth_client.post(COMMIT_URL, body, format="json")
+    assert r.status_code == 200 and r.json()["item"]["label_ko"] == "라면"
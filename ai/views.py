@@ -17,25 +17,25 @@ logger = logging.getLogger(__name__)
 
 from datetime import date
 from typing import Any, Dict, List, Optional
-from uuid import uuid4
 
 import requests
 from django.conf import settings
 
 # ✅ 사진 선저장 관련
-from django.core.files.base import ContentFile
 from django.core.files.storage import default_storage
 from django.db import IntegrityError, transaction
 from django.utils import timezone
-from django.utils.timezone import now
 from rest_framework import viewsets
 from rest_framework.decorators import action
 from rest_framework.parsers import FormParser, JSONParser, MultiPartParser
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
 
+from ai import preview_tokens
 from ai.utils import estimate_macros_from_csv, match_csv_entry  # CSV 매칭/가늠값
 from intakes.models import Food, Meal, MealItem, NutritionLog
+from intakes.photo_store import is_known_photo, store_photo, track_pending
+from intakes.photo_urls import photo_url as cached_photo_url
 
 # ==============================================
 # Hugging Face helpers
@@ -390,19 +390,57 @@ def _pick_image_file(request):
 # 사진 선저장 도우미
 # ==============================================
 def _save_upload_and_get_paths(
-    image_bytes: bytes, ext_hint: str = "jpg"
+    image_bytes: bytes, ext_hint: str = "jpg", user=None
 ) -> Dict[str, str]:
-    """업로드 이미지를 media에 저장하고 {'name': FileField name, 'url': URL} 반환."""
-    dt = now()
-    subdir = f"meals/{dt:%Y/%m/%d}"
-    ext = (ext_hint or "jpg").lower().replace(".", "")
-    fname = f"{uuid4().hex}.{ext}"
-    path = f"{subdir}/{fname}"  # FileField name으로 사용
-    saved_path = default_storage.save(path, ContentFile(image_bytes))
-    url = default_storage.url(saved_path)
+    """
+    업로드 이미지를 내용 해시 경로에 저장하고 {'name': FileField name, 'url': URL} 반환.
+    같은 사진을 다시 올리면(재분석/재시도) 새 파일 없이 기존 경로 재사용.
+    커밋 전까지는 PendingUpload 로 추적 (gc_pending_uploads 가 TTL 후 정리).
+    """
+    saved_path = store_photo(image_bytes, ext_hint=ext_hint)
+    track_pending(saved_path, len(image_bytes), user=user)
+    url = cached_photo_url(saved_path)
     return {"name": saved_path, "url": url}
 
 
+def _linkable_photo_name(photo_name: Optional[str]) -> Optional[str]:
+    """
+    클라이언트가 보낸 photo_name 중 연결 가능한 것만 통과.
+    - 선저장된 블롭(PhotoBlob)
+    - 배포 전 uuid 경로(meals/...)로 선저장되어 실제 존재하는 파일
+    """
+    if not photo_name:
+        return None
+    if is_known_photo(photo_name):
+        return photo_name
+    if photo_name.startswith("meals/") and ".." not in photo_name:
+        try:
+            if default_storage.exists(photo_name):
+                return photo_name
+        except Exception:
+            logger.warning("photo exists check failed: %s", photo_name, exc_info=True)
+    return None
+
+
+def _consumed_summary(log) -> Dict[str, float]:
+    """NutritionLog → 화면 요약 카드용 {calories, protein, carbs, fat}."""
+    return {
+        "calories": round(getattr(log, "kcal_total", 0.0) or 0.0, 1),
+        "protein": round(getattr(log, "protein_total_g", 0.0) or 0.0, 1),
+        "carbs": round(getattr(log, "carb_total_g", 0.0) or 0.0, 1),
+        "fat": round(getattr(log, "fat_total_g", 0.0) or 0.0, 1),
+    }
+
+
+def _saved_item_summary(name, meal_type, macros) -> Dict[str, object]:
+    """meal-commit 으로 실제 저장된 값 → 화면 기록 카드용 {label_ko, meal_type, macros}."""
+    return {
+        "label_ko": name,
+        "meal_type": meal_type,
+        "macros": {k: round(float(macros.get(k) or 0.0), 1) for k in ("calories", "protein", "carb", "fat")},
+    }
+
+
 # ==============================================
 # Food 매칭 보강
 # ==============================================
@@ -481,7 +519,7 @@ class AIViewSet(viewsets.ViewSet):
         - commit 플래그:
           * 'preview' / '0' / 'false' / 'no' → 저장하지 않고 미리보기만
           * 그 외(기본): 로그인 사용자는 (임계 통과 시) 자동 저장
-        - 프리뷰 응답에는 can_save + save_payload 포함
+        - 프리뷰 응답에는 can_save + save_payload({"preview_token"}) 포함 → meal-commit 에 그대로 전달
         - 응답에 100g 기준(per100g) + 1회제공량 총합(total) 동시 제공, 저장은 total 기준
         """
 
@@ -537,7 +575,9 @@ class AIViewSet(viewsets.ViewSet):
             photo_name = None
             photo_url = None
             try:
-                photo_info = _save_upload_and_get_paths(image_bytes, ext_hint=ext_hint)
+                photo_info = _save_upload_and_get_paths(
+                    image_bytes, ext_hint=ext_hint, user=request.user
+                )
                 photo_name = photo_info.get("name")
                 photo_url = photo_info.get("url")
             except Exception:
@@ -775,6 +815,12 @@ class AIViewSet(viewsets.ViewSet):
                                 "photo_name": photo_name,
                             }
 
+                # ✅ 계산 결과는 서버 캐시에 두고 토큰만 전달 (커밋 시 재계산/재조회 없음)
+                preview_token = None
+                if save_payload:
+                    preview_token = preview_tokens.issue(request.user.id, save_payload)
+                    save_payload = {"preview_token": preview_token}
+
                 return Response(
                     {
                         "saved": False,
@@ -792,6 +838,7 @@ class AIViewSet(viewsets.ViewSet):
                         "can_save": can_save,
                         "has_payload": bool(save_payload),
                         "save_payload": save_payload,
+                        "preview_token": preview_token,
                         "debug": {
                             "is_auth": bool(request.user.is_authenticated),
                             "matched": bool(per100g),
@@ -860,9 +907,7 @@ class AIViewSet(viewsets.ViewSet):
                         "macros_per100g": per100g,
                         "macros_total": macros_total,
                         "weight_g": float(weight_g or 100.0),
-                        "photo_url": (
-                            default_storage.url(photo_name) if photo_name else None
-                        ),
+                        "photo_url": cached_photo_url(photo_name),
                         "alternatives": alternatives,
                         "meal_type": meal_type,
                         "meal_item_id": meal_item.id,
@@ -929,24 +974,38 @@ class AIViewSet(viewsets.ViewSet):
     )
     def meal_commit(self, request):
         """
-        프리뷰 응답의 save_payload를 받아 실제로 저장한다.
+        프리뷰 결과를 실제로 저장한다.
         요청(JSON 또는 form-data):
         {
-          "label_ko": "김치찌개",
-          "macros": {"calories": 350, "protein": 20, "carb": 25, "fat": 15},  # ✅ 총합(1회 제공량) 기준만 전달됨
-          "meal_type": "아침|점심|저녁|간식",
-          "source": "db|csv|csv_estimate|default|csv_default",
-          "food_id": 123,
-          "photo_name": "meals/2025/01/01/xxx.jpg"  # ✅ 분석 단계에서 선저장한 파일 경로
+          "preview_token": "...",          # ✅ 프리뷰 응답의 save_payload.preview_token
+          "meal_type": "아침|점심|저녁|간식",  # (선택) 덮어쓰기
+          "label_ko": "김치찌개",            # (선택) 덮어쓰기
+          "servings": 1.5                  # (선택) 1회 제공량 배수
         }
+        - 토큰의 계산 결과(총합 영양소/food_id/사진)를 그대로 기록 → 재계산·Food 재조회 없음
+        - 같은 토큰으로 다시 보내면 새로 만들지 않고 처음 결과를 반환 (duplicate=true)
+
+        - 응답 item: 실제로 저장된 {label_ko, meal_type, macros} (화면 기록 카드용)
+
+        이전 형식(label_ko/macros/source/food_id/photo_name 직접 전달)은 클라이언트 숫자를 그대로 믿으므로
+        settings.AI_MEAL_COMMIT_ALLOW_CLIENT_MACROS=True 일 때만 허용 (기본 거부, 폐지 예정).
         """
         data = request.data
+        token = (data.get("preview_token") or "").strip()
+        if token:
+            return self._commit_preview_token(request, token)
+        if not getattr(settings, "AI_MEAL_COMMIT_ALLOW_CLIENT_MACROS", False):
+            return Response(
+                {"error": "preview_token 이 필요합니다. 먼저 meal-analyze 프리뷰를 받아 주세요."},
+                status=400,
+            )
+        logger.warning("meal_commit: deprecated client-macros payload (user=%s)", request.user.id)
 
         label_ko = (data.get("label_ko") or "").strip()
         meal_type = (data.get("meal_type") or "").strip() or "간식"
         source = (data.get("source") or "").strip() or "csv"
         food_id = data.get("food_id")
-        photo_name = (data.get("photo_name") or "").strip() or None
+        photo_name = _linkable_photo_name((data.get("photo_name") or "").strip() or None)
 
         macros = data.get("macros") or {}
         try:
@@ -969,6 +1028,86 @@ class AIViewSet(viewsets.ViewSet):
             except Food.DoesNotExist:
                 food_obj = None  # CSV 기반 저장 허용
 
+        return self._write_meal_item(
+            request,
+            meal_type=meal_type,
+            food_id=getattr(food_obj, "id", None),
+            name=label_ko,
+            macros={"calories": kcal, "protein": protein, "carb": carb, "fat": fat},
+            source=source,
+            photo_name=photo_name,
+        )
+
+    def _commit_preview_token(self, request, token):
+        data = request.data
+        try:
+            nonce, cached = preview_tokens.load(token, request.user.id)
+        except preview_tokens.PreviewTokenError:
+            return Response(
+                {"error": "프리뷰가 만료되었거나 올바르지 않습니다. 다시 분석해 주세요."},
+                status=410,
+            )
+
+        # (선택) 덮어쓰기 검증
+        meal_type = (data.get("meal_type") or "").strip() or cached.get("meal_type") or "간식"
+        if meal_type not in dict(Meal.MEAL_TYPES):
+            return Response({"error": "meal_type 이 올바르지 않습니다."}, status=400)
+        label_ko = (data.get("label_ko") or "").strip() or cached.get("label_ko")
+        try:
+            servings = float(data.get("servings") or 1)
+        except (TypeError, ValueError):
+            servings = 0
+        if not 0 < servings <= 10:
+            return Response({"error": "servings 는 0보다 크고 10 이하여야 합니다."}, status=400)
+
+        done = preview_tokens.claim(nonce)
+        if done == preview_tokens.IN_PROGRESS:
+            return Response({"error": "이미 저장 중입니다. 잠시 후 다시 확인해 주세요."}, status=409)
+        if done is not None:
+            return self._duplicate_commit_response(request, done, cached)
+
+        macros = cached.get("macros") or {}
+        response = self._write_meal_item(
+            request,
+            meal_type=meal_type,
+            food_id=cached.get("food_id"),
+            name=label_ko,
+            macros={k: float(macros.get(k, 0) or 0) * servings for k in ("calories", "protein", "carb", "fat")},
+            source=cached.get("source") or "csv",
+            photo_name=_linkable_photo_name(cached.get("photo_name")),
+        )
+        if response.data.get("saved"):
+            preview_tokens.finish(nonce, response.data["meal_item_id"])
+        else:
+            preview_tokens.release(nonce)
+        return response
+
+    def _duplicate_commit_response(self, request, meal_item_id, cached):
+        item = (
+            MealItem.objects.select_related("meal")
+            .filter(pk=meal_item_id, meal__user=request.user)
+            .first()
+        )
+        log = item and NutritionLog.objects.filter(user=request.user, date=item.meal.log_date).first()
+        return Response(
+            {
+                "ok": True,
+                "saved": True,
+                "duplicate": True,
+                "source": cached.get("source"),
+                "meal_item_id": meal_item_id,
+                "item": _saved_item_summary(
+                    item.name,
+                    item.meal.meal_type,
+                    {"calories": item.kcal, "protein": item.protein_g, "carb": item.carb_g, "fat": item.fat_g},
+                ) if item else None,
+                "updated_consumed": _consumed_summary(log),
+                "photo_url": cached_photo_url(item.photo.name if item and item.photo else None),
+            },
+            status=200,
+        )
+
+    def _write_meal_item(self, request, *, meal_type, food_id, name, macros, source, photo_name):
         try:
             with transaction.atomic():
                 today = date.today()
@@ -980,21 +1119,16 @@ class AIViewSet(viewsets.ViewSet):
                 # ✅ 총합(1회 제공량) 기준으로만 기록
                 meal_item = MealItem.objects.create(
                     meal=meal,
-                    food=food_obj,
-                    name=label_ko,
-                    kcal=kcal,
-                    protein_g=protein,
-                    carb_g=carb,
-                    fat_g=fat,
+                    food_id=food_id,
+                    name=name,
+                    kcal=macros["calories"],
+                    protein_g=macros["protein"],
+                    carb_g=macros["carb"],
+                    fat_g=macros["fat"],
                     source=source,
+                    # ✅ 사진 연결 (선저장 파일을 그대로 참조, 복사 없음)
+                    photo=photo_name,
                 )
-                # ✅ 사진 연결
-                if photo_name:
-                    try:
-                        meal_item.photo.name = photo_name
-                        meal_item.save(update_fields=["photo"])
-                    except Exception:
-                        pass
 
                 log, _ = NutritionLog.objects.get_or_create(
                     user=request.user, date=today
@@ -1004,23 +1138,15 @@ class AIViewSet(viewsets.ViewSet):
                 except Exception:
                     pass
 
-            updated_consumed = {
-                "calories": round(getattr(log, "kcal_total", 0.0) or 0.0, 1),
-                "protein": round(getattr(log, "protein_total_g", 0.0) or 0.0, 1),
-                "carbs": round(getattr(log, "carb_total_g", 0.0) or 0.0, 1),
-                "fat": round(getattr(log, "fat_total_g", 0.0) or 0.0, 1),
-            }
-
             return Response(
                 {
                     "ok": True,
                     "saved": True,
                     "source": source,
                     "meal_item_id": meal_item.id,
-                    "updated_consumed": updated_consumed,
-                    "photo_url": (
-                        default_storage.url(photo_name) if photo_name else None
-                    ),
+                    "item": _saved_item_summary(name, meal_type, macros),
+                    "updated_consumed": _consumed_summary(log),
+                    "photo_url": cached_photo_url(photo_name),
                 },
                 status=200,
             )
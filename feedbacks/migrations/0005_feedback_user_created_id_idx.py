@@ -0,0 +1,28 @@
+# Generated by Django 5.2.7 on 2026-10-18 21:04
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        (
+            "feedbacks",
+            "0004_alter_achievement_options_alter_dailyreport_options_and_more",
+        ),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name="feedback",
+            name="fb_user_created_idx",
+        ),
+        migrations.AddIndex(
+            model_name="feedback",
+            index=models.Index(
+                fields=["user", "created_at", "id"], name="fb_user_created_id_idx"
+            ),
+        ),
+    ]
@@ -72,7 +72,8 @@ class Feedback(models.Model):
             ),
         ]
         indexes = [
-            models.Index(fields=("user", "created_at"), name="fb_user_created_idx"),
+            # 목록 커서 페이지네이션 (user, created_at, id) — 기존 (user, created_at) 대체
+            models.Index(fields=("user", "created_at", "id"), name="fb_user_created_id_idx"),
             models.Index(fields=("daily_report",), name="fb_daily_report_idx"),
         ]
 
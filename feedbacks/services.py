@@ -14,13 +14,16 @@ except Exception:
 
 def compute_day_totals(user, d: date):
     """대시보드용: 하루 합계(운동/식단/목표). 필요에 맞게 확장."""
-    workout_minutes = 0
+    workout_minutes = workout_kcal = 0
     if HAS_WORKOUT_LOG:
-        workout_minutes = (
-            WorkoutLog.objects.filter(user=user, date=d).aggregate(Sum("duration_min"))["duration_min__sum"] or 0
+        # 분/kcal 같은 WorkoutLog 행에서 (kcal 은 완료 동기화 시 calories.kcal_per_min 규칙으로 기록)
+        agg = WorkoutLog.objects.filter(user=user, date=d).aggregate(
+            minutes=Sum("duration_min"), kcal=Sum("kcal_burned")
         )
+        workout_minutes, workout_kcal = agg["minutes"] or 0, agg["kcal"] or 0
     return {
         "workout_minutes": int(workout_minutes),
+        "workout_kcal": int(workout_kcal),
         "meals": {"calories": 0, "protein": 0, "carbs": 0, "fat": 0},  # TODO: 영양앱 연동 시 교체
         "goals": {"completed": 0, "total": 0},                          # TODO: goals 앱 연동 시 교체
     }
@@ -7,6 +7,8 @@ from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.exceptions import PermissionDenied, NotFound
 
+from utils.pagination import KeysetPagination
+
 from .models import Feedback, DailyReport, Achievement
 from .serializers import FeedbackSerializer, DailyReportSerializer, AchievementSerializer
 
@@ -23,6 +25,7 @@ class FeedbackViewSet(viewsets.ModelViewSet):
     queryset = Feedback.objects.all()
     serializer_class = FeedbackSerializer
     permission_classes = [permissions.IsAuthenticated]
+    pagination_class = KeysetPagination
 
     def get_queryset(self):
         qs = Feedback.objects.filter(user=self.request.user).order_by("-created_at", "-id")
@@ -1,8 +1,21 @@
 from django.contrib import admin
-from .models import Food,Meal,MealItem
+from .models import Food,Meal,MealItem,PendingUpload,PhotoBlob
 
 # Register your models here.
 admin.site.register(Food)
 admin.site.register(Meal)
 admin.site.register(MealItem)
 
+
+@admin.register(PhotoBlob)
+class PhotoBlobAdmin(admin.ModelAdmin):
+    list_display = ("name", "size", "ref_count", "last_uploaded_at")
+    readonly_fields = ("sha256", "name", "size", "ref_count", "created_at", "last_uploaded_at")
+    search_fields = ("sha256", "name")
+
+
+
+@admin.register(PendingUpload)
+class PendingUploadAdmin(admin.ModelAdmin):
+    list_display = ("name", "size", "user", "created_at")
+    list_filter = ("created_at",)
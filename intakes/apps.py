@@ -9,3 +9,4 @@ class IntakesConfig(AppConfig):
         # ⚠️ import 시점에 signals 등록
         #    (함수 호출 아님, 모듈 임포트만으로 데코레이터가 연결됨)
         import intakes.signals  # noqa: F401
+        import intakes.photo_store  # noqa: F401  (사진 블롭 참조 수 시그널)
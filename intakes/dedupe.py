@@ -0,0 +1,58 @@
+"""
+intakes/dedupe.py
+
+(user, log_date, meal_type) 중복 Meal 병합.
+
+- 그룹마다 가장 작은 id 를 남기고, 나머지 Meal 의 MealItem 을 옮긴 뒤 빈 Meal 삭제
+- MealItem 은 update() 로 meal_id 만 바꾼다 → 같은 사용자/날짜 안의 이동이므로 NutritionLog 합계는 그대로
+  (update() 는 시그널이 없으므로 by-date ETag 버전은 직접 올림)
+- 관리 명령(manage.py dedupe_meals)용. 마이그레이션 0004 는 같은 병합을 과거 모델로 자체 구현(앱 코드 변경에 영향받지 않도록)
+"""
+from django.db import transaction
+from django.db.models import Count, Min
+
+from .etags import bump_day_version
+
+
+def duplicate_meal_groups(meal_model, user_ids=None):
+    qs = meal_model.objects.all()
+    if user_ids is not None:
+        qs = qs.filter(user_id__in=user_ids)
+    return (
+        qs.values("user_id", "log_date", "meal_type")
+        .annotate(n=Count("id"), keep_id=Min("id"))
+        .filter(n__gt=1)
+        .order_by("user_id", "log_date", "meal_type")
+    )
+
+
+def merge_duplicate_meals(meal_model, item_model, *, user_ids=None, dry_run=False, log=None):
+    """중복 그룹을 하나씩 병합. 반환: {"groups", "meals_deleted", "items_moved"}"""
+    stats = {"groups": 0, "meals_deleted": 0, "items_moved": 0}
+    for group in duplicate_meal_groups(meal_model, user_ids).iterator():
+        keep_id = group["keep_id"]
+        with transaction.atomic():
+            extra_ids = list(
+                meal_model.objects.filter(
+                    user_id=group["user_id"], log_date=group["log_date"], meal_type=group["meal_type"],
+                )
+                .exclude(id=keep_id)
+                .select_for_update()
+                .values_list("id", flat=True)
+            )
+            items = item_model.objects.filter(meal_id__in=extra_ids)
+            if dry_run:
+                moved = items.count()
+            else:
+                moved = items.update(meal_id=keep_id)
+                meal_model.objects.filter(id__in=extra_ids).delete()
+                bump_day_version(group["user_id"], group["log_date"])
+        stats["groups"] += 1
+        stats["meals_deleted"] += len(extra_ids)
+        stats["items_moved"] += moved
+        if log:
+            log(
+                f"user={group['user_id']} {group['log_date']} {group['meal_type']}: "
+                f"keep Meal#{keep_id}, merge {extra_ids} (items {moved})"
+            )
+    return stats
@@ -0,0 +1,86 @@
+"""
+intakes/etags.py
+
+하루 단위(user, date) 데이터 버전 + 조건부 GET(ETag/304) 헬퍼.
+
+핵심 아이디어
+- Meal / MealItem / NutritionLog 가 저장/삭제될 때마다 (user, date) 버전을 캐시에서 증가(signals.py)
+  (커밋 후에 증가 → 커밋 전 데이터가 새 버전 ETag 로 응답되는 일 없음)
+- by-date 조회는 DB보다 먼저 버전을 읽어 ETag 로 사용 → If-None-Match 일치 시 바로 304
+- 버전 키가 캐시에서 사라지면 time_ns() 로 새로 시작 → 이전 ETag 와 절대 겹치지 않음
+- 프로세스 간 공유 캐시(Redis)에서만 안전하므로 settings.DAY_ETAG_ENABLED 로 켜고 끔
+"""
+import time
+from datetime import date as _date
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from prometheus_client import Counter
+
+DAY_VERSION_TIMEOUT = 60 * 60 * 24 * 7
+
+CONDITIONAL_GET = Counter(
+    "intakes_conditional_get_total",
+    "by-date 조건부 GET 결과 (304 비율 = not_modified / 전체)",
+    ["endpoint", "result"],  # result: not_modified | ok
+)
+
+
+def _key(user_id, d):
+    return f"intakes:dayver:{user_id}:{d}"
+
+
+def _as_date(d):
+    if isinstance(d, _date):
+        return d.isoformat()
+    try:
+        return _date.fromisoformat(str(d)).isoformat()
+    except ValueError:
+        return None
+
+
+def etag_enabled():
+    return getattr(settings, "DAY_ETAG_ENABLED", False)
+
+
+def bump_day_version(user_id, d):
+    d = _as_date(d)
+    if not (etag_enabled() and user_id and d):
+        return
+    key = _key(user_id, d)
+
+    def _incr():
+        try:
+            cache.incr(key)
+        except ValueError:
+            # 키 없음(만료/축출) → 겹치지 않는 새 시작값
+            cache.set(key, time.time_ns(), DAY_VERSION_TIMEOUT)
+
+    transaction.on_commit(_incr)
+
+
+def get_day_version(user_id, d):
+    key = _key(user_id, d)
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, time.time_ns(), DAY_VERSION_TIMEOUT)
+        version = cache.get(key)
+    return version
+
+
+def day_etag(user_id, d, kind):
+    """kind: 같은 날짜라도 응답 형태가 다른 엔드포인트 구분용 ('meals' / 'nutrition')."""
+    d = _as_date(d)
+    if not (etag_enabled() and d):
+        return None
+    return f'W/"{kind}-{d}-{get_day_version(user_id, d)}"'
+
+
+def if_none_match(request, etag):
+    header = request.META.get("HTTP_IF_NONE_MATCH", "")
+    return bool(etag) and (header.strip() == "*" or etag in [t.strip() for t in header.split(",")])
+
+
+def record_conditional_get(endpoint, not_modified):
+    CONDITIONAL_GET.labels(endpoint=endpoint, result="not_modified" if not_modified else "ok").inc()
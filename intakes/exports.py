@@ -0,0 +1,118 @@
+"""
+intakes/exports.py
+
+식사 기록(MealItem) 전체 내보내기용 스트리밍 헬퍼.
+
+핵심 아이디어
+- 모든 행을 메모리에 올리지 않는다: QuerySet.iterator(chunk_size=...)로 끊어서 읽음
+- Meal/Food는 select_related로 한 번에 조인 → 행마다 추가 쿼리 없음
+- 중첩(items) 없이 '한 줄 = 한 MealItem' 평평한(flat) 행으로 내보냄
+- NDJSON / CSV 두 가지 포맷 지원 (StreamingHttpResponse 와 함께 사용)
+"""
+import csv
+import json
+
+from rest_framework.renderers import BaseRenderer
+
+from .models import MealItem
+
+EXPORT_CHUNK_SIZE = 2000
+
+EXPORT_FIELDS = [
+    "meal_id",
+    "log_date",
+    "meal_type",
+    "item_id",
+    "food_id",
+    "food_name",
+    "name",
+    "grams",
+    "kcal",
+    "protein_g",
+    "carb_g",
+    "fat_g",
+    "source",
+    "created_at",
+]
+
+
+# ---------------------------
+# DRF ?format= 오버라이드 대응용 렌더러
+# - 실제 본문은 StreamingHttpResponse가 직접 만들지만,
+#   DRF 콘텐츠 협상이 format=ndjson|csv 를 404로 막지 않도록 등록만 해 둔다.
+# ---------------------------
+class NDJSONRenderer(BaseRenderer):
+    media_type = "application/x-ndjson"
+    format = "ndjson"
+    charset = "utf-8"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        return json.dumps(data, ensure_ascii=False).encode("utf-8")
+
+
+class CSVRenderer(BaseRenderer):
+    media_type = "text/csv"
+    format = "csv"
+    charset = "utf-8"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        return json.dumps(data, ensure_ascii=False).encode("utf-8")
+
+
+def export_queryset(user, start=None, end=None):
+    """사용자의 MealItem을 날짜/ID 순으로 조회 (Meal/Food 조인 포함)."""
+    qs = MealItem.objects.filter(meal__user=user).select_related("meal", "food")
+    if start:
+        qs = qs.filter(meal__log_date__gte=start)
+    if end:
+        qs = qs.filter(meal__log_date__lte=end)
+    return qs.order_by("meal__log_date", "meal_id", "id")
+
+
+def _round2(v):
+    return round(float(v), 2) if v is not None else None
+
+
+def iter_export_rows(qs, chunk_size=EXPORT_CHUNK_SIZE):
+    """
+    QuerySet → dict 행 제너레이터.
+    iterator()는 prefetch 캐시를 만들지 않으므로 메모리는 chunk_size에만 비례한다.
+    """
+    for item in qs.iterator(chunk_size=chunk_size):
+        n = item.resolved_nutrients()
+        yield {
+            "meal_id": item.meal_id,
+            "log_date": item.meal.log_date.isoformat(),
+            "meal_type": item.meal.meal_type,
+            "item_id": item.id,
+            "food_id": item.food_id,
+            "food_name": item.food.name if item.food_id else None,
+            "name": item.name,
+            "grams": item.grams,
+            "kcal": _round2(n["kcal"]),
+            "protein_g": _round2(n["protein_g"]),
+            "carb_g": _round2(n["carb_g"]),
+            "fat_g": _round2(n["fat_g"]),
+            "source": item.source,
+            "created_at": item.created_at.isoformat() if item.created_at else None,
+        }
+
+
+def stream_ndjson(rows):
+    for row in rows:
+        yield json.dumps(row, ensure_ascii=False) + "\n"
+
+
+class _Echo:
+    """csv.writer가 write()한 값을 그대로 돌려주는 의사 버퍼 (Django 문서 패턴)."""
+
+    def write(self, value):
+        return value
+
+
+def stream_csv(rows):
+    writer = csv.writer(_Echo())
+    # 엑셀 한글 깨짐 방지용 BOM
+    yield "\ufeff" + writer.writerow(EXPORT_FIELDS)
+    for row in rows:
+        yield writer.writerow(["" if row[f] is None else row[f] for f in EXPORT_FIELDS])
@@ -0,0 +1,157 @@
+"""
+intakes/food_search.py
+
+음식 이름 자동완성 검색 (GET /api/foods/search/?q=).
+
+- PostgreSQL: pg_trgm GIN 인덱스(food_name_trgm_idx, 마이그레이션 0010)로 부분일치 + 유사도 후보를 찾고
+  정확 일치 > 접두사 일치 > 유사도 > 짧은 이름 순 정렬, 최대 FOOD_SEARCH_MAX_LIMIT 개
+- 그 외(SQLite 로컬): 프로세스 메모리 접두사 색인(PrefixIndex)
+  이름 전체와 각 단어 시작 위치를 키로 정렬해 두고 이분 탐색 → DB 는 결과 id 조회 1회
+  이름 전체 접두사 일치는 모두 모아 순위를 매기고, 단어 중간 일치는 그걸로 limit 이 안 찰 때만
+  PREFIX_SCAN_CAP 개까지 훑어 채운다 (이 단계만 사전순 앞쪽 후보 기준의 근사 순위)
+  Food 저장/삭제 시 카탈로그 버전(캐시)이 올라가면 다음 검색에서 다시 만든다
+"""
+import heapq
+import re
+import threading
+import time
+import unicodedata
+from bisect import bisect_left
+
+from django.core.cache import cache
+from django.db import connection, transaction
+from django.db.models import Case, IntegerField, Q, Value, When
+from django.db.models.functions import Length
+
+from .models import Food
+
+CATALOG_VERSION_KEY = "intakes:foodcatalog:ver"
+# 단어 중간 일치 후보를 훑을 최대 키 수 (이름 전체 접두사 일치는 제한 없이 모두 순위 계산)
+PREFIX_SCAN_CAP = 5000
+# 접두사 q 로 시작하는 키의 끝 = bisect_left(keys, q + _MAX_CHAR)
+_MAX_CHAR = "\U0010ffff"
+
+_WORD_BREAK = re.compile(r"[\s(),/\[\]_\-·]+")
+
+
+def normalize(text):
+    text = unicodedata.normalize("NFKC", text or "").lower()
+    return re.sub(r"\s+", " ", text).strip()
+
+
+# ─────────────────────────  카탈로그 버전  ─────────────────────────
+def catalog_version():
+    version = cache.get(CATALOG_VERSION_KEY)
+    if version is None:
+        cache.add(CATALOG_VERSION_KEY, time.time_ns(), None)
+        version = cache.get(CATALOG_VERSION_KEY)
+    return version
+
+
+def bump_catalog_version():
+    def _incr():
+        try:
+            cache.incr(CATALOG_VERSION_KEY)
+        except ValueError:
+            cache.set(CATALOG_VERSION_KEY, time.time_ns(), None)
+
+    transaction.on_commit(_incr)
+
+
+# ─────────────────────────  접두사 색인 (SQLite 등)  ─────────────────────────
+class PrefixIndex:
+    """
+    트라이를 정렬 배열로 펼친 형태: keys[i] 는 (정규화 이름의 단어 시작 위치부터 끝까지) 문자열.
+    접두사 q 로 시작하는 키는 bisect 위치부터 연속 → 노드 객체 없이 메모리/구축 시간이 작다.
+    이름 전체만 담은 배열(full_keys)을 따로 두어 상위 순위 후보는 구간 슬라이스로 빠짐없이 꺼낸다.
+    """
+
+    def __init__(self, rows):
+        pairs, full = [], []
+        self.names = {}
+        for food_id, name in rows:
+            norm = normalize(name)
+            self.names[food_id] = norm
+            if norm:
+                full.append((norm, food_id))
+            starts = {m.end() for m in _WORD_BREAK.finditer(norm)}
+            pairs.extend((norm[s:], food_id) for s in starts if 0 < s < len(norm))
+        pairs.sort()
+        full.sort()
+        self.keys = [k for k, _ in pairs]
+        self.ids = [i for _, i in pairs]
+        self.full_keys = [k for k, _ in full]
+        self.full_ids = [i for _, i in full]
+
+    def __len__(self):
+        return len(self.names)
+
+    def search(self, q, limit):
+        q = normalize(q)
+        if not q:
+            return []
+
+        def rank(food_id):
+            name = self.names[food_id]
+            return (name != q, not name.startswith(q), len(name), name)
+
+        # 1) 이름 전체 접두사 일치: 구간 전체를 모아 정확한 상위 limit 개
+        lo = bisect_left(self.full_keys, q)
+        hi = bisect_left(self.full_keys, q + _MAX_CHAR, lo)
+        found = set(self.full_ids[lo:hi])
+        ranked = heapq.nsmallest(limit, found, key=rank)
+        if len(ranked) >= limit:
+            return ranked
+
+        # 2) 단어 중간 일치로 나머지 채우기 (후보 수 상한)
+        lo = bisect_left(self.keys, q)
+        hi = min(bisect_left(self.keys, q + _MAX_CHAR, lo), lo + PREFIX_SCAN_CAP)
+        rest = set(self.ids[lo:hi]) - found
+        return ranked + heapq.nsmallest(limit - len(ranked), rest, key=rank)
+
+
+_index = None
+_index_version = None
+_index_lock = threading.Lock()
+
+
+def get_prefix_index():
+    global _index, _index_version
+    version = catalog_version()
+    if _index is None or _index_version != version:
+        with _index_lock:
+            if _index is None or _index_version != version:
+                _index = PrefixIndex(Food.objects.values_list("id", "name").iterator(chunk_size=5000))
+                _index_version = version
+    return _index
+
+
+# ─────────────────────────  검색  ─────────────────────────
+def _search_postgres(q, limit):
+    from django.contrib.postgres.search import TrigramSimilarity
+
+    return list(
+        Food.objects.filter(Q(name__trigram_similar=q) | Q(name__icontains=q))
+        .annotate(
+            similarity=TrigramSimilarity("name", q),
+            boost=Case(
+                When(name__iexact=q, then=Value(2)),
+                When(name__istartswith=q, then=Value(1)),
+                default=Value(0),
+                output_field=IntegerField(),
+            ),
+        )
+        .order_by("-boost", "-similarity", Length("name"), "name")[:limit]
+    )
+
+
+def search_foods(q, limit):
+    """q 에 맞는 Food 목록 (순위 순, 최대 limit 개)."""
+    q = (q or "").strip()
+    if not q or limit <= 0:
+        return []
+    if connection.vendor == "postgresql":
+        return _search_postgres(q, limit)
+    ids = get_prefix_index().search(q, limit)
+    foods = Food.objects.in_bulk(ids)
+    return [foods[i] for i in ids if i in foods]
@@ -0,0 +1,69 @@
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+
+from intakes.models import MealItem
+from intakes.thumbnails import generate_thumbnails, mark_ready
+
+
+def _generate(args):
+    """프로세스 풀 워커: 스토리지만 사용 (DB 갱신은 메인 프로세스에서)."""
+    name, overwrite = args
+    try:
+        return name, len(generate_thumbnails(name, overwrite=overwrite)), None
+    except Exception as e:
+        return name, 0, f"{type(e).__name__}: {e}"
+
+
+class Command(BaseCommand):
+    help = "기존 MealItem 사진의 WebP 썸네일(128/384/1024)을 프로세스 풀로 일괄 생성"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--workers", type=int, default=4, help="프로세스 수 (기본 4)")
+        parser.add_argument("--batch-size", type=int, default=200, help="한 번에 처리할 사진 수 (기본 200)")
+        parser.add_argument("--limit", type=int, default=None, help="최대 처리 사진 수")
+        parser.add_argument("--overwrite", action="store_true", help="이미 있는 썸네일도 다시 생성 (thumbs_ready 무시)")
+
+    def _pending_names(self, overwrite):
+        qs = MealItem.objects.exclude(photo__isnull=True).exclude(photo="")
+        if not overwrite:
+            qs = qs.filter(thumbs_ready=False)
+        return qs.order_by("photo").values_list("photo", flat=True).distinct()
+
+    def handle(self, *args, **opt):
+        if opt["workers"] <= 0 or opt["batch_size"] <= 0:
+            raise CommandError("--workers / --batch-size 는 양수여야 합니다.")
+        names = list(self._pending_names(opt["overwrite"]))
+        if opt["limit"]:
+            names = names[: opt["limit"]]
+        self.stdout.write(f"대상 사진: {len(names)}장, workers={opt['workers']}")
+        if not names:
+            return
+
+        started = time.perf_counter()
+        done = thumbs = failed = 0
+        connections.close_all()  # fork 전에 부모 커넥션 정리
+        ctx = multiprocessing.get_context("fork")
+        with ProcessPoolExecutor(max_workers=opt["workers"], mp_context=ctx) as pool:
+            for off in range(0, len(names), opt["batch_size"]):
+                batch = names[off: off + opt["batch_size"]]
+                ok = []
+                for name, created, error in pool.map(_generate, [(n, opt["overwrite"]) for n in batch]):
+                    if error:
+                        failed += 1
+                        self.stderr.write(f"실패: {name} ({error})")
+                    else:
+                        ok.append(name)
+                        thumbs += created
+                mark_ready(ok)
+                done += len(batch)
+                rate = done / (time.perf_counter() - started)
+                self.stdout.write(f"... {done}/{len(names)} ({rate:.1f}장/s)")
+
+        self.stdout.write(self.style.SUCCESS(
+            f"완료: 사진 {done - failed}장, 썸네일 {thumbs}개 생성, 실패 {failed}장 "
+            f"({time.perf_counter() - started:.1f}s)"
+        ))
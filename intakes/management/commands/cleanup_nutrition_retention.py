@@ -1,67 +1,179 @@
+import json
+import time
 from datetime import timedelta
+from pathlib import Path
+
 from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
 from django.utils import timezone
-from django.db import transaction
-from django.db.models.signals import post_save, post_delete
 
-from intakes.models import Meal, MealItem, NutritionLog, update_nutrition_log
+from intakes.etags import bump_day_version, etag_enabled
+from intakes.models import Meal, MealItem, NutritionLog
+from intakes.photo_store import BLOB_PREFIX, delete_blobs, delete_files, release_photos
+from intakes.thumbnails import thumb_names
 from users.models import CustomUser
 
+
+def _raw_delete_ids(model, ids):
+    """
+    DELETE ... WHERE id IN (...) 직접 실행.
+    Django 삭제 수집기(Collector)를 거치지 않으므로 객체/캐스케이드를 메모리에 올리지 않고
+    시그널도 발생하지 않는다. FK 순서(자식 → 부모)는 호출 측에서 보장.
+    """
+    if not ids:
+        return 0
+    table = connection.ops.quote_name(model._meta.db_table)
+    placeholders = ", ".join(["%s"] * len(ids))
+    with connection.cursor() as cursor:
+        cursor.execute(f"DELETE FROM {table} WHERE id IN ({placeholders})", list(ids))
+        return cursor.rowcount
+
+
 class Command(BaseCommand):
-    help = "Nutrition 데이터 보존정책: 최근 N일만 남기고 과거 데이터 삭제"
+    help = "Nutrition 데이터 보존정책: 최근 N일만 남기고 과거 데이터를 PK 구간 단위로 나눠 삭제"
 
     def add_arguments(self, parser):
         parser.add_argument("--days", type=int, default=60, help="최근 며칠을 보존할지 (기본 60)")
         parser.add_argument("--only-user", type=str, default=None, help="특정 사용자만")
         parser.add_argument("--dry-run", action="store_true", help="건수만 출력(삭제 안 함)")
+        parser.add_argument("--chunk-size", type=int, default=1000, help="한 번에 삭제할 부모 행 수 (기본 1000)")
+        parser.add_argument("--sleep", type=float, default=0.0, help="청크 사이 대기(초), 락/복제 지연 완화용")
+        parser.add_argument(
+            "--state-file",
+            type=str,
+            default=None,
+            help="진행 위치(마지막 PK)를 기록할 JSON 파일. 중단 후 재실행 시 이어서 진행",
+        )
+        parser.add_argument("--keep-photos", action="store_true", help="삭제된 MealItem의 사진 파일은 남김")
+
+    # ---------------- 상태 파일(재개 지점) ---------------- #
+    def _load_state(self, path, key):
+        if not path or not path.exists():
+            return {}
+        try:
+            state = json.loads(path.read_text(encoding="utf-8"))
+        except Exception:
+            return {}
+        # 기준(cutoff/user)이 다르면 이전 진행 위치는 무효
+        return state if state.get("key") == key else {}
+
+    def _save_state(self, path, state):
+        if path:
+            path.write_text(json.dumps(state), encoding="utf-8")
+
+    # ---------------- by-date ETag 무효화 ---------------- #
+    def _affected_days(self, qs, date_field):
+        """raw DELETE는 시그널이 없으므로 지워질 (user, date)를 미리 모아 삭제 후 버전을 올림."""
+        if not etag_enabled():
+            return []
+        return list(qs.values_list("user_id", date_field).distinct())
+
+    def _bump_days(self, days):
+        for user_id, d in days:
+            bump_day_version(user_id, d)
+
+    # ---------------- 사진 정리 ---------------- #
+    def _delete_photos(self, names, orphaned_blobs):
+        """
+        삭제된 항목의 사진(+썸네일) 정리.
+        - 내용 해시 블롭: 참조 수가 0이 된 것만 (photo_store.delete_blobs)
+        - 예전 uuid 경로: 다른 MealItem이 더 이상 참조하지 않는 파일만
+        """
+        blob_removed, _ = delete_blobs(orphaned_blobs)
+        names = {n for n in names if n and not n.startswith(BLOB_PREFIX + "/")}
+        if not names:
+            return blob_removed
+        still_used = set(MealItem.objects.filter(photo__in=names).values_list("photo", flat=True))
+        targets = names - still_used
+        failed = delete_files(f for n in targets for f in (n, *thumb_names(n)))
+        return blob_removed + len(targets - failed)
 
     def handle(self, *args, **opt):
         days = opt["days"]
         if days <= 0:
             raise CommandError("--days 는 양수여야 합니다.")
+        chunk_size = opt["chunk_size"]
+        if chunk_size <= 0:
+            raise CommandError("--chunk-size 는 양수여야 합니다.")
         cutoff = timezone.now().date() - timedelta(days=days)
         self.stdout.write(self.style.NOTICE(f"보존 기준(포함 X): {cutoff} 이전 데이터 삭제"))
 
         meals_qs = Meal.objects.filter(log_date__lt=cutoff)
-        items_qs = MealItem.objects.filter(meal__log_date__lt=cutoff)
         logs_qs = NutritionLog.objects.filter(date__lt=cutoff)
 
         if opt["only_user"]:
-            users = CustomUser.objects.filter(username=opt["only-user"])
+            users = CustomUser.objects.filter(username=opt["only_user"])
             if not users.exists():
-                raise CommandError(f"username={opt['only-user']} 없음")
+                raise CommandError(f"username={opt['only_user']} 없음")
             meals_qs = meals_qs.filter(user__in=users)
-            items_qs = items_qs.filter(meal__user__in=users)
             logs_qs = logs_qs.filter(user__in=users)
 
-        meals_cnt = meals_qs.count()
-        items_cnt = items_qs.count()
-        logs_cnt  = logs_qs.count()
-        self.stdout.write(f"[대상] MealItem={items_cnt}, Meal={meals_cnt}, NutritionLog={logs_cnt}")
-
         if opt["dry_run"]:
+            meals_cnt = meals_qs.count()
+            items_cnt = MealItem.objects.filter(meal__in=meals_qs).count()
+            logs_cnt = logs_qs.count()
+            self.stdout.write(f"[대상] MealItem={items_cnt}, Meal={meals_cnt}, NutritionLog={logs_cnt}")
             self.stdout.write(self.style.WARNING("DRY-RUN: 삭제하지 않았습니다."))
             return
 
-        # 대량 삭제 시 성능 위해 시그널 잠시 해제
-        post_save.disconnect(update_nutrition_log, sender=MealItem)
-        post_delete.disconnect(update_nutrition_log, sender=MealItem)
-        post_save.disconnect(update_nutrition_log, sender=Meal)
-        post_delete.disconnect(update_nutrition_log, sender=Meal)
+        state_path = Path(opt["state_file"]) if opt["state_file"] else None
+        state_key = f"{cutoff.isoformat()}:{opt['only_user'] or '*'}"
+        state = self._load_state(state_path, state_key)
+        last_meal_id = int(state.get("meal_id") or 0)
+        last_log_id = int(state.get("log_id") or 0)
+        if last_meal_id or last_log_id:
+            self.stdout.write(f"이어서 진행: Meal.id > {last_meal_id}, NutritionLog.id > {last_log_id}")
 
-        try:
+        sleep = max(opt["sleep"], 0.0)
+        keep_photos = opt["keep_photos"]
+        items_deleted = meals_deleted = logs_deleted = photos_deleted = 0
+
+        # 1) Meal 구간: MealItem(자식) → Meal(부모) 순서로 청크 삭제
+        while True:
+            ids = list(
+                meals_qs.filter(id__gt=last_meal_id).order_by("id").values_list("id", flat=True)[:chunk_size]
+            )
+            if not ids:
+                break
+            touched = self._affected_days(Meal.objects.filter(id__in=ids), "log_date")
             with transaction.atomic():
-                logs_deleted  = logs_qs.delete()[0]
-                items_deleted = items_qs.delete()[0]
-                meals_deleted = meals_qs.delete()[0]
-        finally:
-            # 시그널 복구
-            post_save.connect(update_nutrition_log, sender=MealItem)
-            post_delete.connect(update_nutrition_log, sender=MealItem)
-            post_save.connect(update_nutrition_log, sender=Meal)
-            post_delete.connect(update_nutrition_log, sender=Meal)
+                items = list(MealItem.objects.filter(meal_id__in=ids).values_list("id", "photo"))
+                items_deleted += _raw_delete_ids(MealItem, [i for i, _ in items])
+                meals_deleted += _raw_delete_ids(Meal, ids)
+                # raw DELETE는 시그널이 없으므로 블롭 참조 수를 직접 반환
+                orphaned = release_photos(p for _, p in items)
+            self._bump_days(touched)
+            if not keep_photos:
+                photos_deleted += self._delete_photos([p for _, p in items], orphaned)
+
+            last_meal_id = ids[-1]
+            self._save_state(state_path, {"key": state_key, "meal_id": last_meal_id, "log_id": last_log_id})
+            self.stdout.write(f"... Meal.id ≤ {last_meal_id}: MealItem={items_deleted}, Meal={meals_deleted}")
+            if sleep:
+                time.sleep(sleep)
+
+        # 2) NutritionLog 구간 (의존 테이블 없음)
+        while True:
+            ids = list(
+                logs_qs.filter(id__gt=last_log_id).order_by("id").values_list("id", flat=True)[:chunk_size]
+            )
+            if not ids:
+                break
+            touched = self._affected_days(NutritionLog.objects.filter(id__in=ids), "date")
+            with transaction.atomic():
+                logs_deleted += _raw_delete_ids(NutritionLog, ids)
+            self._bump_days(touched)
+            last_log_id = ids[-1]
+            self._save_state(state_path, {"key": state_key, "meal_id": last_meal_id, "log_id": last_log_id})
+            self.stdout.write(f"... NutritionLog.id ≤ {last_log_id}: NutritionLog={logs_deleted}")
+            if sleep:
+                time.sleep(sleep)
+
+        # 완료 시 재개 지점 제거
+        if state_path and state_path.exists():
+            state_path.unlink()
 
         self.stdout.write(self.style.SUCCESS(
-            f"삭제 완료: NutritionLog={logs_deleted}, MealItem={items_deleted}, Meal={meals_deleted} "
-            f"(최근 {days}일 보존)"
+            f"삭제 완료: NutritionLog={logs_deleted}, MealItem={items_deleted}, Meal={meals_deleted}, "
+            f"사진={photos_deleted} (최근 {days}일 보존)"
         ))
@@ -0,0 +1,36 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from intakes.dedupe import merge_duplicate_meals
+from intakes.models import Meal, MealItem
+from users.models import CustomUser
+
+
+class Command(BaseCommand):
+    help = "(user, log_date, meal_type) 중복 Meal을 가장 오래된 것 하나로 병합 (MealItem 이동 후 빈 Meal 삭제)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--only-user", type=str, default=None, help="특정 사용자만")
+        parser.add_argument("--dry-run", action="store_true", help="대상만 출력(변경 안 함)")
+        parser.add_argument("--verbose-groups", action="store_true", help="그룹별 병합 내역 출력")
+
+    def handle(self, *args, **opt):
+        user_ids = None
+        if opt["only_user"]:
+            user_ids = list(CustomUser.objects.filter(username=opt["only_user"]).values_list("id", flat=True))
+            if not user_ids:
+                raise CommandError(f"username={opt['only_user']} 없음")
+
+        stats = merge_duplicate_meals(
+            Meal,
+            MealItem,
+            user_ids=user_ids,
+            dry_run=opt["dry_run"],
+            log=self.stdout.write if opt["verbose_groups"] else None,
+        )
+        self.stdout.write(
+            f"[중복 그룹] {stats['groups']}개, 삭제 Meal={stats['meals_deleted']}, 이동 MealItem={stats['items_moved']}"
+        )
+        if opt["dry_run"]:
+            self.stdout.write(self.style.WARNING("DRY-RUN: 변경하지 않았습니다."))
+        else:
+            self.stdout.write(self.style.SUCCESS("병합 완료!"))
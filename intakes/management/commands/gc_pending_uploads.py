@@ -0,0 +1,67 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from intakes.models import MealItem, PendingUpload
+from intakes.photo_store import BLOB_PREFIX, delete_blobs, delete_files
+
+
+class Command(BaseCommand):
+    help = "커밋되지 않은 선저장 업로드(PendingUpload) 중 TTL이 지난 파일을 일괄 삭제하고 회수 용량 출력"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--ttl-hours", type=int, default=24, help="업로드 후 이 시간이 지나면 삭제 (기본 24)")
+        parser.add_argument("--batch-size", type=int, default=1000, help="한 번에 처리할 업로드 수 (기본 1000)")
+        parser.add_argument("--dry-run", action="store_true", help="대상 건수/용량만 출력")
+
+    def _collect(self, batch, cutoff):
+        """
+        배치 정리. 반환: (삭제 파일 수, 회수 bytes)
+        - MealItem 이 참조 중이면 파일은 두고 기록만 삭제
+        - 내용 해시 블롭은 delete_blobs (참조 0 + cutoff 이후 재업로드 없음 재확인 + PhotoBlob 행 삭제)
+        - 예전 uuid 경로는 바로 스토리지 일괄 삭제
+        """
+        names = [u.name for u in batch]
+        in_use = set(MealItem.objects.filter(photo__in=names).values_list("photo", flat=True))
+        orphans = [u for u in batch if u.name not in in_use]
+
+        blobs = [u.name for u in orphans if u.name.startswith(BLOB_PREFIX + "/")]
+        deleted, reclaimed = delete_blobs(blobs, cutoff=cutoff)
+
+        legacy = {u.name: u.size for u in orphans if not u.name.startswith(BLOB_PREFIX + "/")}
+        failed = delete_files(legacy)
+        deleted += len(legacy) - len(failed)
+        reclaimed += sum(size for name, size in legacy.items() if name not in failed)
+
+        # 실패한 파일은 기록을 남겨 다음 실행에서 재시도
+        PendingUpload.objects.filter(pk__in=[u.pk for u in batch if u.name not in failed]).delete()
+        return deleted, reclaimed
+
+    def handle(self, *args, **opt):
+        if opt["ttl_hours"] < 0 or opt["batch_size"] <= 0:
+            raise CommandError("--ttl-hours 는 0 이상, --batch-size 는 양수여야 합니다.")
+        cutoff = timezone.now() - timedelta(hours=opt["ttl_hours"])
+        qs = PendingUpload.objects.filter(created_at__lt=cutoff)
+
+        if opt["dry_run"]:
+            rows = list(qs.exclude(name__in=MealItem.objects.values("photo")).values_list("size", flat=True))
+            self.stdout.write(f"[대상] 업로드 {len(rows)}개, {sum(rows)} bytes")
+            self.stdout.write(self.style.WARNING("DRY-RUN: 삭제하지 않았습니다."))
+            return
+
+        deleted = reclaimed = 0
+        last_id = 0
+        while True:
+            batch = list(qs.filter(id__gt=last_id).order_by("id")[: opt["batch_size"]])
+            if not batch:
+                break
+            last_id = batch[-1].id
+            n, size = self._collect(batch, cutoff)
+            deleted += n
+            reclaimed += size
+            self.stdout.write(f"... id ≤ {last_id}: 파일 {deleted}개, {reclaimed} bytes")
+
+        self.stdout.write(self.style.SUCCESS(
+            f"삭제 완료: 파일 {deleted}개, 회수 {reclaimed} bytes ({reclaimed / 1024 / 1024:.1f} MiB)"
+        ))
@@ -0,0 +1,65 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db.models import Count
+from django.utils import timezone
+
+from intakes.models import MealItem, PhotoBlob
+from intakes.photo_store import delete_blobs
+
+
+class Command(BaseCommand):
+    help = "참조 0인 내용 해시 사진(PhotoBlob)과 썸네일을 유예 시간 후 삭제"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--grace-hours", type=int, default=24,
+            help="마지막 업로드 후 이 시간이 지난 블롭만 삭제 (분석 후 커밋 전 사진 보호, 기본 24)",
+        )
+        parser.add_argument("--batch-size", type=int, default=500, help="한 번에 처리할 블롭 수 (기본 500)")
+        parser.add_argument("--dry-run", action="store_true", help="대상 건수/용량만 출력")
+        parser.add_argument("--recount", action="store_true", help="MealItem 기준으로 ref_count 를 다시 계산한 뒤 진행")
+
+    def _recount(self):
+        counts = {
+            row["photo"]: row["n"]
+            for row in MealItem.objects.filter(photo__in=PhotoBlob.objects.values("name"))
+            .values("photo").annotate(n=Count("id"))
+        }
+        fixed = 0
+        for blob in PhotoBlob.objects.only("id", "name", "ref_count").iterator():
+            actual = counts.get(blob.name, 0)
+            if blob.ref_count != actual:
+                PhotoBlob.objects.filter(pk=blob.pk).update(ref_count=actual)
+                fixed += 1
+        self.stdout.write(f"ref_count 보정: {fixed}건")
+
+    def handle(self, *args, **opt):
+        if opt["grace_hours"] < 0 or opt["batch_size"] <= 0:
+            raise CommandError("--grace-hours 는 0 이상, --batch-size 는 양수여야 합니다.")
+        if opt["recount"] and not opt["dry_run"]:
+            self._recount()
+
+        cutoff = timezone.now() - timedelta(hours=opt["grace_hours"])
+        qs = PhotoBlob.objects.filter(ref_count__lte=0, last_uploaded_at__lt=cutoff)
+
+        if opt["dry_run"]:
+            rows = list(qs.values_list("size", flat=True))
+            self.stdout.write(f"[대상] 블롭 {len(rows)}개, {sum(rows)} bytes")
+            self.stdout.write(self.style.WARNING("DRY-RUN: 삭제하지 않았습니다."))
+            return
+
+        deleted = reclaimed = 0
+        last_id = 0
+        while True:
+            batch = list(
+                qs.filter(id__gt=last_id).order_by("id").values_list("id", "name")[: opt["batch_size"]]
+            )
+            if not batch:
+                break
+            last_id = batch[-1][0]
+            n, size = delete_blobs((name for _, name in batch), cutoff=cutoff)
+            deleted += n
+            reclaimed += size
+
+        self.stdout.write(self.style.SUCCESS(f"삭제 완료: 블롭 {deleted}개, 회수 {reclaimed} bytes"))
@@ -1,11 +1,14 @@
 # intakes/management/commands/import_mfds_foods.py
 import csv
+import io
+import time
 from pathlib import Path
 import importlib.resources as pkg_resources
 
 from django.core.management.base import BaseCommand, CommandError
-from django.db import transaction
+from django.db import connection, transaction
 
+from intakes.food_search import bump_catalog_version
 from intakes.models import Food
 
 
@@ -136,8 +139,141 @@ def _detect_dialect(sample: str):
         return _Default
 
 
+NUTRIENT_FIELDS = ("kcal_per_100g", "protein_g_per_100g", "carb_g_per_100g", "fat_g_per_100g")
+
+
+def read_rows(reader, limit=None):
+    """
+    CSV 전체를 읽어 이름별 마지막 행만 남김 (파일 전체 기준 중복 제거).
+    반환: (seen, skipped, {name: data})
+    - 청크마다 따로 중복 제거하면 여러 청크에 걸친 이름이 청크마다 diff/upsert 되어
+      같은 파일을 다시 넣어도 updated 로 잡히고 값이 번갈아 바뀜
+    - 메모리는 고유 이름 수만큼 (식약처 CSV 규모에서는 충분히 작음)
+    """
+    rows, seen, skipped = {}, 0, 0
+    for row in reader:
+        seen += 1
+        data = parse_row(row)
+        if data:
+            rows[data["name"]] = data  # 마지막 행 우선
+        else:
+            skipped += 1  # 이름 없으면 스킵
+        if limit and seen >= limit:
+            break
+    return seen, skipped, rows
+
+
+def iter_batches(rows, batch_size):
+    """{name: data} → batch_size 단위 청크 (이름은 청크 간 중복 없음)."""
+    chunk = {}
+    for name, data in rows.items():
+        chunk[name] = data
+        if len(chunk) >= batch_size:
+            yield chunk
+            chunk = {}
+    if chunk:
+        yield chunk
+
+
+def diff_batch(chunk):
+    """
+    기존 Food와 비교해 (inserted, updated, unchanged) 분류.
+    청크당 SELECT 1회.
+    """
+    existing = {
+        row[0]: row[1:]
+        for row in Food.objects.filter(name__in=list(chunk)).values_list("name", *NUTRIENT_FIELDS)
+    }
+    inserted, updated, unchanged = [], [], []
+    for name, data in chunk.items():
+        if name not in existing:
+            inserted.append(data)
+        elif tuple(existing[name]) != tuple(data[f] for f in NUTRIENT_FIELDS):
+            updated.append(data)
+        else:
+            unchanged.append(data)
+    return inserted, updated, unchanged
+
+
+# ---------------------------
+# PostgreSQL 전용: COPY → 스테이징 테이블 → 1회 MERGE(upsert)
+# ---------------------------
+_STAGING_TABLE = "_mfds_food_staging"
+
+
+def _copy_rows(cursor, rows):
+    """psycopg3(cursor.copy) 우선, psycopg2(copy_expert) 폴백."""
+    cols = ", ".join(("seq", "name") + NUTRIENT_FIELDS)
+    sql = f"COPY {_STAGING_TABLE} ({cols}) FROM STDIN"
+    raw = getattr(cursor, "cursor", cursor)
+    if hasattr(raw, "copy"):
+        with raw.copy(sql) as copy:
+            for rec in rows:
+                copy.write_row(rec)
+        return
+    buf = io.StringIO()
+    w = csv.writer(buf, delimiter="\t", quoting=csv.QUOTE_NONE, escapechar="\\", lineterminator="\n")
+    for rec in rows:
+        w.writerow(rec)
+    buf.seek(0)
+    raw.copy_expert(f"{sql} WITH (FORMAT text)", buf)
+
+
+def copy_merge(reader, limit=None):
+    """
+    전체 CSV를 임시 테이블로 COPY 후 INSERT ... ON CONFLICT 1회로 병합.
+    반환: (seen, inserted, updated, unchanged, skipped)
+    """
+    table = Food._meta.db_table
+    counter = {"seen": 0, "skipped": 0}
+
+    def _rows():
+        for row in reader:
+            counter["seen"] += 1
+            data = parse_row(row)
+            if data:
+                yield (counter["seen"], data["name"], *(data[f] for f in NUTRIENT_FIELDS))
+            else:
+                counter["skipped"] += 1  # 이름 없으면 스킵 (ORM 경로와 같은 집계)
+            if limit and counter["seen"] >= limit:
+                break
+
+    nutrient_cols = ", ".join(NUTRIENT_FIELDS)
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(
+            f"CREATE TEMP TABLE {_STAGING_TABLE} ("
+            "seq bigint, name varchar(120), kcal_per_100g double precision, "
+            "protein_g_per_100g double precision, carb_g_per_100g double precision, "
+            "fat_g_per_100g double precision) ON COMMIT DROP"
+        )
+        _copy_rows(cursor, _rows())
+        cursor.execute(f"SELECT count(DISTINCT name) FROM {_STAGING_TABLE}")
+        distinct = cursor.fetchone()[0]
+        # 같은 이름은 파일상 마지막 행 우선, 값이 같으면 UPDATE 생략(unchanged)
+        cursor.execute(
+            f"""
+            INSERT INTO {table} (name, {nutrient_cols})
+            SELECT DISTINCT ON (name) name, {nutrient_cols}
+              FROM {_STAGING_TABLE} ORDER BY name, seq DESC
+            ON CONFLICT (name) DO UPDATE SET
+              {", ".join(f"{f} = EXCLUDED.{f}" for f in NUTRIENT_FIELDS)}
+            WHERE ({", ".join(f"{table}.{f}" for f in NUTRIENT_FIELDS)})
+                  IS DISTINCT FROM ({", ".join(f"EXCLUDED.{f}" for f in NUTRIENT_FIELDS)})
+            RETURNING (xmax = 0)
+            """
+        )
+        flags = [r[0] for r in cursor.fetchall()]
+    inserted = sum(1 for f in flags if f)
+    updated = len(flags) - inserted
+    return counter["seen"], inserted, updated, distinct - inserted - updated, counter["skipped"]
+
+
 class Command(BaseCommand):
-    help = "식약처 영양성분 CSV를 읽어 Food 테이블을 채웁니다 (100g 기준)."
+    help = (
+        "식약처 영양성분 CSV를 읽어 Food 테이블을 채웁니다 (100g 기준, 배치 upsert). "
+        "같은 이름은 파일 전체 기준 마지막 행이 적용되도록 먼저 전체를 읽어 중복을 제거한 뒤 "
+        "--batch-size 단위로 비교/반영합니다 (메모리: 고유 이름 수만큼)."
+    )
 
     def add_arguments(self, parser):
         parser.add_argument(
@@ -148,7 +284,13 @@ class Command(BaseCommand):
         parser.add_argument(
             "--dry-run",
             action="store_true",
-            help="DB에 반영하지 않고 파싱/매핑 결과만 집계",
+            help="DB에 반영하지 않고 inserted/updated/unchanged 건수만 집계",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="한 번에 비교/upsert할 고유 이름 수 (기본 1000)",
         )
         parser.add_argument(
             "--progress-every",
@@ -162,15 +304,40 @@ class Command(BaseCommand):
             default=None,
             help="최대 몇 행까지만 처리(테스트용)",
         )
+        parser.add_argument(
+            "--copy",
+            action="store_true",
+            help="PostgreSQL 전용: COPY로 스테이징 테이블 적재 후 1회 병합",
+        )
 
+    def _report(self, seen, inserted, updated, unchanged, skipped, started, dry_run):
+        elapsed = max(time.monotonic() - started, 1e-6)
+        self.stdout.write(self.style.SUCCESS(
+            f"완료! rows={seen}, inserted={inserted}, updated={updated}, unchanged={unchanged}, "
+            f"skipped={skipped} ({seen / elapsed:,.0f} rows/s, {elapsed:.2f}s)"
+            f"{' (dry-run)' if dry_run else ''}"
+        ))
 
-    @transaction.atomic
     def handle(self, *args, **opts):
         # 경로 결정
         path = Path(opts["path"]) if opts.get("path") else _resolve_default_csv_path()
         if not path.exists():
             raise CommandError(f"CSV 파일을 찾을 수 없습니다: {path}")
 
+        batch_size = int(opts["batch_size"] or 0)
+        if batch_size <= 0:
+            raise CommandError("--batch-size 는 양수여야 합니다.")
+        dry_run = bool(opts["dry_run"])
+        use_copy = bool(opts["copy"])
+        if use_copy and connection.vendor != "postgresql":
+            raise CommandError("--copy 는 PostgreSQL에서만 사용할 수 있습니다.")
+        if use_copy and dry_run:
+            raise CommandError("--copy 와 --dry-run 은 함께 쓸 수 없습니다.")
+        every = int(opts["progress_every"]) if opts["progress_every"] else 0
+        limit = opts.get("limit")
+
+        started = time.monotonic()
+
         # 파일 열기 + 샘플로 dialect 감지
         with _open_text_file(path) as fh:
             head_sample = fh.read(4096)
@@ -183,55 +350,39 @@ class Command(BaseCommand):
             # 공백 헤더 방지(선제 정리)
             reader.fieldnames = [h.strip() if h else "" for h in reader.fieldnames]
 
-            created, updated, skipped, seen = 0, 0, 0, 0
-            dry_run = bool(opts["dry_run"])
-            every = int(opts["progress_every"]) if opts["progress_every"] else 1000
-            limit = opts.get("limit")
-
-            for row in reader:
-                seen += 1
-                data = parse_row(row)
-                if not data:
-                    skipped += 1
-                    # 진행 출력
-                    if every and seen % every == 0:
-                        self.stdout.write(f"... {seen} rows processed")
-                    if limit and seen >= limit:
-                        break
-                    continue
-
-                if dry_run:
-                    # dry-run: 실제 DB write 없음
-                    pass
-                else:
-                    # name 기준 upsert
-                    _, is_created = Food.objects.update_or_create(
-                        name=data["name"],
-                        defaults={
-                            "kcal_per_100g": data["kcal_per_100g"],
-                            "protein_g_per_100g": data["protein_g_per_100g"],
-                            "carb_g_per_100g": data["carb_g_per_100g"],
-                            "fat_g_per_100g": data["fat_g_per_100g"],
-                        },
-                    )
-                    if is_created:
-                        created += 1
-                    else:
-                        updated += 1
-
-                # 진행 출력
-                if every and seen % every == 0:
-                    self.stdout.write(f"... {seen} rows processed")
-
-                if limit and seen >= limit:
-                    break
-
-            # dry-run일 때 updated/created는 0으로 유지됨
-            self.stdout.write(self.style.SUCCESS(
-                f"완료! rows={seen}, created={created}, updated={updated}, skipped={skipped} "
-                f"{'(dry-run)' if dry_run else ''}"
-            ))
-
-            # dry-run이면 트랜잭션 롤백
-            if dry_run:
-                raise CommandError("Dry-run: 트랜잭션을 롤백합니다(의도된 종료).")
+            if use_copy:
+                seen, inserted, updated, unchanged, skipped = copy_merge(reader, limit=limit)
+                bump_catalog_version()  # bulk 쓰기는 Food 시그널이 없으므로 검색 색인 갱신 직접 요청
+                self._report(seen, inserted, updated, unchanged, skipped, started, dry_run)
+                return
+
+            seen, skipped, rows = read_rows(reader, limit=limit)
+            inserted = updated = unchanged = done = 0
+            next_progress = every
+            for chunk in iter_batches(rows, batch_size):
+                new_rows, changed_rows, same_rows = diff_batch(chunk)
+                inserted += len(new_rows)
+                updated += len(changed_rows)
+                unchanged += len(same_rows)
+                done += len(chunk)
+
+                # 변경분만 한 번의 INSERT ... ON CONFLICT(name) DO UPDATE 로 반영
+                to_write = new_rows + changed_rows
+                if to_write and not dry_run:
+                    with transaction.atomic():
+                        Food.objects.bulk_create(
+                            [Food(**d) for d in to_write],
+                            update_conflicts=True,
+                            unique_fields=["name"],
+                            update_fields=list(NUTRIENT_FIELDS),
+                        )
+
+                # 진행 출력 (고유 이름 기준)
+                if every and done >= next_progress:
+                    elapsed = max(time.monotonic() - started, 1e-6)
+                    self.stdout.write(f"... {done}/{len(rows)} foods processed ({done / elapsed:,.0f} /s)")
+                    next_progress = (done // every + 1) * every
+
+            if not dry_run and (inserted or updated):
+                bump_catalog_version()
+            self._report(seen, inserted, updated, unchanged, skipped, started, dry_run)
@@ -0,0 +1,30 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from intakes.quick_foods import rebuild_for_user
+from users.models import CustomUser
+
+
+class Command(BaseCommand):
+    help = "기존 MealItem 기록으로 사용자별 빠른 추가 목록(QuickFood)을 다시 만든다"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--days", type=int, default=90, help="최근 며칠 기록을 반영할지 (기본 90)")
+        parser.add_argument("--only-user", type=str, default=None, help="특정 사용자만")
+
+    def handle(self, *args, **opt):
+        if opt["days"] <= 0:
+            raise CommandError("--days 는 양수여야 합니다.")
+        since = timezone.now() - timedelta(days=opt["days"])
+        users = CustomUser.objects.filter(meals__log_date__gte=since.date()).distinct()
+        if opt["only_user"]:
+            users = CustomUser.objects.filter(username=opt["only_user"])
+            if not users.exists():
+                raise CommandError(f"username={opt['only_user']} 없음")
+
+        total = 0
+        for user_id in users.values_list("id", flat=True).iterator():
+            total += rebuild_for_user(user_id, since=since)
+        self.stdout.write(self.style.SUCCESS(f"빠른 추가 목록 재구성 완료: {total}개 항목"))
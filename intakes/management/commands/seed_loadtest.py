@@ -0,0 +1,458 @@
+# intakes/management/commands/seed_loadtest.py
+"""
+부하 테스트용 대용량 합성 데이터 생성기.
+
+seed_nutrition_range / seed_demo 는 행마다 create() + 시그널이라 수십만 행이 한계.
+여기서는
+- 사용자별 결정적 난수(seed:user_index) → 워커 수/샤드 분할과 무관하게 같은 데이터
+- bulk_create(부모 테이블) + PostgreSQL COPY(대용량 자식 테이블, --copy)
+- 사용자 샤드별 병렬 워커 프로세스 (--workers)
+- NutritionLog / DailyGoal.completion_score / 운동 롤업(DailyTaskProgress, DailyWorkoutTotal)은
+  시그널 대신 생성 시점에 미리 계산
+- 테이블별 행 수/소요 시간 리포트
+
+예) python manage.py seed_loadtest --users 100000 --days 100 --workers 8 --copy
+"""
+from __future__ import annotations
+
+import multiprocessing
+import random
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from datetime import date, datetime, time as dtime, timedelta
+
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, connections, transaction
+from django.utils import timezone
+
+from goals.models import DailyGoal, Goal
+from intakes.models import Food, Meal, MealItem, NutritionLog
+from tasks.calories import kcal_per_min
+from tasks.models import DailyTaskProgress, DailyWorkoutTotal, Exercise, TaskItem, WorkoutLog, WorkoutPlan
+from users.models import CustomUser, HealthData, UserProfile
+
+MEAL_TYPES = ("아침", "점심", "저녁", "간식")
+MEAL_BASE_GRAMS = {"아침": 120, "점심": 220, "저녁": 250, "간식": 80}
+INTENSITIES = ("low", "medium", "high")
+GOAL_TYPES = ("다이어트", "근력", "체력", "유지")
+
+
+# ---------------------------
+# 공통 유틸
+# ---------------------------
+class TableStats:
+    """테이블별 (rows, seconds) 누적. 워커 결과를 dict로 주고받는다."""
+
+    def __init__(self):
+        self.data = defaultdict(lambda: [0, 0.0])
+
+    def add(self, table, rows, seconds):
+        self.data[table][0] += rows
+        self.data[table][1] += seconds
+
+    def merge(self, other: dict):
+        for table, (rows, secs) in other.items():
+            self.add(table, rows, secs)
+
+    def as_dict(self):
+        return {k: tuple(v) for k, v in self.data.items()}
+
+
+@contextmanager
+def explicit_timestamps(*fields):
+    """auto_now/auto_now_add를 잠시 끄고 생성 날짜를 과거로 지정할 수 있게 한다."""
+    saved = [(f, f.auto_now, f.auto_now_add) for f in fields]
+    try:
+        for f, _, _ in saved:
+            f.auto_now = f.auto_now_add = False
+        yield
+    finally:
+        for f, auto_now, auto_now_add in saved:
+            f.auto_now, f.auto_now_add = auto_now, auto_now_add
+
+
+def _aware(d: date, hour: int, minute: int = 0) -> datetime:
+    return timezone.make_aware(datetime.combine(d, dtime(hour, minute)), timezone.get_current_timezone())
+
+
+def copy_insert(model, objs):
+    """
+    PostgreSQL COPY FROM STDIN 으로 자식 테이블 적재 (PK는 시퀀스 기본값 사용).
+    bulk_create 대비 파싱/플랜 비용이 없어 수천만 행에서 수 배 빠르다.
+    """
+    fields = [f for f in model._meta.concrete_fields if not f.primary_key]
+    cols = ", ".join(connection.ops.quote_name(f.column) for f in fields)
+    table = connection.ops.quote_name(model._meta.db_table)
+    with connection.cursor() as cursor:
+        raw = cursor.cursor
+        with raw.copy(f"COPY {table} ({cols}) FROM STDIN") as copy:
+            for obj in objs:
+                copy.write_row(
+                    [f.get_db_prep_save(f.pre_save(obj, True), connection) for f in fields]
+                )
+
+
+def insert_rows(model, objs, stats, *, batch_size, use_copy=False, table=None):
+    if not objs:
+        return
+    t0 = time.perf_counter()
+    if use_copy:
+        copy_insert(model, objs)
+    else:
+        model.objects.bulk_create(objs, batch_size=batch_size)
+    stats.add(table or model._meta.db_table, len(objs), time.perf_counter() - t0)
+
+
+# ---------------------------
+# 사용자 1명분 데이터 (결정적)
+# ---------------------------
+def build_user_days(rng, days, foods, exercises, opts):
+    """
+    하루 단위 합성 레코드 생성. DB 접근 없음.
+    반환: [(day, meals[(meal_type, items[(food, grams)])], plan_tasks[...] | None, health | None)]
+    """
+    out = []
+    for day in days:
+        n_meals = rng.randint(opts["meals_min"], opts["meals_max"])
+        meal_types = rng.sample(MEAL_TYPES, k=min(n_meals, len(MEAL_TYPES)))
+        meals = []
+        for mt in meal_types:
+            n_items = rng.randint(opts["items_min"], opts["items_max"])
+            items = []
+            for _ in range(n_items):
+                food = foods[rng.randrange(len(foods))]
+                grams = max(40, MEAL_BASE_GRAMS[mt] + rng.randint(-40, 60))
+                items.append((food, grams))
+            meals.append((mt, items))
+
+        tasks = None
+        if day.weekday() < 5 and rng.random() < opts["workout_ratio"]:
+            tasks = []
+            for order in range(1, rng.randint(3, 5) + 1):
+                ex = exercises[rng.randrange(len(exercises))]
+                tasks.append({
+                    "exercise": ex,
+                    "order": order,
+                    "duration_min": rng.choice((10, 15, 20, 25, 30)),
+                    "intensity": rng.choice(INTENSITIES),
+                    "target_sets": rng.choice((2, 3, 4, 5)),
+                    "target_reps": rng.choice((8, 10, 12, 15)),
+                    "completed": rng.random() < 0.7,
+                })
+
+        health = None
+        if rng.random() < opts["health_ratio"]:
+            health = {
+                "weight_kg": round(rng.uniform(50, 95), 1),
+                "sleep_hours": round(rng.uniform(4.5, 9.0), 1),
+                "sleep_quality": rng.randint(1, 5),
+                "water_intake_ml": rng.randrange(500, 3000, 100),
+                "stress_level": rng.randint(1, 5),
+                "mood_score": rng.randint(1, 5),
+                "steps_count": rng.randrange(1000, 15000, 10),
+                "heart_rate_bpm": rng.randint(55, 90),
+            }
+        out.append((day, meals, tasks, health))
+    return out
+
+
+def _task_kcal(t):
+    """workout_sync.task_kcal 과 같은 규칙 (운동별 분당 kcal, 없으면 강도 기본값)."""
+    return round(t["duration_min"] * kcal_per_min(t["exercise"][2], t["intensity"]), 1)
+
+
+def generate_shard(opts, user_rows, foods, exercises, goal_by_user):
+    """
+    사용자 샤드 하나를 생성. 워커 프로세스에서 실행.
+    user_rows: [(user_index, user_id)]
+    """
+    stats = TableStats()
+    rng_seed = opts["seed"]
+    batch_size = opts["batch_size"]
+    use_copy = opts["copy"]
+    end = date.fromisoformat(opts["end"])
+    days = [end - timedelta(days=opts["days"] - 1 - i) for i in range(opts["days"])]
+
+    with explicit_timestamps(
+        WorkoutPlan._meta.get_field("created_at"),
+        WorkoutPlan._meta.get_field("updated_at"),
+        MealItem._meta.get_field("created_at"),
+    ):
+        for off in range(0, len(user_rows), opts["user_batch"]):
+            group = user_rows[off: off + opts["user_batch"]]
+            meals, item_specs = [], []
+            plans, task_specs = [], []
+            nlogs, dgoals, health_rows = [], [], []
+            progress_rows, workout_totals = [], []
+
+            for idx, user_id in group:
+                rng = random.Random(f"{rng_seed}:{idx}")
+                goal = goal_by_user.get(user_id)
+                kcal_target = rng.randrange(1600, 2800, 100)
+                protein_target = rng.randrange(60, 160, 10)
+                minutes_target = rng.choice((20, 30, 45, 60))
+
+                for day, day_meals, tasks, health in build_user_days(rng, days, foods, exercises, opts):
+                    totals = [0.0, 0.0, 0.0, 0.0]
+                    for mt, items in day_meals:
+                        meal = Meal(user_id=user_id, log_date=day, meal_type=mt)
+                        meals.append(meal)
+                        for food, grams in items:
+                            f = grams / 100.0
+                            macros = (food[1] * f, food[2] * f, food[3] * f, food[4] * f)
+                            for i, v in enumerate(macros):
+                                totals[i] += v
+                            item_specs.append((meal, food[0], grams, macros, _aware(day, 12)))
+
+                    # 시그널 대신 미리 계산한 하루 합계
+                    nlogs.append(NutritionLog(
+                        user_id=user_id, date=day,
+                        kcal_total=totals[0], protein_total_g=totals[1],
+                        carb_total_g=totals[2], fat_total_g=totals[3],
+                    ))
+
+                    done_minutes = 0
+                    if tasks:
+                        done = [t for t in tasks if t["completed"]]
+                        done_minutes = sum(t["duration_min"] for t in done)
+                        # TaskItem/WorkoutLog 시그널·동기화 대신 롤업 행을 바로 생성
+                        progress_rows.append(DailyTaskProgress(
+                            user_id=user_id, date=day, total=len(tasks), completed=len(done), skipped=0,
+                        ))
+                        if done:
+                            workout_totals.append(DailyWorkoutTotal(
+                                user_id=user_id, date=day, minutes=done_minutes,
+                                kcal=sum(_task_kcal(t) for t in done),
+                            ))
+                        plan = WorkoutPlan(
+                            user_id=user_id,
+                            plan_date=day,
+                            title=f"{day.isoformat()} 플랜",
+                            description="loadtest",
+                            target_focus=tasks[0]["exercise"][1],
+                            source=WorkoutPlan.PlanSource.MANUAL,
+                            created_at=_aware(day, 7),
+                            updated_at=_aware(day, 7),
+                        )
+                        plans.append(plan)
+                        for t in tasks:
+                            task_specs.append((plan, day, t))
+
+                    if goal:
+                        ratios = [totals[0] / kcal_target, totals[1] / protein_target]
+                        ratios.append(done_minutes / minutes_target)
+                        dgoals.append(DailyGoal(
+                            user_id=user_id, goal_id=goal, date=day,
+                            kcal_target=kcal_target, protein_target_g=protein_target,
+                            workout_minutes_target=minutes_target,
+                            completion_score=round(sum(ratios) / len(ratios) * 100, 1),
+                        ))
+
+                    if health:
+                        health_rows.append(HealthData(user_id=user_id, date=day, **health))
+
+            with transaction.atomic():
+                # 부모 테이블: PK가 필요하므로 bulk_create (PostgreSQL/SQLite 3.35+는 id 반환)
+                insert_rows(Meal, meals, stats, batch_size=batch_size)
+                insert_rows(WorkoutPlan, plans, stats, batch_size=batch_size)
+
+                items = [
+                    MealItem(
+                        meal_id=meal.id, food_id=food_id, grams=grams,
+                        kcal=m[0], protein_g=m[1], carb_g=m[2], fat_g=m[3],
+                        source="db", created_at=created_at,
+                    )
+                    for meal, food_id, grams, m, created_at in item_specs
+                ]
+                insert_rows(MealItem, items, stats, batch_size=batch_size, use_copy=use_copy)
+                insert_rows(NutritionLog, nlogs, stats, batch_size=batch_size, use_copy=use_copy)
+                insert_rows(DailyGoal, dgoals, stats, batch_size=batch_size, use_copy=use_copy)
+                insert_rows(HealthData, health_rows, stats, batch_size=batch_size, use_copy=use_copy)
+
+                task_objs, log_objs = [], []
+                for plan, day, t in task_specs:
+                    ex_id, _, _ = t["exercise"]
+                    task_objs.append(TaskItem(
+                        workout_plan_id=plan.id, exercise_id=ex_id, order=t["order"],
+                        duration_min=t["duration_min"], intensity=t["intensity"],
+                        target_sets=t["target_sets"], target_reps=t["target_reps"],
+                        completed=t["completed"],
+                        completed_at=_aware(day, 19) if t["completed"] else None,
+                    ))
+                # WorkoutLog.task_item 연결을 위해 TaskItem은 bulk_create(id 필요)
+                insert_rows(TaskItem, task_objs, stats, batch_size=batch_size)
+                for task, (plan, day, t) in zip(task_objs, task_specs):
+                    if t["completed"]:
+                        log_objs.append(WorkoutLog(
+                            user_id=plan.user_id, workout_plan_id=plan.id, exercise_id=task.exercise_id,
+                            task_item_id=task.id, date=day, duration_min=task.duration_min,
+                            kcal_burned=_task_kcal(t),
+                        ))
+                insert_rows(WorkoutLog, log_objs, stats, batch_size=batch_size, use_copy=use_copy)
+                insert_rows(DailyTaskProgress, progress_rows, stats, batch_size=batch_size, use_copy=use_copy)
+                insert_rows(DailyWorkoutTotal, workout_totals, stats, batch_size=batch_size, use_copy=use_copy)
+
+    return stats.as_dict()
+
+
+def _run_shard(args):
+    """multiprocessing 워커 진입점: 부모의 DB 커넥션을 공유하지 않도록 새로 연결."""
+    connections.close_all()
+    try:
+        return generate_shard(*args)
+    finally:
+        connections.close_all()
+
+
+class Command(BaseCommand):
+    help = "부하 테스트용 대용량 합성 데이터(사용자/프로필/식단/운동/목표/건강)를 생성합니다."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--users", type=int, default=1000, help="생성할 사용자 수 (기본 1000)")
+        parser.add_argument("--days", type=int, default=30, help="사용자당 기록 일수 (기본 30)")
+        parser.add_argument("--end", default=None, help="마지막 날짜 YYYY-MM-DD (기본 오늘)")
+        parser.add_argument("--prefix", default="lt_", help="생성 사용자 username 접두사 (기본 lt_)")
+        parser.add_argument("--seed", type=int, default=42, help="난수 시드 (같은 시드 = 같은 데이터)")
+        parser.add_argument("--meals-min", type=int, default=2, help="하루 최소 끼니 수")
+        parser.add_argument("--meals-max", type=int, default=4, help="하루 최대 끼니 수")
+        parser.add_argument("--items-min", type=int, default=1, help="끼니당 최소 항목")
+        parser.add_argument("--items-max", type=int, default=3, help="끼니당 최대 항목")
+        parser.add_argument("--workout-ratio", type=float, default=0.6, help="평일 운동 플랜 생성 확률")
+        parser.add_argument("--health-ratio", type=float, default=0.5, help="건강 데이터 기록 확률")
+        parser.add_argument("--workers", type=int, default=1, help="병렬 워커 프로세스 수 (사용자 샤드 단위)")
+        parser.add_argument("--batch-size", type=int, default=5000, help="bulk_create 배치 크기")
+        parser.add_argument("--user-batch", type=int, default=100, help="한 트랜잭션에서 처리할 사용자 수")
+        parser.add_argument("--copy", action="store_true", help="PostgreSQL: 자식 테이블을 COPY로 적재")
+
+    # ---------------- 카탈로그 ---------------- #
+    def _foods(self, stats):
+        foods = list(
+            Food.objects.order_by("id").values_list(
+                "id", "kcal_per_100g", "protein_g_per_100g", "carb_g_per_100g", "fat_g_per_100g"
+            )[:5000]
+        )
+        if foods:
+            return foods
+        rng = random.Random("foods")
+        objs = [
+            Food(
+                name=f"LT 음식 {i:04d}",
+                kcal_per_100g=round(rng.uniform(40, 450), 1),
+                protein_g_per_100g=round(rng.uniform(0, 30), 1),
+                carb_g_per_100g=round(rng.uniform(0, 70), 1),
+                fat_g_per_100g=round(rng.uniform(0, 25), 1),
+            )
+            for i in range(500)
+        ]
+        insert_rows(Food, objs, stats, batch_size=1000)
+        return self._foods(stats)
+
+    def _exercises(self, stats):
+        exercises = list(Exercise.objects.order_by("id").values_list("id", "target", "kcal_burned_per_min"))
+        if exercises:
+            return exercises
+        rng = random.Random("exercises")
+        targets = ("chest", "back", "legs", "shoulders", "arms", "core", "cardio")
+        objs = [
+            Exercise(
+                name=f"LT 운동 {i:03d}",
+                target=targets[i % len(targets)],
+                kcal_burned_per_min=round(rng.uniform(3, 12), 1),
+            )
+            for i in range(60)
+        ]
+        insert_rows(Exercise, objs, stats, batch_size=1000)
+        return self._exercises(stats)
+
+    # ---------------- 사용자/프로필/목표 ---------------- #
+    def _create_users(self, opts, stats):
+        prefix, n, seed = opts["prefix"], opts["users"], opts["seed"]
+        # 해시 계산은 한 번만 (사용자마다 PBKDF2를 돌리면 그것만으로 수 시간)
+        password = make_password("loadtest1234!")
+        now = timezone.now()
+        for off in range(0, n, opts["batch_size"]):
+            users = [
+                CustomUser(
+                    username=f"{prefix}{i:07d}", email=f"{prefix}{i:07d}@loadtest.local",
+                    nickname=f"LT{i}", password=password, date_joined=now,
+                )
+                for i in range(off, min(n, off + opts["batch_size"]))
+            ]
+            insert_rows(CustomUser, users, stats, batch_size=opts["batch_size"])
+
+        user_rows = [
+            (int(name[len(prefix):]), uid)
+            for uid, name in CustomUser.objects.filter(username__startswith=prefix)
+            .order_by("id").values_list("id", "username")
+        ]
+
+        # bulk_create는 post_save(create_user_profile)를 부르지 않으므로 직접 생성
+        profiles, goals = [], []
+        for idx, uid in user_rows:
+            rng = random.Random(f"{seed}:profile:{idx}")
+            profiles.append(UserProfile(
+                user_id=uid,
+                gender=rng.choice(("male", "female")),
+                height_cm=rng.randint(150, 190),
+                weight_kg=round(rng.uniform(50, 95), 1),
+                target_weight_kg=round(rng.uniform(50, 85), 1),
+                activity_level=rng.randint(1, 5),
+                birth_date=date(rng.randint(1965, 2005), rng.randint(1, 12), rng.randint(1, 28)),
+            ))
+            goals.append(Goal(user_id=uid, goal_type=rng.choice(GOAL_TYPES)))
+        insert_rows(UserProfile, profiles, stats, batch_size=opts["batch_size"])
+        insert_rows(Goal, goals, stats, batch_size=opts["batch_size"])
+        goal_by_user = dict(
+            Goal.objects.filter(user__username__startswith=prefix).values_list("user_id", "id")
+        )
+        return user_rows, goal_by_user
+
+    def handle(self, *args, **opts):
+        if opts["users"] <= 0 or opts["days"] <= 0:
+            raise CommandError("--users / --days 는 양수여야 합니다.")
+        if opts["copy"] and connection.vendor != "postgresql":
+            raise CommandError("--copy 는 PostgreSQL에서만 사용할 수 있습니다.")
+        workers = max(1, opts["workers"])
+        if workers > 1 and connection.vendor == "sqlite":
+            self.stdout.write(self.style.WARNING("SQLite는 쓰기 잠금이 단일이라 --workers 1 로 실행합니다."))
+            workers = 1
+        if CustomUser.objects.filter(username__startswith=opts["prefix"]).exists():
+            raise CommandError(f"username이 '{opts['prefix']}'로 시작하는 사용자가 이미 있습니다. --prefix를 바꾸세요.")
+        opts["end"] = opts["end"] or timezone.localdate().isoformat()
+
+        started = time.perf_counter()
+        stats = TableStats()
+        foods = self._foods(stats)
+        exercises = self._exercises(stats)
+        user_rows, goal_by_user = self._create_users(opts, stats)
+
+        shard_opts = {k: opts[k] for k in (
+            "seed", "days", "end", "meals_min", "meals_max", "items_min", "items_max",
+            "workout_ratio", "health_ratio", "batch_size", "user_batch", "copy",
+        )}
+        # 연속 구간 샤딩: 각 워커가 user_index 구간을 맡는다
+        size = -(-len(user_rows) // workers)
+        shards = [user_rows[i: i + size] for i in range(0, len(user_rows), size)]
+        jobs = [(shard_opts, shard, foods, exercises, goal_by_user) for shard in shards]
+
+        if workers == 1:
+            results = [generate_shard(*job) for job in jobs]
+        else:
+            connections.close_all()  # fork 전에 부모 커넥션 정리
+            ctx = multiprocessing.get_context("fork")
+            with ctx.Pool(processes=workers) as pool:
+                results = pool.map(_run_shard, jobs)
+        for r in results:
+            stats.merge(r)
+
+        elapsed = time.perf_counter() - started
+        self.stdout.write(f"{'table':<28}{'rows':>14}{'seconds':>10}{'rows/s':>12}")
+        for table, (rows, secs) in sorted(stats.as_dict().items()):
+            rate = rows / secs if secs else 0
+            self.stdout.write(f"{table:<28}{rows:>14,}{secs:>10.2f}{rate:>12,.0f}")
+        self.stdout.write(self.style.SUCCESS(
+            f"완료! users={len(user_rows)}, days={opts['days']}, workers={workers}, total {elapsed:.1f}s "
+            "(NutritionLog/DailyGoal/운동 롤업은 시그널 없이 미리 계산)"
+        ))
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.7 on 2026-10-18 21:04
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("intakes", "0002_mealitem_ai_confidence_mealitem_ai_label_and_more"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="meal",
+            index=models.Index(
+                fields=["user", "log_date", "id"], name="meal_user_date_id_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,39 @@
+from django.db import migrations
+from django.db.models import Count, Min
+
+
+def merge_duplicates(apps, schema_editor):
+    """
+    다음 마이그레이션의 유니크 제약 추가 전에 기존 (user, log_date, meal_type) 중복 병합.
+    가장 작은 id 의 Meal 을 남기고 나머지의 MealItem 을 옮긴 뒤 빈 Meal 삭제.
+    마이그레이션 시점 모델만 사용 (앱 코드/캐시에 의존하지 않음 — 운영 중 병합은 manage.py dedupe_meals)
+    """
+    Meal = apps.get_model("intakes", "Meal")
+    MealItem = apps.get_model("intakes", "MealItem")
+    groups = (
+        Meal.objects.values("user_id", "log_date", "meal_type")
+        .annotate(n=Count("id"), keep_id=Min("id"))
+        .filter(n__gt=1)
+        .order_by()
+    )
+    for group in list(groups):
+        extra_ids = list(
+            Meal.objects.filter(
+                user_id=group["user_id"], log_date=group["log_date"], meal_type=group["meal_type"],
+            )
+            .exclude(id=group["keep_id"])
+            .values_list("id", flat=True)
+        )
+        MealItem.objects.filter(meal_id__in=extra_ids).update(meal_id=group["keep_id"])
+        Meal.objects.filter(id__in=extra_ids).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("intakes", "0003_meal_user_date_id_idx"),
+    ]
+
+    operations = [
+        migrations.RunPython(merge_duplicates, migrations.RunPython.noop),
+    ]
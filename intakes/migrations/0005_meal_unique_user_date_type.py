@@ -0,0 +1,22 @@
+# Generated by Django 5.2.7 on 2026-10-18 21:07
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("intakes", "0004_merge_duplicate_meals"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name="meal",
+            constraint=models.UniqueConstraint(
+                fields=("user", "log_date", "meal_type"),
+                name="unique_meal_per_user_date_type",
+            ),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.7 on 2026-10-18 21:16
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("intakes", "0005_meal_unique_user_date_type"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="mealitem",
+            name="thumbs_ready",
+            field=models.BooleanField(default=False),
+        ),
+    ]
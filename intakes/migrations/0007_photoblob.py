@@ -0,0 +1,62 @@
+# Generated by Django 5.2.7 on 2026-10-18 21:19
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("intakes", "0006_mealitem_thumbs_ready"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PhotoBlob",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "sha256",
+                    models.CharField(
+                        max_length=64, unique=True, verbose_name="SHA-256"
+                    ),
+                ),
+                (
+                    "name",
+                    models.CharField(
+                        max_length=255, unique=True, verbose_name="스토리지 경로"
+                    ),
+                ),
+                (
+                    "size",
+                    models.PositiveIntegerField(default=0, verbose_name="크기(bytes)"),
+                ),
+                ("ref_count", models.IntegerField(default=0, verbose_name="참조 수")),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                (
+                    "last_uploaded_at",
+                    models.DateTimeField(
+                        default=django.utils.timezone.now, verbose_name="마지막 업로드"
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "사진 원본",
+                "verbose_name_plural": "사진 원본 목록",
+                "indexes": [
+                    models.Index(
+                        fields=["ref_count", "last_uploaded_at"],
+                        name="photoblob_gc_idx",
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,64 @@
+# Generated by Django 5.2.7 on 2026-10-18 21:22
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("intakes", "0007_photoblob"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PendingUpload",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "name",
+                    models.CharField(
+                        max_length=255, unique=True, verbose_name="스토리지 경로"
+                    ),
+                ),
+                (
+                    "size",
+                    models.PositiveIntegerField(default=0, verbose_name="크기(bytes)"),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(
+                        db_index=True,
+                        default=django.utils.timezone.now,
+                        verbose_name="업로드 시각",
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="+",
+                        to=settings.AUTH_USER_MODEL,
+                        verbose_name="업로드 사용자(익명은 비움)",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "미확정 업로드",
+                "verbose_name_plural": "미확정 업로드 목록",
+            },
+        ),
+    ]
@@ -0,0 +1,109 @@
+# Generated by Django 5.2.7 on 2026-10-18 21:28
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("intakes", "0008_pendingupload"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="QuickFood",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("key", models.CharField(max_length=140, verbose_name="식별 키")),
+                (
+                    "name",
+                    models.CharField(
+                        blank=True, default="", max_length=120, verbose_name="이름"
+                    ),
+                ),
+                (
+                    "grams",
+                    models.FloatField(blank=True, null=True, verbose_name="중량(g)"),
+                ),
+                (
+                    "kcal",
+                    models.FloatField(blank=True, null=True, verbose_name="열량(kcal)"),
+                ),
+                (
+                    "protein_g",
+                    models.FloatField(blank=True, null=True, verbose_name="단백질(g)"),
+                ),
+                (
+                    "carb_g",
+                    models.FloatField(
+                        blank=True, null=True, verbose_name="탄수화물(g)"
+                    ),
+                ),
+                (
+                    "fat_g",
+                    models.FloatField(blank=True, null=True, verbose_name="지방(g)"),
+                ),
+                ("source", models.CharField(default="csv", max_length=20)),
+                (
+                    "origin",
+                    models.CharField(
+                        choices=[("photo", "사진 분석"), ("search", "검색/직접 입력")],
+                        default="search",
+                        max_length=10,
+                        verbose_name="처음 기록 경로",
+                    ),
+                ),
+                (
+                    "score",
+                    models.FloatField(
+                        default=0.0, verbose_name="감쇠 빈도 점수(scored_at 기준)"
+                    ),
+                ),
+                ("scored_at", models.DateTimeField(default=django.utils.timezone.now)),
+                (
+                    "use_count",
+                    models.PositiveIntegerField(default=0, verbose_name="사용 횟수"),
+                ),
+                (
+                    "food",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to="intakes.food",
+                        verbose_name="음식",
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="quick_foods",
+                        to=settings.AUTH_USER_MODEL,
+                        verbose_name="사용자",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "빠른 추가 음식",
+                "verbose_name_plural": "빠른 추가 음식 목록",
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("user", "key"), name="unique_quickfood_per_user_key"
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,30 @@
+from django.db import migrations
+
+# PostgreSQL 전용: 음식 이름 부분일치/유사도 검색용 trigram GIN 인덱스
+# (ILIKE '%q%' 와 name % q 모두 이 인덱스 사용, SQLite 는 건너뜀 → intakes.food_search 의 접두사 색인)
+CREATE_SQL = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    "CREATE INDEX IF NOT EXISTS food_name_trgm_idx ON intakes_food USING gin (name gin_trgm_ops)",
+]
+DROP_SQL = ["DROP INDEX IF EXISTS food_name_trgm_idx"]
+
+
+def _run(statements):
+    def run(apps, schema_editor):
+        if schema_editor.connection.vendor != "postgresql":
+            return
+        for sql in statements:
+            schema_editor.execute(sql)
+
+    return run
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("intakes", "0009_quickfood"),
+    ]
+
+    operations = [
+        migrations.RunPython(_run(CREATE_SQL), _run(DROP_SQL)),
+    ]
@@ -1,4 +1,6 @@
 from django.db import models
+from django.db.models import Case, F, Q, Value, When
+from django.db.models.functions import Coalesce
 from django.db.models.signals import post_save, post_delete
 from django.dispatch import receiver
 from django.utils import timezone
@@ -39,6 +41,45 @@ class Meal(models.Model):
     class Meta:
         verbose_name = "식사"
         verbose_name_plural = "식사 목록"
+        constraints = [
+            # get_or_create(user, log_date, meal_type) 동시 호출 시 중복 방지
+            # (user, log_date) 조회(meal__user + meal__log_date)도 이 인덱스의 앞부분으로 처리
+            models.UniqueConstraint(
+                fields=("user", "log_date", "meal_type"),
+                name="unique_meal_per_user_date_type",
+            ),
+        ]
+        indexes = [
+            # 목록 커서 페이지네이션 (user, log_date, id)
+            models.Index(fields=("user", "log_date", "id"), name="meal_user_date_id_idx"),
+        ]
+
+
+NUTRIENT_SOURCES = (
+    # (출력 키, Food 100g 기준 필드, MealItem 자유입력 필드)
+    ("kcal", "kcal_per_100g", "kcal"),
+    ("protein_g", "protein_g_per_100g", "protein_g"),
+    ("carb_g", "carb_g_per_100g", "carb_g"),
+    ("fat_g", "fat_g_per_100g", "fat_g"),
+)
+
+
+class MealItemQuerySet(models.QuerySet):
+    def with_nutrients(self):
+        """
+        resolved_nutrients()와 같은 규칙을 SQL로 계산해 nutr_<key> 로 주석.
+        - food + grams(≠0) 이면 Food 100g 값 × grams/100, 아니면 자유입력 값(없으면 0)
+        - 직렬화 시 행마다 obj.food 를 파이썬에서 다시 계산하지 않도록 사용
+        """
+        has_food = Q(food__isnull=False, grams__isnull=False) & ~Q(grams=0)
+        return self.annotate(**{
+            f"nutr_{key}": Case(
+                When(has_food, then=F(f"food__{per100}") * (F("grams") / Value(100.0))),
+                default=Coalesce(F(own), Value(0.0)),
+                output_field=models.FloatField(),
+            )
+            for key, per100, own in NUTRIENT_SOURCES
+        })
 
 
 class MealItem(models.Model):
@@ -52,6 +93,8 @@ class MealItem(models.Model):
     carb_g = models.FloatField(null=True, blank=True, verbose_name="탄수화물(g)")
     fat_g = models.FloatField(null=True, blank=True, verbose_name="지방(g)")
     photo = models.ImageField(upload_to="meals/%Y/%m/%d/", null=True, blank=True)
+    # 썸네일(intakes.thumbnails) 생성 완료 여부 — 완료 전에는 원본 사진으로 대체
+    thumbs_ready = models.BooleanField(default=False)
     serving_g = models.FloatField(null=True, blank=True)
     source = models.CharField(max_length=20, default='csv')  # 'db'|'csv'|'csv_estimate'|'default'
     ai_label = models.CharField(max_length=200, null=True, blank=True)
@@ -59,11 +102,16 @@ class MealItem(models.Model):
 
     created_at = models.DateTimeField(auto_now_add=True)
 
+    objects = MealItemQuerySet.as_manager()
+
     def __str__(self):
         base = self.food.name if self.food else (self.name or "항목")
         return f"{base} - {self.grams or 0:g}g"
 
     def resolved_nutrients(self):
+        # with_nutrients()로 조회했다면 SQL 계산값 사용 (food 추가 조회 없음)
+        if hasattr(self, "nutr_kcal"):
+            return {key: getattr(self, f"nutr_{key}") for key, _, _ in NUTRIENT_SOURCES}
         # food + grams 있으면 DB값을 활용, 없으면 자유입력 사용
         if self.food and self.grams:
             f = self.grams / 100.0
@@ -109,7 +157,7 @@ class NutritionLog(models.Model):
 
     def recalc(self):
         # 해당 날짜의 MealItem 합산
-        items = MealItem.objects.filter(meal__user=self.user, meal__log_date=self.date)
+        items = list(MealItem.objects.filter(meal__user=self.user, meal__log_date=self.date).with_nutrients())
         self.kcal_total = sum(i.resolved_nutrients()["kcal"] for i in items)
         self.protein_total_g = sum(i.resolved_nutrients()["protein_g"] for i in items)
         self.carb_total_g = sum(i.resolved_nutrients()["carb_g"] for i in items)
@@ -117,6 +165,99 @@ class NutritionLog(models.Model):
         self.save()
 
 
+class QuickFood(models.Model):
+    """
+    사용자별 최근/자주 먹는 음식 (빠른 추가 목록).
+    - MealItem 생성 시 갱신 (intakes.quick_foods.record_use)
+    - score: 사용할 때마다 +1, 시간이 지나면 반감기(QUICK_FOODS_HALF_LIFE_DAYS)로 감쇠
+    - 사용자당 최대 QUICK_FOODS_MAX 개, 넘치면 점수 낮은 것부터 삭제
+    """
+    ORIGINS = (("photo", "사진 분석"), ("search", "검색/직접 입력"))
+
+    user = models.ForeignKey(
+        "users.CustomUser",
+        on_delete=models.CASCADE,
+        related_name="quick_foods",
+        verbose_name="사용자",
+    )
+    # food:<id> 또는 name:<정규화 이름>
+    key = models.CharField(max_length=140, verbose_name="식별 키")
+    food = models.ForeignKey(Food, on_delete=models.CASCADE, null=True, blank=True, verbose_name="음식")
+    name = models.CharField(max_length=120, blank=True, default="", verbose_name="이름")
+    grams = models.FloatField(null=True, blank=True, verbose_name="중량(g)")
+    kcal = models.FloatField(null=True, blank=True, verbose_name="열량(kcal)")
+    protein_g = models.FloatField(null=True, blank=True, verbose_name="단백질(g)")
+    carb_g = models.FloatField(null=True, blank=True, verbose_name="탄수화물(g)")
+    fat_g = models.FloatField(null=True, blank=True, verbose_name="지방(g)")
+    source = models.CharField(max_length=20, default="csv")
+    origin = models.CharField(max_length=10, choices=ORIGINS, default="search", verbose_name="처음 기록 경로")
+    score = models.FloatField(default=0.0, verbose_name="감쇠 빈도 점수(scored_at 기준)")
+    scored_at = models.DateTimeField(default=timezone.now)
+    use_count = models.PositiveIntegerField(default=0, verbose_name="사용 횟수")
+
+    class Meta:
+        verbose_name = "빠른 추가 음식"
+        verbose_name_plural = "빠른 추가 음식 목록"
+        constraints = [
+            models.UniqueConstraint(fields=("user", "key"), name="unique_quickfood_per_user_key"),
+        ]
+
+    def __str__(self):
+        return f"{self.user_id} {self.key} ({self.score:.2f})"
+
+
+class PhotoBlob(models.Model):
+    """
+    내용 해시(sha256)로 저장한 식사 사진 원본 1개.
+    - 같은 바이트는 한 번만 저장 (meals/blobs/ab/cd/<sha256>.<ext>)
+    - ref_count: 이 파일을 가리키는 MealItem 수 (intakes.photo_store 시그널이 유지)
+    - ref_count=0 이고 오래된 것(커밋되지 않은 프리뷰 업로드 포함)은 gc_photo_blobs 가 삭제
+    """
+    sha256 = models.CharField(max_length=64, unique=True, verbose_name="SHA-256")
+    name = models.CharField(max_length=255, unique=True, verbose_name="스토리지 경로")
+    size = models.PositiveIntegerField(default=0, verbose_name="크기(bytes)")
+    ref_count = models.IntegerField(default=0, verbose_name="참조 수")
+    created_at = models.DateTimeField(auto_now_add=True)
+    last_uploaded_at = models.DateTimeField(default=timezone.now, verbose_name="마지막 업로드")
+
+    class Meta:
+        verbose_name = "사진 원본"
+        verbose_name_plural = "사진 원본 목록"
+        indexes = [
+            # GC 대상 조회: ref_count=0 AND last_uploaded_at < 기준
+            models.Index(fields=("ref_count", "last_uploaded_at"), name="photoblob_gc_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.name} (refs={self.ref_count})"
+
+
+class PendingUpload(models.Model):
+    """
+    meal_analyze 가 선저장한 업로드(프리뷰/익명 포함) 추적용.
+    - 업로드마다 기록, MealItem 이 사진을 참조하면 삭제 (intakes.photo_store 시그널)
+    - TTL 이 지나도 남아 있으면 커밋되지 않은 업로드 → gc_pending_uploads 가 파일과 함께 삭제
+    """
+    name = models.CharField(max_length=255, unique=True, verbose_name="스토리지 경로")
+    size = models.PositiveIntegerField(default=0, verbose_name="크기(bytes)")
+    user = models.ForeignKey(
+        "users.CustomUser",
+        null=True,
+        blank=True,
+        on_delete=models.SET_NULL,
+        related_name="+",
+        verbose_name="업로드 사용자(익명은 비움)",
+    )
+    created_at = models.DateTimeField(default=timezone.now, db_index=True, verbose_name="업로드 시각")
+
+    class Meta:
+        verbose_name = "미확정 업로드"
+        verbose_name_plural = "미확정 업로드 목록"
+
+    def __str__(self):
+        return f"{self.name} ({self.created_at:%Y-%m-%d %H:%M})"
+
+
 # ---------------- signals ---------------- #
 @receiver([post_save, post_delete], sender=MealItem)
 @receiver([post_save, post_delete], sender=Meal)
@@ -0,0 +1,215 @@
+"""
+intakes/photo_store.py
+
+내용 주소(content-addressed) 사진 저장소 + 참조 수 관리.
+
+- store_photo(bytes): sha256 경로에 한 번만 저장, 같은 바이트 재업로드/프리뷰 재시도는 기존 파일 재사용
+- MealItem 생성/사진 변경/삭제 시 PhotoBlob.ref_count 를 시그널로 증감
+  (raw DELETE 처럼 시그널을 거치지 않는 경로는 release_photos() 를 직접 호출)
+- 참조 0 + 유예 시간 경과 → delete_blobs() 로 원본/썸네일 삭제 (manage.py gc_photo_blobs)
+- 선저장 업로드는 PendingUpload 에 기록, MealItem 에 연결되면 기록 삭제
+  → TTL 지나도 남은 것은 manage.py gc_pending_uploads 가 정리
+"""
+import hashlib
+import logging
+import posixpath
+from collections import Counter
+
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.db import transaction
+from django.db.models import F
+from django.db.models.signals import post_delete, post_init, post_save, pre_delete, pre_save
+from django.dispatch import receiver
+from django.utils import timezone
+
+from .models import MealItem, PendingUpload, PhotoBlob
+from .thumbnails import thumb_names
+
+logger = logging.getLogger(__name__)
+
+BLOB_PREFIX = "meals/blobs"
+ALLOWED_EXTS = {"jpg", "jpeg", "png", "webp", "heic"}
+# S3 DeleteObjects 한 요청당 최대 키 수
+S3_DELETE_BATCH = 1000
+
+
+def blob_name(digest, ext):
+    return posixpath.join(BLOB_PREFIX, digest[:2], digest[2:4], f"{digest}.{ext}")
+
+
+def store_photo(image_bytes, ext_hint="jpg"):
+    """업로드 바이트 저장 후 스토리지 이름 반환. 같은 내용이면 기존 파일 이름."""
+    digest = hashlib.sha256(image_bytes).hexdigest()
+    now = timezone.now()
+    blob = PhotoBlob.objects.filter(sha256=digest).first()
+    if blob:
+        PhotoBlob.objects.filter(pk=blob.pk).update(last_uploaded_at=now)
+        return blob.name
+
+    ext = (ext_hint or "jpg").lower().lstrip(".")
+    if ext not in ALLOWED_EXTS:
+        ext = "jpg"
+    name = blob_name(digest, ext)
+    if not default_storage.exists(name):
+        saved = default_storage.save(name, ContentFile(image_bytes))
+        if saved != name:  # 경로가 바뀌면 내용 주소가 깨지므로 즉시 알림
+            logger.warning("photo_store: storage renamed %s -> %s", name, saved)
+            name = saved
+    blob, _ = PhotoBlob.objects.get_or_create(
+        sha256=digest, defaults={"name": name, "size": len(image_bytes), "last_uploaded_at": now}
+    )
+    return blob.name
+
+
+def track_pending(name, size, user=None):
+    """선저장 업로드 기록. 같은 파일을 다시 올리면 업로드 시각만 갱신(TTL 재시작)."""
+    PendingUpload.objects.update_or_create(
+        name=name,
+        defaults={"size": size, "user": user if getattr(user, "is_authenticated", False) else None,
+                  "created_at": timezone.now()},
+    )
+
+
+def is_known_photo(name):
+    return bool(name) and PhotoBlob.objects.filter(name=name).exists()
+
+
+def adjust_refs(deltas):
+    """{name: +n/-n} 만큼 ref_count 증감. 블롭이 아닌(예전 uuid 경로) 이름은 무시."""
+    for name, delta in deltas.items():
+        if name and delta:  # None 키(사진 없음) 무시
+            PhotoBlob.objects.filter(name=name).update(ref_count=F("ref_count") + delta)
+
+
+def release_photos(names):
+    """시그널 없이 삭제된 MealItem들의 사진 참조 반환. 반환: 참조가 0이 된 블롭 이름 목록."""
+    counts = Counter(n for n in names if n)
+    adjust_refs({n: -c for n, c in counts.items()})
+    return list(PhotoBlob.objects.filter(name__in=list(counts), ref_count__lte=0).values_list("name", flat=True))
+
+
+def delete_files(names):
+    """
+    스토리지 파일 일괄 삭제. 반환: 삭제 실패한 이름 집합.
+    - S3: DeleteObjects 로 최대 1000개씩 한 요청
+    - 그 외(로컬 파일시스템 등): 하나씩 delete()
+    """
+    names = [n for n in dict.fromkeys(names) if n]
+    bucket = getattr(default_storage, "bucket", None)
+    if bucket is None or not hasattr(default_storage, "_normalize_name"):
+        failed = set()
+        for name in names:
+            try:
+                default_storage.delete(name)
+            except Exception:
+                logger.warning("photo_store: delete failed: %s", name, exc_info=True)
+                failed.add(name)
+        return failed
+
+    from storages.utils import clean_name
+
+    failed = set()
+    for off in range(0, len(names), S3_DELETE_BATCH):
+        chunk = names[off: off + S3_DELETE_BATCH]
+        keys = {default_storage._normalize_name(clean_name(n)): n for n in chunk}
+        try:
+            resp = bucket.delete_objects(
+                Delete={"Objects": [{"Key": k} for k in keys], "Quiet": True}
+            )
+        except Exception:
+            logger.warning("photo_store: batch delete failed (%d keys)", len(keys), exc_info=True)
+            failed.update(chunk)
+            continue
+        for err in resp.get("Errors", []):
+            logger.warning("photo_store: delete failed: %s (%s)", err.get("Key"), err.get("Code"))
+            failed.add(keys.get(err.get("Key"), err.get("Key")))
+    return failed
+
+
+def delete_blobs(names, cutoff=None):
+    """
+    참조 0 블롭의 원본/썸네일/행 삭제. MealItem 이 여전히 가리키면 건너뜀.
+    cutoff(기본: 지금) 이후에 다시 업로드된 블롭도 건너뜀
+    → 호출한 쪽이 대상을 고른 뒤 store_photo 가 재사용한 파일은 지우지 않음.
+    반환: (삭제 개수, 회수 bytes)
+    """
+    names = list(names)
+    if not names:
+        return 0, 0
+    cutoff = cutoff or timezone.now()
+    in_use = set(MealItem.objects.filter(photo__in=names).values_list("photo", flat=True))
+    with transaction.atomic():
+        blobs = list(
+            PhotoBlob.objects.select_for_update()
+            .filter(name__in=[n for n in names if n not in in_use], ref_count__lte=0,
+                    last_uploaded_at__lt=cutoff)
+        )
+        failed = delete_files(f for b in blobs for f in (b.name, *thumb_names(b.name)))
+        gone = [b for b in blobs if b.name not in failed]
+        PhotoBlob.objects.filter(pk__in=[b.pk for b in gone]).delete()
+    return len(gone), sum(b.size for b in gone)
+
+
+# ─────────────────────────  ref_count 시그널  ─────────────────────────
+_DEFERRED = object()  # .only()/.defer() 로 photo 를 읽지 않은 인스턴스 표시
+
+
+def _photo_name(value):
+    return value.name if value else None
+
+
+@receiver(post_init, sender=MealItem)
+def _remember_photo(sender, instance, **kwargs):
+    # 로드 시점 사진 이름(문자열)만 기억 → 변경 감지에 추가 쿼리 없음
+    if "photo" not in instance.__dict__:
+        instance._photo_at_load = _DEFERRED
+    else:
+        instance._photo_at_load = instance.__dict__["photo"] or None
+
+
+@receiver(pre_save, sender=MealItem)
+def _load_deferred_photo(sender, instance, update_fields=None, **kwargs):
+    # photo 를 읽지 않고 로드한 뒤 새로 지정해 저장하는 경우에만 이전 값을 한 번 조회
+    if (
+        instance._photo_at_load is _DEFERRED
+        and "photo" in instance.__dict__
+        and not instance._state.adding
+        and (update_fields is None or "photo" in update_fields)
+    ):
+        instance._photo_at_load = (
+            MealItem.objects.filter(pk=instance.pk).values_list("photo", flat=True).first() or None
+        )
+
+
+@receiver(post_save, sender=MealItem)
+def _photo_ref_saved(sender, instance, created, **kwargs):
+    if "photo" not in instance.__dict__:
+        return  # photo 가 지연 로드 상태로 저장됨 → 사진은 바뀌지 않았으므로 참조 수 그대로
+    new = _photo_name(instance.photo)
+    old = None if created else instance._photo_at_load
+    if old is _DEFERRED:
+        return  # 이전 값을 알 수 없음(update_fields 에 photo 없음) → 조정하지 않음
+    if new != old:
+        adjust_refs({new: 1, old: -1})
+        if new:
+            PendingUpload.objects.filter(name=new).delete()  # 커밋됨 → 더 이상 미확정 아님
+    instance._photo_at_load = new
+
+
+@receiver(pre_delete, sender=MealItem)
+def _load_photo_before_delete(sender, instance, **kwargs):
+    # 지연 로드 상태면 행이 남아 있을 때 사진 이름을 읽어 둠 (삭제 후에는 조회 불가)
+    if "photo" not in instance.__dict__:
+        instance._photo_at_load = (
+            MealItem.objects.filter(pk=instance.pk).values_list("photo", flat=True).first() or None
+        )
+
+
+@receiver(post_delete, sender=MealItem)
+def _photo_ref_deleted(sender, instance, **kwargs):
+    if "photo" in instance.__dict__:
+        name = _photo_name(instance.photo)
+    else:
+        name = instance._photo_at_load
+    adjust_refs({name: -1})
@@ -0,0 +1,110 @@
+"""
+intakes/photo_urls.py
+
+MealItem 사진 URL 캐시.
+
+S3(querystring_auth=True)에서는 default_storage.url() 이 호출마다 presigned URL 을 HMAC 서명으로 만든다.
+식단 페이지처럼 사진이 수백 장이면 렌더링마다 서명 비용이 쌓이므로
+- 파일 이름별로 서명된 URL 을 캐시 (TTL = 서명 만료보다 조금 짧게 → 만료된 URL 을 내주지 않음)
+- 목록 페이지는 photo_urls(names) 로 get_many / set_many 한 번씩
+- 로컬 파일시스템/퍼블릭 버킷(서명 없음)은 url() 자체가 문자열 조합이라 캐시를 거치지 않음
+- 적중/미스 횟수, 서명에 쓴 시간과 적중으로 아낀 추정 시간을 Prometheus 카운터로 노출
+"""
+import hashlib
+import logging
+import time
+
+from django.core.cache import cache
+from django.core.files.storage import default_storage
+from prometheus_client import Counter
+
+logger = logging.getLogger(__name__)
+
+# 서명 만료 대비 여유 (만료 10%, 최소 60초)
+MIN_EXPIRY_MARGIN = 60
+
+PHOTO_URL_CACHE = Counter(
+    "intakes_photo_url_cache_total", "사진 URL 캐시 조회 결과", ["result"]  # hit | miss
+)
+PHOTO_URL_SIGN_SECONDS = Counter(
+    "intakes_photo_url_sign_seconds_total", "presigned URL 서명에 쓴 시간(초)"
+)
+PHOTO_URL_SAVED_SECONDS = Counter(
+    "intakes_photo_url_saved_seconds_total", "캐시 적중으로 아낀 서명 시간 추정(초, 평균 서명 시간 × 적중)"
+)
+
+_avg_sign_seconds = 0.0
+
+
+def _signing_expiry():
+    """서명 URL을 만드는 스토리지면 만료(초), 아니면 None."""
+    if not getattr(default_storage, "querystring_auth", False):
+        return None
+    return int(getattr(default_storage, "querystring_expire", 3600) or 3600)
+
+
+def _ttl(expire):
+    return max(expire - max(MIN_EXPIRY_MARGIN, expire // 10), 0)
+
+
+def _key(name):
+    return "intakes:photourl:" + hashlib.sha1(name.encode("utf-8")).hexdigest()
+
+
+def _sign(name):
+    global _avg_sign_seconds
+    t0 = time.perf_counter()
+    url = default_storage.url(name)
+    spent = time.perf_counter() - t0
+    PHOTO_URL_SIGN_SECONDS.inc(spent)
+    # 지수 이동 평균 (적중 시 아낀 시간 추정용)
+    _avg_sign_seconds = spent if not _avg_sign_seconds else _avg_sign_seconds * 0.9 + spent * 0.1
+    return url
+
+
+def photo_urls(names):
+    """{name: url} — 빈 이름은 제외. 서명 실패한 항목은 None."""
+    names = [n for n in dict.fromkeys(names) if n]
+    if not names:
+        return {}
+
+    expire = _signing_expiry()
+    if expire is None:
+        return {n: _safe_url(n) for n in names}
+
+    keys = {n: _key(n) for n in names}
+    cached = cache.get_many(keys.values())
+    out, fresh, misses = {}, {}, 0
+    for name, key in keys.items():
+        if key in cached:
+            out[name] = cached[key]
+            continue
+        misses += 1
+        out[name] = _safe_url(name, signer=_sign)
+        if out[name]:
+            fresh[key] = out[name]
+
+    hits = len(names) - misses
+    if hits:
+        PHOTO_URL_CACHE.labels(result="hit").inc(hits)
+        PHOTO_URL_SAVED_SECONDS.inc(hits * _avg_sign_seconds)
+    if misses:
+        PHOTO_URL_CACHE.labels(result="miss").inc(misses)
+    ttl = _ttl(expire)
+    if fresh and ttl:
+        cache.set_many(fresh, ttl)
+    return out
+
+
+def photo_url(name):
+    if not name:
+        return None
+    return photo_urls([name]).get(name)
+
+
+def _safe_url(name, signer=None):
+    try:
+        return (signer or default_storage.url)(name)
+    except Exception:
+        logger.warning("photo url failed: %s", name, exc_info=True)
+        return None
@@ -0,0 +1,190 @@
+"""
+intakes/quick_foods.py
+
+사용자별 빠른 추가(최근/자주 먹는 음식) 목록.
+
+- MealItem 이 생길 때마다 record_use() 로 QuickFood 한 행 갱신 (signals.py)
+  score = 이전 score × 감쇠(경과 시간, 반감기) + 1  → 최근에 자주 먹은 음식이 위로
+- 사용자당 QUICK_FOODS_MAX 개만 유지 (넘치면 현재 점수 낮은 것부터 삭제)
+- GET /api/foods/quick/ 는 캐시된 목록을 그대로 반환, 갱신 시 커밋 후 캐시 삭제
+- POST /api/foods/quick/log/ 로 한 번에 기록 → 사진 분석(HF)·음식 검색을 건너뜀
+  건너뛴 횟수는 intakes_quick_add_avoided_total{kind="hf_call"|"food_search"} 로 집계
+"""
+import math
+import re
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.utils import timezone
+from prometheus_client import Counter
+
+from .models import QuickFood
+
+QUICK_ADD_AVOIDED = Counter(
+    "intakes_quick_add_avoided_total",
+    "빠른 추가로 생략된 작업 수",
+    ["kind"],  # hf_call: 사진 분석으로 처음 기록된 음식 | food_search: 검색/직접 입력으로 기록된 음식
+)
+
+CACHE_TIMEOUT = 60 * 60 * 24
+
+
+def _max_entries():
+    return int(getattr(settings, "QUICK_FOODS_MAX", 30))
+
+
+def _half_life_seconds():
+    return float(getattr(settings, "QUICK_FOODS_HALF_LIFE_DAYS", 14)) * 86400
+
+
+def _cache_key(user_id):
+    return f"intakes:quickfoods:{user_id}"
+
+
+def decayed(score, scored_at, now):
+    elapsed = max((now - scored_at).total_seconds(), 0.0)
+    return score * math.pow(0.5, elapsed / _half_life_seconds())
+
+
+def item_key(item):
+    if item.food_id:
+        return f"food:{item.food_id}"
+    name = re.sub(r"\s+", " ", (item.name or "")).strip().lower()
+    return f"name:{name[:120]}" if name else None
+
+
+def record_use(item):
+    """MealItem 생성 1건 반영. 이름도 음식도 없는 항목은 무시."""
+    key = item_key(item)
+    if not key:
+        return
+    user_id = item.meal.user_id
+    now = timezone.now()
+    values = {
+        "food_id": item.food_id,
+        "name": item.name or "",
+        "grams": item.grams,
+        "kcal": item.kcal,
+        "protein_g": item.protein_g,
+        "carb_g": item.carb_g,
+        "fat_g": item.fat_g,
+        "source": item.source or "csv",
+    }
+    with transaction.atomic():
+        entry, created = QuickFood.objects.select_for_update().get_or_create(
+            user_id=user_id,
+            key=key,
+            defaults={**values, "origin": "photo" if item.photo else "search", "scored_at": now},
+        )
+        # 마지막 기록 값(중량/영양소)으로 갱신, 처음 기록 경로(origin)는 유지
+        for field, value in values.items():
+            setattr(entry, field, value)
+        entry.score = decayed(entry.score, entry.scored_at, now) + 1.0
+        entry.scored_at = now
+        entry.use_count += 1
+        entry.save()
+        if created:
+            _trim(user_id, now)
+    transaction.on_commit(lambda: cache.delete(_cache_key(user_id)))
+
+
+def _trim(user_id, now):
+    rows = list(QuickFood.objects.filter(user_id=user_id).values_list("id", "score", "scored_at"))
+    limit = _max_entries()
+    if len(rows) <= limit:
+        return
+    rows.sort(key=lambda r: decayed(r[1], r[2], now), reverse=True)
+    QuickFood.objects.filter(id__in=[r[0] for r in rows[limit:]]).delete()
+
+
+def rebuild_for_user(user_id, since=None):
+    """
+    기존 MealItem 기록을 시간순으로 다시 재생해 목록 재구성 (manage.py rebuild_quick_foods).
+    반환: 저장한 항목 수.
+    """
+    from .models import MealItem
+
+    qs = MealItem.objects.filter(meal__user_id=user_id).order_by("created_at", "id")
+    if since:
+        qs = qs.filter(created_at__gte=since)
+    entries = {}
+    for item in qs.select_related("meal").iterator():
+        key = item_key(item)
+        if not key:
+            continue
+        entry = entries.get(key)
+        if entry is None:
+            entry = entries[key] = QuickFood(
+                user_id=user_id, key=key, origin="photo" if item.photo else "search", scored_at=item.created_at
+            )
+        entry.food_id = item.food_id
+        entry.name = item.name or ""
+        entry.grams, entry.kcal, entry.protein_g = item.grams, item.kcal, item.protein_g
+        entry.carb_g, entry.fat_g, entry.source = item.carb_g, item.fat_g, item.source or "csv"
+        entry.score = decayed(entry.score, entry.scored_at, item.created_at) + 1.0
+        entry.scored_at = item.created_at
+        entry.use_count += 1
+
+    now = timezone.now()
+    keep = sorted(entries.values(), key=lambda e: decayed(e.score, e.scored_at, now), reverse=True)
+    keep = keep[: _max_entries()]
+    with transaction.atomic():
+        QuickFood.objects.filter(user_id=user_id).delete()
+        QuickFood.objects.bulk_create(keep)
+    cache.delete(_cache_key(user_id))
+    return len(keep)
+
+
+def _nutrients(entry):
+    food = entry.food
+    if food and entry.grams:
+        f = entry.grams / 100.0
+        return {
+            "kcal": food.kcal_per_100g * f,
+            "protein_g": food.protein_g_per_100g * f,
+            "carb_g": food.carb_g_per_100g * f,
+            "fat_g": food.fat_g_per_100g * f,
+        }
+    return {
+        "kcal": entry.kcal or 0,
+        "protein_g": entry.protein_g or 0,
+        "carb_g": entry.carb_g or 0,
+        "fat_g": entry.fat_g or 0,
+    }
+
+
+def _build(user_id):
+    now = timezone.now()
+    entries = list(QuickFood.objects.filter(user_id=user_id).select_related("food"))
+    entries.sort(key=lambda e: decayed(e.score, e.scored_at, now), reverse=True)
+    return [
+        {
+            "key": e.key,
+            "food": e.food_id,
+            "name": e.food.name if e.food else e.name,
+            "grams": e.grams,
+            "nutrients": {k: round(v, 1) for k, v in _nutrients(e).items()},
+            "use_count": e.use_count,
+            "last_used_at": e.scored_at.isoformat(),
+            "origin": e.origin,
+        }
+        for e in entries
+    ]
+
+
+def quick_foods(user_id):
+    """점수 순 목록 (캐시 우선). 캐시가 없을 때만 DB 1회 조회."""
+    data = cache.get(_cache_key(user_id))
+    if data is None:
+        data = _build(user_id)
+        cache.set(_cache_key(user_id), data, CACHE_TIMEOUT)
+    return data
+
+
+def get_entry(user_id, key):
+    return QuickFood.objects.filter(user_id=user_id, key=key).first()
+
+
+def record_avoided(entry):
+    QUICK_ADD_AVOIDED.labels(kind="hf_call" if entry.origin == "photo" else "food_search").inc()
@@ -1,7 +1,8 @@
 # intakes/serializers.py
 from decimal import Decimal, InvalidOperation
 from rest_framework import serializers
-from .models import Food, Meal, MealItem, NutritionLog
+from .models import NUTRIENT_SOURCES, Food, Meal, MealItem, NutritionLog
+from .thumbnails import thumbnail_urls
 
 
 # ---------------------------
@@ -25,9 +26,9 @@ class NumericCoerceSerializer(serializers.ModelSerializer):
 
     def to_representation(self, instance):
         data = super().to_representation(instance)
-        numeric_fields = getattr(self.Meta, "numeric_fields", ())
-        for f in numeric_fields:
-            if f in data:
+        # FloatField 값은 이미 float → Decimal/str 로 들어온 값만 변환
+        for f in getattr(self.Meta, "numeric_fields", ()):
+            if isinstance(data.get(f), (Decimal, str)):
                 data[f] = self._coerce_number(data[f])
         return data
 
@@ -42,6 +43,35 @@ class FoodSerializer(NumericCoerceSerializer):
         # 필요 시 여기에 numeric_fields = [...] 추가 가능
 
 
+# ---------------------------
+# 목록 직렬화: 페이지의 썸네일 URL 을 한 번에 (캐시 get_many 1회, photo_urls 와 같은 방식)
+# - Meal 목록이면 각 끼니의 items 까지 모아서 → 중첩 items 직렬화 때는 context 에서 꺼내기만
+# ---------------------------
+THUMBS_CONTEXT_KEY = "photo_thumbs"
+
+
+def _photo_items(rows):
+    for row in rows:
+        if isinstance(row, Meal):
+            yield from row.items.all()
+        else:
+            yield row
+
+
+class PhotoThumbsListSerializer(serializers.ListSerializer):
+    def to_representation(self, data):
+        rows = list(data.all() if hasattr(data, "all") else data)
+        thumbs = self.context.setdefault(THUMBS_CONTEXT_KEY, {})
+        missing = {
+            it.photo.name
+            for it in _photo_items(rows)
+            if it.photo and it.thumbs_ready and it.photo.name not in thumbs
+        }
+        if missing:
+            thumbs.update(thumbnail_urls(missing))
+        return super().to_representation(rows)
+
+
 # ---------------------------
 # MealItem
 # - (food + grams) 이면 DB 100g 기준으로 자동계산
@@ -52,6 +82,7 @@ class FoodSerializer(NumericCoerceSerializer):
 class MealItemSerializer(NumericCoerceSerializer):
     food_name = serializers.ReadOnlyField(source="food.name")
     nutrients = serializers.SerializerMethodField(read_only=True)
+    photo_thumbs = serializers.SerializerMethodField(read_only=True)
 
     class Meta:
         model = MealItem
@@ -67,14 +98,32 @@ class MealItemSerializer(NumericCoerceSerializer):
             "carb_g",
             "fat_g",
             "nutrients",
+            "photo_thumbs",
         ]
         # 숫자 직렬화 강제 대상
         numeric_fields = ["kcal", "protein_g", "carb_g", "fat_g"]
+        list_serializer_class = PhotoThumbsListSerializer
 
     def get_nutrients(self, obj):
-        # 모델 메서드에서 food+grams 우선 로직/반올림 등을 처리한다고 가정
+        # with_nutrients()로 조회한 경우 SQL 계산값, 아니면 모델 메서드에서 계산
         return obj.resolved_nutrients()
 
+    def get_photo_thumbs(self, obj):
+        # {"128": url, "384": url, "1024": url} — 썸네일 생성 전이면 None
+        if not (obj.photo and obj.thumbs_ready):
+            return None
+        thumbs = self.context.get(THUMBS_CONTEXT_KEY) or {}
+        if obj.photo.name in thumbs:
+            return thumbs[obj.photo.name]
+        return thumbnail_urls([obj.photo.name]).get(obj.photo.name)
+
+    def update(self, instance, validated_data):
+        instance = super().update(instance, validated_data)
+        # 수정 후에는 조회 시점의 SQL 계산값(nutr_*)이 낡았으므로 버림
+        for key, _, _ in NUTRIENT_SOURCES:
+            instance.__dict__.pop(f"nutr_{key}", None)
+        return instance
+
     def validate(self, attrs):
         """
         허용 조합:
@@ -139,6 +188,23 @@ class MealSerializer(serializers.ModelSerializer):
             "items",
         ]
         read_only_fields = ["user", "items"]
+        list_serializer_class = PhotoThumbsListSerializer
+
+    def validate(self, attrs):
+        # user 가 read-only 라 (user, log_date, meal_type) 중복은 DB 제약 전에 여기서 400 으로
+        request = self.context.get("request")
+        user = self.instance.user if self.instance else getattr(request, "user", None)
+        log_date = attrs.get("log_date", getattr(self.instance, "log_date", None))
+        meal_type = attrs.get("meal_type", getattr(self.instance, "meal_type", None))
+        if user is not None and getattr(user, "is_authenticated", False) and log_date and meal_type:
+            dup = Meal.objects.filter(user=user, log_date=log_date, meal_type=meal_type)
+            if self.instance is not None:
+                dup = dup.exclude(pk=self.instance.pk)
+            if dup.exists():
+                raise serializers.ValidationError(
+                    {"meal_type": "같은 날짜에 이미 같은 끼니가 있습니다. (POST /api/meals/ensure/ 사용)"}
+                )
+        return attrs
 
 
 # ---------------------------
@@ -8,12 +8,18 @@ MealItem이 추가/수정/삭제될 때, 같은 유저/날짜의 NutritionLog 
 - source of truth는 MealItem
 - NutritionLog는 '하루 합계 캐시'(읽기 전용 느낌)
 - post_save/post_delete 훅으로 항상 일관성 유지
+- 같은 훅에서 (user, date) 버전도 올려 by-date 조회의 ETag 를 무효화 (etags.py)
+- MealItem 이 다른 Meal(다른 날짜)로 옮겨지면 이전 (user, date)도 재계산/무효화
 """
-from django.db.models.signals import post_save, post_delete
+from django.db.models.signals import post_init, post_save, post_delete
 from django.dispatch import receiver
 from django.db.models import Sum
 
-from .models import MealItem, NutritionLog
+from .etags import bump_day_version
+from .food_search import bump_catalog_version
+from .quick_foods import record_use
+from .thumbnails import schedule_thumbnails
+from .models import Food, Meal, MealItem, NutritionLog
 
 
 def recalc_nutritionlog(user, log_date):
@@ -32,8 +38,8 @@ def recalc_nutritionlog(user, log_date):
         carb=Sum("carb_g"),
     )
 
-    # 없으면 생성(get_or_create), 있으면 업데이트
-    log, _ = NutritionLog.objects.get_or_create(user=user, date=log_date)
+    # 없으면 생성(get_or_create), 있으면 업데이트 (user 는 인스턴스 또는 id)
+    log, _ = NutritionLog.objects.get_or_create(user_id=getattr(user, "pk", user), date=log_date)
     log.kcal_total = agg["kcal"] or 0
     log.protein_total_g = agg["protein"] or 0
     log.fat_total_g = agg["fat"] or 0
@@ -41,15 +47,36 @@ def recalc_nutritionlog(user, log_date):
     log.save()
 
 
+@receiver(post_init, sender=MealItem)
+def mealitem_remember_meal(sender, instance, **kwargs):
+    # 로드 시점 meal_id 기억 → 저장 시 Meal 이 바뀌었는지 추가 쿼리 없이 판단
+    instance._meal_id_at_load = instance.__dict__.get("meal_id")
+
+
+def _moved_from(instance):
+    """다른 Meal 로 옮겨졌으면 이전 Meal 의 (user_id, log_date), 아니면 None."""
+    old_id = getattr(instance, "_meal_id_at_load", None)
+    if not old_id or old_id == instance.meal_id:
+        return None
+    return Meal.objects.filter(pk=old_id).values_list("user_id", "log_date").first()
+
+
 @receiver(post_save, sender=MealItem)
 def mealitem_saved(sender, instance, **kwargs):
     """
     MealItem 생성/수정 후 NutritionLog 재계산.
+    다른 Meal 로 옮겨졌으면 이전 날짜 합계와 ETag 도 갱신.
     """
     user = instance.meal.user
     log_date = instance.meal.log_date
     recalc_nutritionlog(user, log_date)
 
+    old = _moved_from(instance)
+    if old and old != (user.id, log_date):
+        recalc_nutritionlog(old[0], old[1])
+        bump_day_version(*old)
+    instance._meal_id_at_load = instance.meal_id
+
 
 @receiver(post_delete, sender=MealItem)
 def mealitem_deleted(sender, instance, **kwargs):
@@ -59,3 +86,58 @@ def mealitem_deleted(sender, instance, **kwargs):
     user = instance.meal.user
     log_date = instance.meal.log_date
     recalc_nutritionlog(user, log_date)
+
+
+# ─────────────────────────  by-date ETag 무효화  ─────────────────────────
+@receiver(post_init, sender=Meal)
+def meal_remember_date(sender, instance, **kwargs):
+    # 로드 시점 날짜 기억 → 다른 날짜로 옮기면 이전 날짜도 무효화
+    instance._log_date_at_load = instance.__dict__.get("log_date")
+
+
+@receiver(post_save, sender=Meal)
+@receiver(post_delete, sender=Meal)
+def meal_changed_bump_version(sender, instance, **kwargs):
+    bump_day_version(instance.user_id, instance.log_date)
+    old = getattr(instance, "_log_date_at_load", None)
+    if old and str(old) != str(instance.log_date):
+        bump_day_version(instance.user_id, old)
+        if kwargs.get("signal") is post_save:
+            # 항목이 함께 옮겨졌으므로 두 날짜 합계 모두 다시 계산
+            recalc_nutritionlog(instance.user_id, old)
+            recalc_nutritionlog(instance.user_id, instance.log_date)
+    instance._log_date_at_load = instance.log_date
+
+
+@receiver(post_save, sender=MealItem)
+@receiver(post_delete, sender=MealItem)
+def mealitem_changed_bump_version(sender, instance, **kwargs):
+    meal = instance.meal
+    bump_day_version(meal.user_id, meal.log_date)
+
+
+@receiver(post_save, sender=NutritionLog)
+@receiver(post_delete, sender=NutritionLog)
+def nutritionlog_changed_bump_version(sender, instance, **kwargs):
+    bump_day_version(instance.user_id, instance.date)
+
+
+# ─────────────────────────  사진 썸네일  ─────────────────────────
+@receiver(post_save, sender=MealItem)
+def mealitem_schedule_thumbnails(sender, instance, **kwargs):
+    if instance.photo and not instance.thumbs_ready:
+        schedule_thumbnails(instance.photo.name)
+
+
+# ─────────────────────────  빠른 추가 목록  ─────────────────────────
+@receiver(post_save, sender=MealItem)
+def mealitem_record_quick_food(sender, instance, created, **kwargs):
+    if created:
+        record_use(instance)
+
+
+# ─────────────────────────  음식 검색 색인  ─────────────────────────
+@receiver(post_save, sender=Food)
+@receiver(post_delete, sender=Food)
+def food_changed_bump_catalog(sender, instance, **kwargs):
+    bump_catalog_version()
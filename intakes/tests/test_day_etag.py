@@ -0,0 +1,120 @@
+from datetime import date
+
+import pytest
+from django.core.cache import cache
+from prometheus_client import REGISTRY
+
+from intakes.models import Meal, MealItem
+
+D = date(2025, 4, 1)
+
+
+def _hits(endpoint, result):
+    return REGISTRY.get_sample_value(
+        "intakes_conditional_get_total", {"endpoint": endpoint, "result": result}
+    ) or 0.0
+
+
+@pytest.fixture
+def etag_on(settings):
+    settings.DAY_ETAG_ENABLED = True
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.mark.django_db
+def test_meals_by_date_etag_and_invalidation(
+    auth_client, user, etag_on, django_assert_max_num_queries, django_capture_on_commit_callbacks
+):
+    url = f"/api/meals/by-date/?log_date={D.isoformat()}"
+    with django_capture_on_commit_callbacks(execute=True):
+        meal = Meal.objects.create(user=user, log_date=D, meal_type="점심")
+        MealItem.objects.create(meal=meal, name="김밥", kcal=320)
+
+    r1 = auth_client.get(url)
+    assert r1.status_code == 200
+    etag = r1["ETag"]
+
+    before = _hits("meals_by_date", "not_modified")
+    # 인증(사용자 조회) 외에는 DB를 건드리지 않음
+    with django_assert_max_num_queries(1):
+        r2 = auth_client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert r2.status_code == 304
+    assert r2["ETag"] == etag
+    assert _hits("meals_by_date", "not_modified") == before + 1
+
+    # 같은 날짜에 항목 추가 → 버전 증가 → 200
+    with django_capture_on_commit_callbacks(execute=True):
+        MealItem.objects.create(meal=meal, name="라면", kcal=500)
+    r3 = auth_client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert r3.status_code == 200
+    assert r3["ETag"] != etag
+    assert len(r3.json()[0]["items"]) == 2
+
+    # 다른 날짜 변경은 영향 없음
+    with django_capture_on_commit_callbacks(execute=True):
+        Meal.objects.create(user=user, log_date=date(2025, 4, 2), meal_type="점심")
+    assert auth_client.get(url, HTTP_IF_NONE_MATCH=r3["ETag"]).status_code == 304
+
+
+@pytest.mark.django_db
+def test_nutritionlog_by_date_etag(auth_client, user, etag_on, django_capture_on_commit_callbacks):
+    url = f"/api/nutritionlogs/by-date/?log_date={D.isoformat()}"
+    with django_capture_on_commit_callbacks(execute=True):
+        meal = Meal.objects.create(user=user, log_date=D, meal_type="저녁")
+        MealItem.objects.create(meal=meal, name="김밥", kcal=320)
+
+    r1 = auth_client.get(url)
+    assert r1.status_code == 200 and r1.json()["kcal_total"] == 320.0
+    assert auth_client.get(url, HTTP_IF_NONE_MATCH=r1["ETag"]).status_code == 304
+
+    with django_capture_on_commit_callbacks(execute=True):
+        MealItem.objects.create(meal=meal, name="우유", kcal=130)
+    r2 = auth_client.get(url, HTTP_IF_NONE_MATCH=r1["ETag"])
+    assert r2.status_code == 200 and r2.json()["kcal_total"] == 450.0
+
+
+@pytest.mark.django_db
+def test_moving_item_to_other_day_invalidates_both_days(
+    auth_client, user, etag_on, django_capture_on_commit_callbacks
+):
+    other = date(2025, 4, 2)
+    with django_capture_on_commit_callbacks(execute=True):
+        src = Meal.objects.create(user=user, log_date=D, meal_type="점심")
+        dst = Meal.objects.create(user=user, log_date=other, meal_type="점심")
+        item = MealItem.objects.create(meal=src, name="김밥", kcal=320)
+
+    urls = [f"/api/nutritionlogs/by-date/?log_date={d.isoformat()}" for d in (D, other)]
+    etags = [auth_client.get(u)["ETag"] for u in urls]
+
+    with django_capture_on_commit_callbacks(execute=True):
+        r = auth_client.patch(f"/api/mealitems/{item.id}/", {"meal": dst.id}, format="json")
+    assert r.status_code == 200
+
+    old_day = auth_client.get(urls[0], HTTP_IF_NONE_MATCH=etags[0])
+    new_day = auth_client.get(urls[1], HTTP_IF_NONE_MATCH=etags[1])
+    assert old_day.status_code == 200 and old_day.json()["kcal_total"] == 0.0
+    assert new_day.status_code == 200 and new_day.json()["kcal_total"] == 320.0
+
+
+@pytest.mark.django_db
+def test_moving_meal_to_other_day_invalidates_old_day(
+    auth_client, user, etag_on, django_capture_on_commit_callbacks
+):
+    other = date(2025, 4, 3)
+    with django_capture_on_commit_callbacks(execute=True):
+        meal = Meal.objects.create(user=user, log_date=D, meal_type="아침")
+        MealItem.objects.create(meal=meal, name="토스트", kcal=250)
+
+    url = f"/api/meals/by-date/?log_date={D.isoformat()}"
+    etag = auth_client.get(url)["ETag"]
+
+    with django_capture_on_commit_callbacks(execute=True):
+        r = auth_client.patch(f"/api/meals/{meal.id}/", {"log_date": other.isoformat()}, format="json")
+    assert r.status_code == 200
+
+    old_day = auth_client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert old_day.status_code == 200 and old_day.json() == []
+    logs = auth_client.get(f"/api/nutritionlogs/by-date/?log_date={other.isoformat()}").json()
+    assert logs["kcal_total"] == 250.0
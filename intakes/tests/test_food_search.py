@@ -0,0 +1,93 @@
+import os
+import random
+import time
+
+import pytest
+from django.core.cache import cache
+
+from intakes.models import Food
+
+SEARCH_URL = "/api/foods/search/"
+
+# 기본은 CI용 10k, 100k 벤치는 FOOD_SEARCH_BENCH_ROWS=100000 으로 실행
+BENCH_ROWS = int(os.getenv("FOOD_SEARCH_BENCH_ROWS", "10000"))
+BENCH_QUERIES = int(os.getenv("FOOD_SEARCH_BENCH_QUERIES", "300"))
+# 시간 상한(p95, 초)은 FOOD_SEARCH_BENCH_CEILING 을 줄 때만 검사 (기본 실행은 결과만 확인, 예: 0.05)
+BENCH_P95_CEILING_SEC = float(os.getenv("FOOD_SEARCH_BENCH_CEILING") or 0)
+
+SYLLABLES = "가나다라마바사아자차카타파하닭김밥국탕면죽떡전볶찜구이샐러드"
+
+
+def _food(name):
+    return Food(name=name, kcal_per_100g=100, protein_g_per_100g=5, carb_g_per_100g=10, fat_g_per_100g=2)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.mark.django_db
+def test_search_ranks_exact_then_prefix_then_word(auth_client):
+    Food.objects.bulk_create(
+        [_food(n) for n in ("닭가슴살 샐러드", "닭가슴살", "훈제 닭가슴살", "닭갈비", "돼지갈비", "닭가슴살볶음밥")]
+    )
+
+    r = auth_client.get(SEARCH_URL, {"q": "닭가슴살"})
+    assert r.status_code == 200
+    assert [f["name"] for f in r.json()] == ["닭가슴살", "닭가슴살볶음밥", "닭가슴살 샐러드", "훈제 닭가슴살"]
+
+    assert [f["name"] for f in auth_client.get(SEARCH_URL, {"q": "닭", "limit": 2}).json()] == ["닭갈비", "닭가슴살"]
+    assert auth_client.get(SEARCH_URL, {"q": ""}).json() == []
+    assert auth_client.get(SEARCH_URL, {"q": "닭", "limit": "x"}).status_code == 400
+
+
+@pytest.mark.django_db
+def test_full_name_prefix_ranked_beyond_scan_cap(auth_client, monkeypatch):
+    monkeypatch.setattr("intakes.food_search.PREFIX_SCAN_CAP", 3)
+    # 사전순으로 앞선 긴 이름들이 상한을 채워도 짧은 접두사 일치가 먼저
+    Food.objects.bulk_create(
+        [_food(f"떡갈비{'가' * i}정식") for i in range(1, 6)] + [_food("떡하"), _food("모듬 떡")]
+    )
+
+    names = [f["name"] for f in auth_client.get(SEARCH_URL, {"q": "떡", "limit": 3}).json()]
+    assert names == ["떡하", "떡갈비가정식", "떡갈비가가정식"]
+    assert auth_client.get(SEARCH_URL, {"q": "떡", "limit": 10}).json()[-1]["name"] == "모듬 떡"
+
+
+@pytest.mark.django_db
+def test_index_refreshes_after_food_change(auth_client, django_capture_on_commit_callbacks):
+    Food.objects.bulk_create([_food("김치찌개")])
+    assert [f["name"] for f in auth_client.get(SEARCH_URL, {"q": "김치"}).json()] == ["김치찌개"]
+
+    with django_capture_on_commit_callbacks(execute=True):
+        Food.objects.create(name="김치볶음밥", kcal_per_100g=180, protein_g_per_100g=4,
+                            carb_g_per_100g=30, fat_g_per_100g=5)
+    names = [f["name"] for f in auth_client.get(SEARCH_URL, {"q": "김치"}).json()]
+    assert names == ["김치찌개", "김치볶음밥"]
+
+
+@pytest.mark.django_db
+def test_search_p95_latency(auth_client):
+    rng = random.Random(40)
+    names = set()
+    while len(names) < BENCH_ROWS:
+        words = ["".join(rng.choices(SYLLABLES, k=rng.randint(2, 4))) for _ in range(rng.randint(1, 3))]
+        names.add(" ".join(words))
+    Food.objects.bulk_create([_food(n) for n in names], batch_size=5000)
+
+    auth_client.get(SEARCH_URL, {"q": "닭"})  # 색인 구축(워밍업)은 측정에서 제외
+    queries = [n[: rng.randint(1, 3)] for n in rng.sample(sorted(names), BENCH_QUERIES)]
+    timings = []
+    for q in queries:
+        t0 = time.perf_counter()
+        r = auth_client.get(SEARCH_URL, {"q": q})
+        timings.append(time.perf_counter() - t0)
+        assert r.status_code == 200 and 0 < len(r.json()) <= 20
+
+    timings.sort()
+    p95 = timings[int(len(timings) * 0.95) - 1]
+    if BENCH_P95_CEILING_SEC:
+        assert p95 < BENCH_P95_CEILING_SEC
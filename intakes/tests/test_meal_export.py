@@ -0,0 +1,74 @@
+import csv
+import io
+import json
+import os
+import tracemalloc
+from datetime import date
+
+import pytest
+
+from intakes.models import Food, Meal, MealItem
+
+EXPORT_URL = "/api/meals/export/"
+
+# 기본은 CI용 소량, 대용량 검증은 MEAL_EXPORT_ROWS=1000000 으로 실행
+EXPORT_ROWS = int(os.getenv("MEAL_EXPORT_ROWS", "10000"))
+# 행 수와 무관한 고정 상한 (스트리밍이 깨지면 행 수에 비례해 초과)
+EXPORT_MEMORY_CEILING = 16 * 1024 * 1024
+
+
+def _make_items(user, n, log_date=date(2025, 1, 1), batch=5000):
+    food = Food.objects.create(
+        name="닭가슴살", kcal_per_100g=110, protein_g_per_100g=23, carb_g_per_100g=0, fat_g_per_100g=1.2
+    )
+    meal = Meal.objects.create(user=user, log_date=log_date, meal_type="점심")
+    for off in range(0, n, batch):
+        MealItem.objects.bulk_create(
+            [MealItem(meal=meal, food=food, grams=100) for _ in range(min(batch, n - off))]
+        )
+    return meal
+
+
+@pytest.mark.django_db
+def test_meal_export_ndjson_and_csv(auth_client, user):
+    _make_items(user, 3)
+    Meal.objects.create(user=user, log_date=date(2025, 2, 1), meal_type="저녁")
+    MealItem.objects.create(
+        meal=Meal.objects.get(log_date=date(2025, 2, 1)), name="김밥", kcal=320, protein_g=8
+    )
+
+    r = auth_client.get(EXPORT_URL, {"format": "ndjson", "start": "2025-02-01"})
+    assert r.status_code == 200
+    assert r.streaming
+    rows = [json.loads(line) for line in b"".join(r.streaming_content).decode().splitlines()]
+    assert [row["name"] for row in rows] == ["김밥"]
+    assert rows[0]["kcal"] == 320.0
+
+    r = auth_client.get(EXPORT_URL, {"format": "csv", "end": "2025-01-31"})
+    assert r.status_code == 200
+    body = b"".join(r.streaming_content).decode("utf-8-sig")
+    reader = list(csv.DictReader(io.StringIO(body)))
+    assert len(reader) == 3
+    assert reader[0]["food_name"] == "닭가슴살"
+    assert float(reader[0]["protein_g"]) == 23.0
+
+    assert auth_client.get(EXPORT_URL, {"format": "xml"}).status_code in (400, 404)
+    assert auth_client.get(EXPORT_URL, {"start": "2025-13-01"}).status_code == 400
+
+
+@pytest.mark.django_db
+def test_meal_export_memory_is_bounded(auth_client, user):
+    _make_items(user, EXPORT_ROWS)
+
+    tracemalloc.start()
+    try:
+        r = auth_client.get(EXPORT_URL, {"format": "ndjson"})
+        lines = 0
+        for chunk in r.streaming_content:
+            lines += chunk.count(b"\n")
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert lines == EXPORT_ROWS
+    assert peak < EXPORT_MEMORY_CEILING, f"peak={peak / 1024 / 1024:.1f}MB"
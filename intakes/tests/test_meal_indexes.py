@@ -0,0 +1,59 @@
+from datetime import date
+
+import pytest
+from django.db import IntegrityError, connection, transaction
+
+from intakes.models import Meal, MealItem
+
+on_postgres = pytest.mark.skipif(connection.vendor != "postgresql", reason="EXPLAIN 검증은 PostgreSQL 전용")
+
+
+def _explain(qs):
+    """작은 테스트 테이블에서도 인덱스 사용 여부를 보도록 seq scan 비활성화 후 EXPLAIN."""
+    with connection.cursor() as cursor:
+        cursor.execute("SET LOCAL enable_seqscan = off")
+    return qs.explain()
+
+
+@pytest.mark.django_db
+def test_meal_unique_per_user_date_type(auth_client, user):
+    Meal.objects.create(user=user, log_date=date(2025, 1, 1), meal_type="점심")
+    with pytest.raises(IntegrityError), transaction.atomic():
+        Meal.objects.create(user=user, log_date=date(2025, 1, 1), meal_type="점심")
+
+    # ensure(get_or_create)는 같은 끼니를 재사용
+    url = "/api/meals/ensure/?log_date=2025-01-02&meal_type=저녁"
+    r1 = auth_client.post(url)
+    r2 = auth_client.post(url)
+    assert (r1.status_code, r2.status_code) == (201, 200)
+    assert r1.json()["id"] == r2.json()["id"]
+
+
+@pytest.mark.django_db
+def test_meal_api_duplicate_slot_returns_400(auth_client):
+    body = {"log_date": "2025-01-03", "meal_type": "아침"}
+    assert auth_client.post("/api/meals/", body, format="json").status_code == 201
+    r = auth_client.post("/api/meals/", body, format="json")
+    assert r.status_code == 400 and "meal_type" in r.json()["error"]["message"]
+    assert Meal.objects.filter(log_date=date(2025, 1, 3)).count() == 1
+
+    # 다른 끼니를 이미 있는 자리로 옮기는 PATCH 도 400, 자기 자신 저장은 허용
+    other = auth_client.post("/api/meals/", {"log_date": "2025-01-03", "meal_type": "점심"}, format="json").json()
+    assert auth_client.patch(f"/api/meals/{other['id']}/", {"meal_type": "아침"}, format="json").status_code == 400
+    assert auth_client.patch(f"/api/meals/{other['id']}/", {"meal_type": "점심"}, format="json").status_code == 200
+
+
+@on_postgres
+@pytest.mark.django_db
+def test_explain_meal_lookup_uses_unique_index(user):
+    plan = _explain(Meal.objects.filter(user=user, log_date=date(2025, 1, 1), meal_type="점심"))
+    assert "unique_meal_per_user_date_type" in plan
+
+
+@on_postgres
+@pytest.mark.django_db
+def test_explain_mealitem_by_user_and_date_uses_indexes(user):
+    plan = _explain(MealItem.objects.filter(meal__user=user, meal__log_date=date(2025, 1, 1)))
+    assert "Seq Scan" not in plan
+    assert "unique_meal_per_user_date_type" in plan or "meal_user_date_id_idx" in plan
+    assert "intakes_mealitem_meal_id" in plan
@@ -0,0 +1,40 @@
+from datetime import date
+
+import pytest
+
+from intakes.models import Food, Meal, MealItem
+
+MEALS_URL = "/api/meals/"
+# 인증(사용자 조회) + Meal 목록 + items(food 조인) prefetch
+MEALS_QUERY_BUDGET = 4
+
+
+@pytest.mark.django_db
+def test_meals_by_log_date_query_budget(auth_client, user, django_assert_max_num_queries):
+    foods = [
+        Food.objects.create(
+            name=f"음식{i}", kcal_per_100g=100 + i, protein_g_per_100g=10, carb_g_per_100g=20, fat_g_per_100g=5
+        )
+        for i in range(10)
+    ]
+    d = date(2025, 3, 1)
+    meals = [Meal.objects.create(user=user, log_date=d, meal_type=t) for t in ("아침", "점심", "저녁", "간식")]
+    items = [
+        MealItem(meal=meals[i % 4], food=foods[i % 10], grams=50 + i) if i % 5 else
+        MealItem(meal=meals[i % 4], name=f"자유입력{i}", kcal=123)
+        for i in range(50)
+    ]
+    MealItem.objects.bulk_create(items)
+
+    with django_assert_max_num_queries(MEALS_QUERY_BUDGET):
+        r = auth_client.get(MEALS_URL, {"log_date": d.isoformat()})
+    assert r.status_code == 200
+
+    rows = [item for meal in r.json()["results"] for item in meal["items"]]
+    assert len(rows) == 50
+
+    # SQL 계산값 == 모델 메서드 계산값
+    expected = {i.id: i.resolved_nutrients() for i in MealItem.objects.select_related("food")}
+    for row in rows:
+        for key, value in expected[row["id"]].items():
+            assert row["nutrients"][key] == pytest.approx(value)
@@ -0,0 +1,62 @@
+import re
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+
+from intakes.models import Food
+
+HEADER = "식품명,에너지(kcal),단백질(g),탄수화물(g),지방(g)\n"
+
+
+def _csv(tmp_path, rows, name="foods.csv"):
+    path = tmp_path / name
+    path.write_text(HEADER + "".join(f"{r}\n" for r in rows), encoding="utf-8")
+    return str(path)
+
+
+def _run(path, *args):
+    out = StringIO()
+    call_command("import_mfds_foods", "--path", path, "--batch-size", "2", *args, stdout=out)
+    m = re.search(r"rows=(\d+), inserted=(\d+), updated=(\d+), unchanged=(\d+), skipped=(\d+)", out.getvalue())
+    return tuple(int(g) for g in m.groups())
+
+
+ROWS = [
+    "김밥,300,8,50,7",
+    "라면,500,10,70,16",
+    "비빔밥,550,15,85,12",
+    "김밥,320,9,52,8",  # 다른 청크의 같은 이름 → 마지막 행 우선
+    ",100,1,1,1",  # 이름 없음 → skipped
+    "떡볶이,380,7,75,4",
+]
+
+
+@pytest.mark.django_db
+def test_import_dedupes_across_chunks_and_is_idempotent(tmp_path):
+    path = _csv(tmp_path, ROWS)
+
+    # dry-run: 쓰지 않고 실제 실행과 같은 건수
+    assert _run(path, "--dry-run") == (6, 4, 0, 0, 1)
+    assert not Food.objects.exists()
+
+    assert _run(path) == (6, 4, 0, 0, 1)
+    assert Food.objects.count() == 4
+    assert Food.objects.get(name="김밥").kcal_per_100g == 320
+
+    # 같은 파일 재실행 → 전부 unchanged, 값도 그대로
+    assert _run(path) == (6, 0, 0, 4, 1)
+    assert Food.objects.get(name="김밥").kcal_per_100g == 320
+
+
+@pytest.mark.django_db
+def test_import_counts_updates_in_batches(tmp_path):
+    _run(_csv(tmp_path, ROWS))
+    changed = _csv(tmp_path, ["라면,510,10,70,16", "비빔밥,550,15,85,12", "짜장면,700,20,100,20"], "v2.csv")
+
+    assert _run(changed, "--dry-run") == (3, 1, 1, 1, 0)
+    assert Food.objects.get(name="라면").kcal_per_100g == 500
+
+    assert _run(changed) == (3, 1, 1, 1, 0)
+    assert Food.objects.get(name="라면").kcal_per_100g == 510
+    assert Food.objects.count() == 5
@@ -0,0 +1,79 @@
+import os
+import time
+from datetime import date, timedelta
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from intakes.models import Meal
+from utils.pagination import _encode_cursor
+
+MEALS_URL = "/api/meals/"
+
+# 기본은 CI용 10k, 1M 벤치는 PAGINATION_BENCH_ROWS=1000000 으로 실행
+BENCH_ROWS = int(os.getenv("PAGINATION_BENCH_ROWS", "10000"))
+# 깊은 페이지도 첫 페이지와 같은 비용이어야 함 (OFFSET이면 행 수에 비례해 느려짐)
+BENCH_PAGE_CEILING_SEC = float(os.getenv("PAGINATION_BENCH_CEILING", "0.5"))
+
+
+def _make_meals(user, n, batch=5000):
+    """하루 4끼씩 과거로 채움 → log_date 동률이 많아 (log_date, id) 타이브레이크를 검증."""
+    types = ("아침", "점심", "저녁", "간식")
+    start = date(2025, 1, 1)
+    for off in range(0, n, batch):
+        Meal.objects.bulk_create(
+            [
+                Meal(user=user, log_date=start - timedelta(days=i // 4), meal_type=types[i % 4])
+                for i in range(off, min(n, off + batch))
+            ]
+        )
+
+
+@pytest.mark.django_db
+def test_meals_cursor_pages_cover_all_rows(auth_client, user):
+    _make_meals(user, 23)
+
+    seen, url, pages = [], MEALS_URL, 0
+    while url:
+        r = auth_client.get(url, {"page_size": 5} if pages == 0 else None)
+        assert r.status_code == 200
+        body = r.json()
+        seen.extend((m["log_date"], m["id"]) for m in body["results"])
+        url, pages = body["next"], pages + 1
+
+    assert pages == 5
+    assert len(seen) == len(set(seen)) == 23
+    assert seen == sorted(seen, reverse=True)
+
+    # 호환 플래그: 예전처럼 맨 리스트
+    r = auth_client.get(MEALS_URL, {"paginate": "false"})
+    assert isinstance(r.json(), list) and len(r.json()) == 23
+
+    assert auth_client.get(MEALS_URL, {"cursor": "not-a-cursor"}).status_code == 404
+
+
+@pytest.mark.django_db
+def test_meals_deep_page_latency(auth_client, user):
+    _make_meals(user, BENCH_ROWS)
+
+    def fetch(params):
+        t0 = time.perf_counter()
+        with CaptureQueriesContext(connection) as ctx:
+            r = auth_client.get(MEALS_URL, params)
+        assert r.status_code == 200
+        return r.json(), time.perf_counter() - t0, ctx.captured_queries
+
+    first, first_sec, _ = fetch({"page_size": 50})
+
+    # 마지막 근처 페이지의 커서: 끝에서 두 번째 행 기준
+    last_two = list(Meal.objects.filter(user=user).order_by("log_date", "id")[:2])
+    anchor = last_two[1]
+    cursor = _encode_cursor(["-log_date", "-id"], [anchor.log_date, anchor.id])
+    deep, deep_sec, queries = fetch({"page_size": 50, "cursor": cursor})
+
+    assert len(first["results"]) == 50
+    assert [m["id"] for m in deep["results"]] == [last_two[0].id]
+    assert deep["next"] is None
+    assert not any("OFFSET" in q["sql"].upper() for q in queries)
+    assert deep_sec < BENCH_PAGE_CEILING_SEC
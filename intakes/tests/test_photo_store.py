@@ -0,0 +1,153 @@
+import io
+from datetime import timedelta
+
+import pytest
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.core.management import call_command
+from django.utils import timezone
+
+from ai import preview_tokens
+from intakes.models import Meal, MealItem, PendingUpload, PhotoBlob
+from intakes.photo_store import delete_blobs, store_photo, track_pending
+
+
+@pytest.fixture
+def media(settings, tmp_path):
+    settings.MEDIA_ROOT = str(tmp_path)
+    return tmp_path
+
+
+def _refs(name):
+    return PhotoBlob.objects.get(name=name).ref_count
+
+
+@pytest.mark.django_db
+def test_same_bytes_stored_once(media):
+    a = store_photo(b"same-photo-bytes", "JPG")
+    b = store_photo(b"same-photo-bytes", "jpg")
+    c = store_photo(b"other-photo-bytes", "png")
+
+    assert a == b and a != c
+    assert a.startswith("meals/blobs/") and a.endswith(".jpg")
+    assert PhotoBlob.objects.count() == 2
+    assert sum(1 for p in media.rglob("*") if p.is_file()) == 2
+
+
+@pytest.mark.django_db
+def test_ref_count_follows_meal_items(user, media):
+    name = store_photo(b"kimbap", "jpg")
+    other = store_photo(b"ramen", "jpg")
+    meal = Meal.objects.create(user=user, log_date="2025-06-01", meal_type="점심")
+
+    first = MealItem.objects.create(meal=meal, name="김밥", kcal=320, photo=name)
+    MealItem.objects.create(meal=meal, name="김밥", kcal=320, photo=name)
+    assert _refs(name) == 2
+
+    # 사진 교체 → 이전 -1, 새 +1
+    first = MealItem.objects.get(pk=first.pk)
+    first.photo = other
+    first.save()
+    assert (_refs(name), _refs(other)) == (1, 1)
+
+    first.delete()
+    assert _refs(other) == 0
+
+
+@pytest.mark.django_db
+def test_gc_deletes_only_unreferenced_after_grace(user, media):
+    kept = store_photo(b"kept", "jpg")
+    orphan = store_photo(b"orphan", "jpg")
+    fresh = store_photo(b"fresh", "jpg")
+    meal = Meal.objects.create(user=user, log_date="2025-06-01", meal_type="저녁")
+    MealItem.objects.create(meal=meal, name="밥", kcal=300, photo=kept)
+    PhotoBlob.objects.exclude(name=fresh).update(last_uploaded_at=timezone.now() - timedelta(days=2))
+
+    call_command("gc_photo_blobs", "--grace-hours", "24")
+
+    assert set(PhotoBlob.objects.values_list("name", flat=True)) == {kept, fresh}
+    assert not default_storage.exists(orphan)
+    assert default_storage.exists(kept) and default_storage.exists(fresh)
+
+
+@pytest.mark.django_db
+def test_delete_blobs_skips_blob_reused_after_cutoff(media):
+    name = store_photo(b"reused", "jpg")
+    cutoff = timezone.now()
+    PhotoBlob.objects.filter(name=name).update(last_uploaded_at=cutoff - timedelta(days=2))
+
+    # gc 가 대상을 고른 뒤 같은 바이트가 다시 업로드됨 (ref_count 는 여전히 0)
+    store_photo(b"reused", "jpg")
+
+    assert delete_blobs([name], cutoff=cutoff) == (0, 0)
+    assert PhotoBlob.objects.filter(name=name).exists()
+    assert default_storage.exists(name)
+
+
+@pytest.mark.django_db
+def test_deferred_photo_keeps_ref_count(user, media):
+    name = store_photo(b"bibimbap", "jpg")
+    other = store_photo(b"naengmyeon", "jpg")
+    meal = Meal.objects.create(user=user, log_date="2025-06-01", meal_type="점심")
+    item = MealItem.objects.create(meal=meal, name="비빔밥", kcal=550, photo=name)
+    assert _refs(name) == 1
+
+    # photo 를 읽지 않은 로드 → 다른 필드만 저장해도 참조 수 유지
+    light = MealItem.objects.only("id", "kcal").get(pk=item.pk)
+    light.kcal = 600
+    light.save()
+    assert _refs(name) == 1
+
+    # 지연 로드 후 사진 교체 → 이전 값을 조회해 -1/+1
+    light = MealItem.objects.defer("photo").get(pk=item.pk)
+    light.photo = other
+    light.save()
+    assert (_refs(name), _refs(other)) == (0, 1)
+
+    MealItem.objects.defer("photo").get(pk=item.pk).delete()
+    assert _refs(other) == 0
+
+
+@pytest.mark.django_db
+def test_meal_commit_links_presaved_blob(auth_client, user, media):
+    name = store_photo(b"analyzed-photo", "jpg")
+    payload = {"label_ko": "비빔밥", "macros": {"calories": 600}, "meal_type": "점심", "photo_name": name}
+    token = preview_tokens.issue(user.id, payload)
+    r = auth_client.post("/api/ai/meal-commit/", {"preview_token": token}, format="json")
+    assert r.status_code in (200, 201), r.content
+
+    assert MealItem.objects.filter(photo=name).count() == 1
+    assert _refs(name) == 1
+
+    # 선저장된 적 없는 경로는 연결하지 않음
+    token = preview_tokens.issue(user.id, {**payload, "photo_name": "../etc/passwd"})
+    r = auth_client.post("/api/ai/meal-commit/", {"preview_token": token}, format="json")
+    assert r.status_code in (200, 201)
+    assert MealItem.objects.filter(photo="../etc/passwd").count() == 0
+
+
+@pytest.mark.django_db
+def test_gc_pending_uploads_reclaims_uncommitted(user, media):
+    uploads = {}
+    for data in (b"committed", b"abandoned-preview", b"recent-preview"):
+        uploads[data] = store_photo(data, "jpg")
+        track_pending(uploads[data], len(data), user=None)  # 익명 업로드 포함
+    committed, abandoned, recent = uploads.values()
+    legacy = default_storage.save("meals/2025/01/01/old.jpg", ContentFile(b"x" * 10))
+    track_pending(legacy, 10)
+
+    meal = Meal.objects.create(user=user, log_date="2025-06-01", meal_type="아침")
+    MealItem.objects.create(meal=meal, name="토스트", kcal=250, photo=committed)
+    assert not PendingUpload.objects.filter(name=committed).exists()
+
+    old = timezone.now() - timedelta(days=2)
+    PendingUpload.objects.exclude(name=recent).update(created_at=old)
+    PhotoBlob.objects.exclude(name=recent).update(last_uploaded_at=old)  # 업로드 시각은 두 기록이 같음
+    out = io.StringIO()
+    call_command("gc_pending_uploads", "--ttl-hours", "24", stdout=out)
+
+    assert f"회수 {len(b'abandoned-preview') + 10} bytes" in out.getvalue()
+    assert not default_storage.exists(abandoned) and not default_storage.exists(legacy)
+    assert default_storage.exists(committed) and default_storage.exists(recent)
+    assert list(PendingUpload.objects.values_list("name", flat=True)) == [recent]
+    assert not PhotoBlob.objects.filter(name=abandoned).exists()
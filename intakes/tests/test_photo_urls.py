@@ -0,0 +1,55 @@
+import pytest
+from django.core.cache import cache
+from prometheus_client import REGISTRY
+
+from intakes import photo_urls as pu
+
+
+class SigningStorage:
+    """S3Boto3Storage(querystring_auth=True) 흉내: url() 호출마다 새 서명."""
+
+    querystring_auth = True
+    querystring_expire = 3600
+
+    def __init__(self):
+        self.calls = 0
+
+    def url(self, name):
+        self.calls += 1
+        return f"https://bucket.s3.amazonaws.com/{name}?X-Amz-Signature={self.calls}"
+
+
+def _count(result):
+    return REGISTRY.get_sample_value("intakes_photo_url_cache_total", {"result": result}) or 0.0
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+def test_signed_urls_are_cached_in_batches(monkeypatch):
+    storage = SigningStorage()
+    monkeypatch.setattr(pu, "default_storage", storage)
+    names = [f"meals/2025/01/01/{i}.jpg" for i in range(20)]
+    hits_before, misses_before = _count("hit"), _count("miss")
+
+    first = pu.photo_urls(names + [None, names[0]])
+    second = pu.photo_urls(names)
+
+    assert storage.calls == 20
+    assert first == second and set(first) == set(names)
+    assert pu.photo_url(names[3]) == first[names[3]]
+    assert _count("miss") - misses_before == 20
+    assert _count("hit") - hits_before == 21
+    assert pu._ttl(storage.querystring_expire) < storage.querystring_expire
+
+
+def test_local_storage_bypasses_cache(monkeypatch, settings, tmp_path):
+    from django.core.files.storage import FileSystemStorage
+
+    monkeypatch.setattr(pu, "default_storage", FileSystemStorage(location=tmp_path, base_url="/media/"))
+    assert pu.photo_url("meals/a.jpg") == "/media/meals/a.jpg"
+    assert cache.get(pu._key("meals/a.jpg")) is None
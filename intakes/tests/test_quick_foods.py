@@ -0,0 +1,92 @@
+import io
+from datetime import date, timedelta
+
+import pytest
+from django.core.cache import cache
+from django.core.management import call_command
+from django.utils import timezone
+from prometheus_client import REGISTRY
+
+from intakes.models import Food, Meal, MealItem, QuickFood
+from intakes.quick_foods import decayed
+
+QUICK_URL = "/api/foods/quick/"
+D = date(2025, 7, 1)
+
+
+def _avoided(kind):
+    return REGISTRY.get_sample_value("intakes_quick_add_avoided_total", {"kind": kind}) or 0.0
+
+
+@pytest.fixture
+def meal(user):
+    cache.clear()
+    return Meal.objects.create(user=user, log_date=D, meal_type="아침")
+
+
+@pytest.fixture
+def food():
+    return Food.objects.create(
+        name="닭가슴살", kcal_per_100g=110, protein_g_per_100g=23, carb_g_per_100g=0, fat_g_per_100g=1
+    )
+
+
+@pytest.mark.django_db
+def test_quick_list_ranked_and_cached(auth_client, meal, food, django_capture_on_commit_callbacks,
+                                      django_assert_max_num_queries):
+    with django_capture_on_commit_callbacks(execute=True):
+        for _ in range(3):
+            MealItem.objects.create(meal=meal, food=food, grams=150)
+        MealItem.objects.create(meal=meal, name=" 김치 찌개 ", kcal=350, photo="meals/x.jpg")
+
+    r = auth_client.get(QUICK_URL)
+    assert r.status_code == 200
+    rows = r.json()
+    assert [row["key"] for row in rows] == [f"food:{food.id}", "name:김치 찌개"]
+    assert rows[0]["use_count"] == 3 and rows[0]["nutrients"]["kcal"] == 165.0
+    assert rows[1]["origin"] == "photo"
+
+    # 두 번째 조회는 캐시 (인증 외 쿼리 없음)
+    with django_assert_max_num_queries(1):
+        assert auth_client.get(QUICK_URL).json() == rows
+
+    # 새 기록 → 커밋 후 캐시 무효화
+    with django_capture_on_commit_callbacks(execute=True):
+        MealItem.objects.create(meal=meal, name="바나나", kcal=90)
+    assert len(auth_client.get(QUICK_URL).json()) == 3
+
+
+@pytest.mark.django_db
+def test_quick_foods_capped_and_decayed(user, meal, settings):
+    settings.QUICK_FOODS_MAX = 3
+    for i in range(5):
+        MealItem.objects.create(meal=meal, name=f"음식{i}", kcal=100)
+    assert QuickFood.objects.filter(user=user).count() == 3
+    call_command("rebuild_quick_foods", "--only-user", user.username, stdout=io.StringIO())
+    assert set(QuickFood.objects.filter(user=user).values_list("name", flat=True)) == {"음식2", "음식3", "음식4"}
+
+    now = timezone.now()
+    assert decayed(4.0, now - timedelta(days=settings.QUICK_FOODS_HALF_LIFE_DAYS), now) == pytest.approx(2.0)
+
+
+@pytest.mark.django_db
+def test_quick_log_creates_item_without_analysis(auth_client, meal, food):
+    MealItem.objects.create(meal=meal, food=food, grams=100)
+    MealItem.objects.create(meal=meal, name="샐러드", kcal=200, photo="meals/y.jpg")
+    before = (_avoided("food_search"), _avoided("hf_call"))
+
+    r = auth_client.post(
+        f"{QUICK_URL}log/", {"key": f"food:{food.id}", "meal_type": "점심", "servings": 2}, format="json"
+    )
+    assert r.status_code == 201, r.content
+    assert r.json()["grams"] == 200 and r.json()["nutrients"]["kcal"] == pytest.approx(220)
+
+    r = auth_client.post(f"{QUICK_URL}log/", {"key": "name:샐러드", "meal_type": "저녁"}, format="json")
+    assert r.status_code == 201 and r.json()["kcal"] == 200
+    assert (_avoided("food_search"), _avoided("hf_call")) == (before[0] + 1, before[1] + 1)
+    assert QuickFood.objects.get(key=f"food:{food.id}").use_count == 2
+
+    assert auth_client.post(f"{QUICK_URL}log/", {"key": "name:없음", "meal_type": "점심"}, format="json").status_code == 404
+    assert auth_client.post(
+        f"{QUICK_URL}log/", {"key": "name:샐러드", "meal_type": "야식"}, format="json"
+    ).status_code == 400
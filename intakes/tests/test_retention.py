@@ -0,0 +1,86 @@
+import io
+import json
+from datetime import timedelta
+
+import pytest
+from django.core.files.storage import default_storage
+from django.core.management import call_command
+from django.utils import timezone
+
+from intakes.models import Meal, MealItem, NutritionLog, PhotoBlob
+from intakes.photo_store import store_photo
+
+MEAL_TYPES = ["아침", "점심", "저녁", "간식", "야식"]
+
+
+@pytest.fixture
+def media(settings, tmp_path):
+    settings.MEDIA_ROOT = str(tmp_path)
+    return tmp_path
+
+
+def _old_meals(user, n):
+    old = timezone.now().date() - timedelta(days=100)
+    meals = [Meal.objects.create(user=user, log_date=old, meal_type=MEAL_TYPES[i]) for i in range(n)]
+    for m in meals:
+        MealItem.objects.create(meal=m, name="밥", kcal=300)
+    return meals
+
+
+def _run(*args):
+    out = io.StringIO()
+    call_command("cleanup_nutrition_retention", "--days", "30", *args, stdout=out)
+    return out.getvalue()
+
+
+@pytest.mark.django_db
+def test_retention_deletes_in_pk_chunks(user, media):
+    _old_meals(user, 5)
+    recent = Meal.objects.create(user=user, log_date=timezone.now().date(), meal_type="점심")
+    MealItem.objects.create(meal=recent, name="김밥", kcal=320)
+
+    out = _run("--chunk-size", "2")
+
+    assert out.count("... Meal.id ≤") == 3  # 5개 → 2 + 2 + 1
+    assert list(Meal.objects.values_list("id", flat=True)) == [recent.id]
+    assert MealItem.objects.count() == 1
+    assert list(NutritionLog.objects.values_list("date", flat=True)) == [recent.log_date]
+    assert "MealItem=5, Meal=5" in out
+
+
+@pytest.mark.django_db
+def test_retention_resumes_from_state_file(user, media, tmp_path):
+    meals = _old_meals(user, 4)
+    cutoff = timezone.now().date() - timedelta(days=30)
+    state = tmp_path / "retention.json"
+    # 앞 2개까지 처리하고 중단된 것으로 기록
+    state.write_text(json.dumps({"key": f"{cutoff.isoformat()}:*", "meal_id": meals[1].id, "log_id": 0}))
+
+    out = _run("--chunk-size", "1", "--state-file", str(state))
+
+    assert f"이어서 진행: Meal.id > {meals[1].id}" in out
+    assert set(Meal.objects.values_list("id", flat=True)) == {meals[0].id, meals[1].id}
+    assert not state.exists()  # 완료 시 재개 지점 제거
+
+    # 기준이 다른 상태 파일은 무시하고 처음부터
+    state.write_text(json.dumps({"key": "1999-01-01:*", "meal_id": meals[1].id, "log_id": 0}))
+    _run("--state-file", str(state))
+    assert not Meal.objects.exists()
+
+
+@pytest.mark.django_db
+def test_retention_deletes_only_unreferenced_photos(user, media):
+    orphan = store_photo(b"old-only", "jpg")
+    shared = store_photo(b"old-and-recent", "jpg")
+    old_meal = _old_meals(user, 1)[0]
+    MealItem.objects.create(meal=old_meal, name="라면", kcal=500, photo=orphan)
+    MealItem.objects.create(meal=old_meal, name="우유", kcal=130, photo=shared)
+    recent = Meal.objects.create(user=user, log_date=timezone.now().date(), meal_type="저녁")
+    MealItem.objects.create(meal=recent, name="우유", kcal=130, photo=shared)
+
+    out = _run()
+
+    assert "사진=1" in out
+    assert not default_storage.exists(orphan) and not PhotoBlob.objects.filter(name=orphan).exists()
+    assert default_storage.exists(shared)
+    assert PhotoBlob.objects.get(name=shared).ref_count == 1
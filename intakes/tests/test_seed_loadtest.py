@@ -0,0 +1,65 @@
+import io
+from datetime import date
+
+import pytest
+from django.core.management import call_command
+from django.db.models import Count, Q, Sum
+
+from intakes.models import Meal, MealItem, NutritionLog
+from tasks.models import DailyTaskProgress, DailyWorkoutTotal, TaskItem, WorkoutLog
+
+
+def _seed(**opts):
+    out = io.StringIO()
+    args = {"users": 3, "days": 7, "end": "2025-03-07", "prefix": "lt_", "workout_ratio": 1.0, **opts}
+    call_command("seed_loadtest", *[f"--{k.replace('_', '-')}={v}" for k, v in args.items()], stdout=out)
+    return out.getvalue()
+
+
+@pytest.mark.django_db
+def test_seed_loadtest_smoke_fills_rollups():
+    out = _seed()
+    assert "완료! users=3" in out
+
+    assert Meal.objects.filter(user__username__startswith="lt_").exists()
+    assert MealItem.objects.exists()
+    # NutritionLog 는 사용자 × 일수
+    assert NutritionLog.objects.count() == 3 * 7
+    assert NutritionLog.objects.filter(date=date(2025, 3, 1)).count() == 3
+
+    # 진행 롤업 = TaskItem 에서 다시 센 값
+    expected = {
+        (r["workout_plan__user_id"], r["workout_plan__plan_date"]): (r["total"], r["done"])
+        for r in TaskItem.objects.values("workout_plan__user_id", "workout_plan__plan_date")
+        .annotate(total=Count("id"), done=Count("id", filter=Q(completed=True)))
+    }
+    assert expected
+    assert {
+        (p.user_id, p.date): (p.total, p.completed) for p in DailyTaskProgress.objects.all()
+    } == expected
+
+    # 운동 합계 = WorkoutLog 합산 (rebuild_workout_totals 와 같은 결과)
+    logs = {
+        (r["user_id"], r["date"]): (r["minutes"], round(r["kcal"], 1))
+        for r in WorkoutLog.objects.values("user_id", "date")
+        .annotate(minutes=Sum("duration_min"), kcal=Sum("kcal_burned"))
+    }
+    assert logs
+    assert {
+        (t.user_id, t.date): (t.minutes, round(t.kcal, 1)) for t in DailyWorkoutTotal.objects.all()
+    } == logs
+
+
+@pytest.mark.django_db
+def test_seed_loadtest_is_deterministic_per_seed():
+    _seed(prefix="a_")
+    _seed(prefix="b_")
+
+    def shape(prefix):
+        return list(
+            Meal.objects.filter(user__username__startswith=prefix)
+            .order_by("user__username", "log_date", "meal_type")
+            .values_list("log_date", "meal_type")
+        )
+
+    assert shape("a_") == shape("b_")
@@ -0,0 +1,95 @@
+import io
+
+import pytest
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from PIL import Image
+
+from intakes.models import Meal, MealItem
+from intakes.thumbnails import THUMB_SIZES, thumb_name
+
+
+@pytest.fixture
+def media(settings, tmp_path):
+    settings.MEDIA_ROOT = str(tmp_path)
+    settings.THUMBNAILS_SYNC = True
+    return tmp_path
+
+
+def _upload(name="meals/2025/05/01/abc.jpg", size=(2000, 1500)):
+    buf = io.BytesIO()
+    Image.new("RGB", size, (200, 80, 40)).save(buf, "JPEG")
+    return default_storage.save(name, ContentFile(buf.getvalue()))
+
+
+@pytest.mark.django_db
+def test_thumbnails_generated_after_commit(auth_client, user, media, django_capture_on_commit_callbacks):
+    name = _upload()
+    meal = Meal.objects.create(user=user, log_date="2025-05-01", meal_type="점심")
+    with django_capture_on_commit_callbacks(execute=True):
+        item = MealItem.objects.create(meal=meal, name="비빔밥", kcal=600, photo=name)
+
+    item.refresh_from_db()
+    assert item.thumbs_ready
+    for size in THUMB_SIZES:
+        thumb = thumb_name(name, size)
+        assert thumb == f"meals/2025/05/01/thumbs/abc_{size}.webp"
+        with default_storage.open(thumb, "rb") as fh:
+            img = Image.open(fh)
+            assert img.format == "WEBP"
+            assert max(img.size) == size
+
+    body = auth_client.get(f"/api/mealitems/{item.id}/").json()
+    assert set(body["photo_thumbs"]) == {"128", "384", "1024"}
+    assert body["photo_thumbs"]["384"].endswith("thumbs/abc_384.webp")
+
+
+@pytest.mark.django_db
+def test_photo_thumbs_none_until_ready(auth_client, user, media):
+    name = _upload("meals/2025/05/02/x.jpg")
+    meal = Meal.objects.create(user=user, log_date="2025-05-02", meal_type="저녁")
+    item = MealItem.objects.create(meal=meal, name="라면", kcal=500, photo=name)  # 커밋 콜백 미실행
+    assert auth_client.get(f"/api/mealitems/{item.id}/").json()["photo_thumbs"] is None
+
+
+@pytest.mark.django_db
+def test_mark_ready_invalidates_by_date_etag(auth_client, user, media, settings, django_capture_on_commit_callbacks):
+    from intakes.thumbnails import mark_ready
+
+    settings.DAY_ETAG_ENABLED = True
+    name = _upload("meals/2025/05/03/y.jpg")
+    meal = Meal.objects.create(user=user, log_date="2025-05-03", meal_type="아침")
+    MealItem.objects.create(meal=meal, name="토스트", kcal=250, photo=name)
+
+    url = "/api/meals/by-date/?log_date=2025-05-03"
+    first = auth_client.get(url)
+    assert first.json()[0]["items"][0]["photo_thumbs"] is None
+
+    with django_capture_on_commit_callbacks(execute=True):
+        mark_ready([name])  # 백그라운드 작업과 같은 경로 (QuerySet.update)
+    r = auth_client.get(url, HTTP_IF_NONE_MATCH=first["ETag"])
+    assert r.status_code == 200
+    assert r.json()[0]["items"][0]["photo_thumbs"]["128"].endswith("thumbs/y_128.webp")
+
+
+@pytest.mark.django_db
+def test_photo_thumbs_resolved_once_per_page(auth_client, user, media, monkeypatch):
+    from intakes import serializers
+
+    for i, meal_type in enumerate(("아침", "점심", "저녁")):
+        meal = Meal.objects.create(user=user, log_date="2025-05-04", meal_type=meal_type)
+        for j in range(2):
+            MealItem.objects.create(meal=meal, name=f"메뉴{i}{j}", kcal=100, photo=f"meals/p{i}{j}.jpg",
+                                    thumbs_ready=True)
+
+    calls = []
+    real = serializers.thumbnail_urls
+    monkeypatch.setattr(serializers, "thumbnail_urls", lambda names: calls.append(set(names)) or real(names))
+
+    body = auth_client.get("/api/meals/by-date/?log_date=2025-05-04").json()
+    assert all(it["photo_thumbs"]["1024"] for m in body for it in m["items"])
+    assert len(calls) == 1 and len(calls[0]) == 6
+
+    calls.clear()
+    auth_client.get("/api/mealitems/")
+    assert len(calls) == 1
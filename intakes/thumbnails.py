@@ -0,0 +1,125 @@
+"""
+intakes/thumbnails.py
+
+MealItem 사진 썸네일(WebP, 고정 크기) 생성.
+
+- 원본 옆 결정적 경로: meals/2025/01/01/abc.jpg → meals/2025/01/01/thumbs/abc_384.webp
+  (이름만으로 URL 계산 가능, 재생성해도 같은 경로)
+- 업로드 후 MealItem 저장 시 커밋 뒤 백그라운드 스레드에서 생성 (signals.py → schedule_thumbnails)
+  생성이 끝나면 MealItem.thumbs_ready=True 로 표시 → 그 전까지 화면은 원본으로 대체
+- 기존 사진은 manage.py backfill_photo_thumbs (프로세스 풀)로 일괄 생성
+"""
+import io
+import logging
+import posixpath
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.db import close_old_connections, transaction
+
+from .etags import bump_day_version
+from .photo_urls import photo_urls
+
+logger = logging.getLogger(__name__)
+
+THUMB_SIZES = (128, 384, 1024)
+THUMB_FORMAT = "WEBP"
+THUMB_QUALITY = 80
+
+_executor = None
+
+
+def thumb_name(name, size):
+    base, _ = posixpath.splitext(name)
+    head, tail = posixpath.split(base)
+    return posixpath.join(head, "thumbs", f"{tail}_{size}.webp")
+
+
+def thumb_names(name):
+    return [thumb_name(name, size) for size in THUMB_SIZES]
+
+
+def generate_thumbnails(name, overwrite=False):
+    """원본 한 장 → THUMB_SIZES 썸네일 저장. 반환: 생성한 썸네일 이름 목록."""
+    from PIL import Image, ImageOps
+
+    with default_storage.open(name, "rb") as fh:
+        img = Image.open(fh)
+        img = ImageOps.exif_transpose(img)
+        img.load()
+    if img.mode not in ("RGB", "RGBA"):
+        img = img.convert("RGBA" if "A" in img.getbands() else "RGB")
+
+    created = []
+    for size in THUMB_SIZES:
+        target = thumb_name(name, size)
+        if default_storage.exists(target):
+            if not overwrite:
+                continue
+            default_storage.delete(target)
+        thumb = img.copy()
+        thumb.thumbnail((size, size))  # 비율 유지, 원본보다 키우지 않음
+        buf = io.BytesIO()
+        thumb.save(buf, THUMB_FORMAT, quality=THUMB_QUALITY, method=4)
+        created.append(default_storage.save(target, ContentFile(buf.getvalue())))
+    return created
+
+
+def mark_ready(names):
+    from .models import MealItem
+
+    qs = MealItem.objects.filter(photo__in=list(names))
+    # QuerySet.update 는 시그널이 없으므로 by-date ETag 버전을 직접 올림 (photo_thumbs 가 바뀜)
+    days = set(qs.values_list("meal__user_id", "meal__log_date").distinct())
+    updated = qs.update(thumbs_ready=True)
+    for user_id, log_date in days:
+        bump_day_version(user_id, log_date)
+    return updated
+
+
+def _run(name):
+    try:
+        generate_thumbnails(name)
+        mark_ready([name])
+    except Exception:
+        logger.warning("thumbnail generation failed: %s", name, exc_info=True)
+
+
+def _run_in_thread(name):
+    # 워커 스레드는 자체 DB 커넥션을 쓰므로 작업 전후로 정리
+    close_old_connections()
+    try:
+        _run(name)
+    finally:
+        close_old_connections()
+
+
+def _get_executor():
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=getattr(settings, "THUMBNAIL_WORKERS", 2), thread_name_prefix="thumbs"
+        )
+    return _executor
+
+
+def schedule_thumbnails(name):
+    """커밋 후 백그라운드에서 생성. THUMBNAILS_SYNC=True(테스트 등)면 즉시 같은 스레드에서."""
+    if not name:
+        return
+    if getattr(settings, "THUMBNAILS_SYNC", False):
+        transaction.on_commit(lambda: _run(name))
+    else:
+        transaction.on_commit(lambda: _get_executor().submit(_run_in_thread, name))
+
+
+def thumbnail_urls(names):
+    """{원본 name: {"128": url, "384": url, "1024": url}} — 준비된 원본 이름만 넘길 것."""
+    names = [n for n in names if n]
+    urls = photo_urls(t for n in names for t in thumb_names(n))
+    return {
+        n: {str(size): urls.get(thumb_name(n, size)) for size in THUMB_SIZES}
+        for n in names
+    }
@@ -1,10 +1,23 @@
 # intakes/views.py
 from datetime import date as _date
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import Prefetch
+from django.http import StreamingHttpResponse
 from rest_framework import viewsets, permissions, exceptions, status
 from rest_framework.decorators import action
+from rest_framework.renderers import JSONRenderer
 from rest_framework.response import Response
 
+from utils.pagination import KeysetPagination
+
+from .etags import day_etag, if_none_match, record_conditional_get
+from .exports import (
+    CSVRenderer, NDJSONRenderer, export_queryset, iter_export_rows, stream_csv, stream_ndjson,
+)
+from .food_search import search_foods
 from .models import Food, Meal, MealItem, NutritionLog
+from .quick_foods import get_entry, quick_foods, record_avoided
 from .serializers import (
     FoodSerializer, MealSerializer, MealItemSerializer, NutritionLogSerializer
 )
@@ -12,8 +25,21 @@ from .serializers import (
 MEAL_TYPES = {"아침", "점심", "저녁", "간식"}
 
 
+def _with_etag(response, etag):
+    if etag:
+        response["ETag"] = etag
+        # 브라우저가 저장은 하되 매번 재검증(If-None-Match)하도록
+        response["Cache-Control"] = "private, no-cache"
+    return response
+
+
+def _not_modified(etag):
+    return _with_etag(Response(status=status.HTTP_304_NOT_MODIFIED), etag)
+
+
 class BaseUserOwnedModelViewSet(viewsets.ModelViewSet):
     permission_classes = [permissions.IsAuthenticated]
+    pagination_class = KeysetPagination
     ordering = ("-id",)
 
     def _model_has_user_fk(self, model_cls) -> bool:
@@ -44,7 +70,9 @@ class BaseUserOwnedModelViewSet(viewsets.ModelViewSet):
 # ─────────────────────────  식품 카탈로그  ─────────────────────────
 class FoodViewSet(viewsets.ModelViewSet):
     """
-    GET /api/foods/?q=닭가슴살   ← 부분일치 검색
+    GET /api/foods/?q=닭가슴살   ← 부분일치 검색 (전체 스캔, 목록/관리용)
+    GET /api/foods/search/?q=닭  ← 자동완성 검색 (인덱스 사용, 순위 + 최대 개수 제한)
+    GET /api/foods/quick/        ← 최근/자주 먹은 음식, POST /api/foods/quick/log/ 로 바로 기록
     ※ 쓰기(POST/PUT/PATCH/DELETE)는 관리자만 허용
     """
     queryset = Food.objects.all().order_by("id")
@@ -58,6 +86,70 @@ class FoodViewSet(viewsets.ModelViewSet):
             qs = qs.filter(name__icontains=q)
         return qs
 
+    @action(detail=False, methods=["get"], url_path="search")
+    def search(self, request):
+        """
+        GET /api/foods/search/?q=닭가슴&limit=20
+        정확 일치 > 접두사 > 유사도 순, limit 은 FOOD_SEARCH_MAX_LIMIT 까지.
+        """
+        q = (request.query_params.get("q") or "").strip()
+        try:
+            limit = int(request.query_params.get("limit") or settings.FOOD_SEARCH_LIMIT)
+        except ValueError:
+            return Response({"detail": "limit 은 정수여야 합니다."}, status=400)
+        limit = max(1, min(limit, settings.FOOD_SEARCH_MAX_LIMIT))
+        if len(q) > 50:
+            return Response({"detail": "q 는 50자 이하여야 합니다."}, status=400)
+        return Response(self.get_serializer(search_foods(q, limit), many=True).data)
+
+    @action(detail=False, methods=["get"], url_path="quick")
+    def quick(self, request):
+        """
+        GET /api/foods/quick/
+        최근/자주 먹은 음식 (감쇠 점수 순, 최대 QUICK_FOODS_MAX 개). 캐시에서 바로 반환.
+        """
+        return Response(quick_foods(request.user.id))
+
+    @action(detail=False, methods=["post"], url_path="quick/log")
+    def quick_log(self, request):
+        """
+        POST /api/foods/quick/log/  {"key": "food:12", "meal_type": "점심", "log_date": "YYYY-MM-DD", "servings": 1}
+        빠른 추가 목록의 항목을 그대로 한 번에 기록 (사진 분석/검색 없이).
+        """
+        data = request.data
+        entry = get_entry(request.user.id, (data.get("key") or "").strip())
+        if entry is None:
+            return Response({"detail": "빠른 추가 목록에 없는 항목입니다."}, status=404)
+        meal_type = data.get("meal_type")
+        if meal_type not in MEAL_TYPES:
+            return Response({"detail": f"meal_type 허용값: {sorted(MEAL_TYPES)}"}, status=400)
+        try:
+            log_date = _date.fromisoformat(data["log_date"]) if data.get("log_date") else _date.today()
+            servings = float(data.get("servings") or 1)
+        except (TypeError, ValueError):
+            return Response({"detail": "log_date=YYYY-MM-DD, servings=숫자 형식이어야 합니다."}, status=400)
+        if not 0 < servings <= 10:
+            return Response({"detail": "servings 는 0보다 크고 10 이하여야 합니다."}, status=400)
+
+        def scaled(value):
+            return None if value is None else value * servings
+
+        meal, _ = Meal.objects.get_or_create(user=request.user, log_date=log_date, meal_type=meal_type)
+        item = MealItem.objects.create(
+            meal=meal,
+            food_id=entry.food_id,
+            name=entry.name or None,
+            grams=scaled(entry.grams),
+            kcal=scaled(entry.kcal),
+            protein_g=scaled(entry.protein_g),
+            carb_g=scaled(entry.carb_g),
+            fat_g=scaled(entry.fat_g),
+            source=entry.source,
+        )
+        record_avoided(entry)
+        item = MealItem.objects.select_related("food").with_nutrients().get(pk=item.pk)
+        return Response(MealItemSerializer(item, context={"request": request}).data, status=status.HTTP_201_CREATED)
+
     def _assert_staff(self):
         if not (self.request.user and self.request.user.is_staff):
             raise exceptions.PermissionDenied("식품 수정은 관리자만 가능합니다.")
@@ -85,8 +177,27 @@ class MealViewSet(BaseUserOwnedModelViewSet):
     GET /api/meals/?log_date=YYYY-MM-DD&meal_type=아침
     (호환) date=YYYY-MM-DD 도 지원
     """
-    queryset = Meal.objects.select_related("user").prefetch_related("items")
+    # items + food 를 한 번에: 끼니 목록/상세 모두 쿼리 수가 항목 수와 무관
+    queryset = Meal.objects.select_related("user").prefetch_related(
+        Prefetch("items", queryset=MealItem.objects.select_related("food").with_nutrients().order_by("id"))
+    )
     serializer_class = MealSerializer
+    ordering = ("-log_date", "-id")  # 커서 키 = (log_date, id) ↔ meal_user_date_id_idx
+
+    # 검증과 저장 사이에 다른 요청이 같은 끼니를 만든 경우(유니크 제약 위반)도 500 대신 400
+    def perform_create(self, serializer):
+        self._save_unique(super().perform_create, serializer)
+
+    def perform_update(self, serializer):
+        self._save_unique(super().perform_update, serializer)
+
+    @staticmethod
+    def _save_unique(save, serializer):
+        try:
+            with transaction.atomic():
+                save(serializer)
+        except IntegrityError:
+            raise exceptions.ValidationError({"meal_type": "같은 날짜에 이미 같은 끼니가 있습니다."})
 
     def _get_log_date_param(self):
         qp = self.request.query_params
@@ -114,9 +225,16 @@ class MealViewSet(BaseUserOwnedModelViewSet):
         log_date = self._get_log_date_param()
         if not log_date:
             return Response({"detail": "log_date=YYYY-MM-DD 쿼리 파라미터가 필요합니다."}, status=400)
+        # 버전은 조회 전에 읽는다 (조회 중 변경되면 다음 요청에서 200)
+        etag = day_etag(request.user.id, log_date, "meals")
+        if etag:
+            not_modified = if_none_match(request, etag)
+            record_conditional_get("meals_by_date", not_modified)
+            if not_modified:
+                return _not_modified(etag)
         qs = self.get_queryset().filter(log_date=log_date).order_by("id")
         ser = self.get_serializer(qs, many=True)
-        return Response(ser.data)
+        return _with_etag(Response(ser.data), etag)
 
     @action(detail=False, methods=["post"], url_path="ensure")
     def ensure(self, request):
@@ -136,6 +254,43 @@ class MealViewSet(BaseUserOwnedModelViewSet):
         return Response(self.get_serializer(obj).data,
                         status=status.HTTP_201_CREATED if created else status.HTTP_200_OK)
 
+    @action(
+        detail=False,
+        methods=["get"],
+        url_path="export",
+        renderer_classes=[JSONRenderer, NDJSONRenderer, CSVRenderer],
+    )
+    def export(self, request):
+        """
+        GET /api/meals/export/?format=ndjson|csv&start=YYYY-MM-DD&end=YYYY-MM-DD
+        식사 항목 전체를 평평한 행으로 스트리밍 (메모리 사용량 일정).
+        """
+        qp = request.query_params
+        fmt = (qp.get("format") or "ndjson").lower()
+        if fmt not in ("ndjson", "csv"):
+            return Response({"detail": "format은 ndjson 또는 csv 여야 합니다."}, status=400)
+
+        bounds = {}
+        for key in ("start", "end"):
+            raw = qp.get(key)
+            if not raw:
+                bounds[key] = None
+                continue
+            try:
+                bounds[key] = _date.fromisoformat(raw)
+            except ValueError:
+                return Response({"detail": f"{key}=YYYY-MM-DD 형식이어야 합니다."}, status=400)
+        if bounds["start"] and bounds["end"] and bounds["start"] > bounds["end"]:
+            return Response({"detail": "start는 end보다 이후일 수 없습니다."}, status=400)
+
+        rows = iter_export_rows(export_queryset(request.user, bounds["start"], bounds["end"]))
+        if fmt == "csv":
+            resp = StreamingHttpResponse(stream_csv(rows), content_type="text/csv; charset=utf-8")
+        else:
+            resp = StreamingHttpResponse(stream_ndjson(rows), content_type="application/x-ndjson")
+        resp["Content-Disposition"] = f'attachment; filename="meals.{fmt}"'
+        return resp
+
 
 # ─────────────────────────  식사 항목  ─────────────────────────
 class MealItemViewSet(viewsets.ModelViewSet):
@@ -144,9 +299,10 @@ class MealItemViewSet(viewsets.ModelViewSet):
     - 생성/수정 시 meal.user == request.user 검증
     - grams 기반 자동계산 값은 Serializer의 read-only 필드로 제공
     """
-    queryset = MealItem.objects.select_related("meal", "food")
+    queryset = MealItem.objects.select_related("meal", "food").with_nutrients()
     serializer_class = MealItemSerializer
     permission_classes = [permissions.IsAuthenticated]
+    pagination_class = KeysetPagination
     ordering = ("-id",)
 
     def get_queryset(self):
@@ -178,6 +334,7 @@ class NutritionLogViewSet(BaseUserOwnedModelViewSet):
     """
     queryset = NutritionLog.objects.select_related("user")
     serializer_class = NutritionLogSerializer
+    ordering = ("-date", "-id")  # (user, date) 유니크 인덱스로 커서 탐색
 
     def _get_log_date_param(self):
         qp = self.request.query_params
@@ -195,10 +352,16 @@ class NutritionLogViewSet(BaseUserOwnedModelViewSet):
         log_date = self._get_log_date_param()
         if not log_date:
             return Response({"detail": "log_date=YYYY-MM-DD 쿼리 파라미터가 필요합니다."}, status=400)
+        etag = day_etag(request.user.id, log_date, "nutrition")
+        if etag:
+            not_modified = if_none_match(request, etag)
+            record_conditional_get("nutritionlogs_by_date", not_modified)
+            if not_modified:
+                return _not_modified(etag)
         inst = self.get_queryset().filter(date=log_date).first()
         if not inst:
-            return Response({"detail": "해당 날짜의 NutritionLog가 없습니다."}, status=404)
-        return Response(self.get_serializer(inst).data)
+            return _with_etag(Response({"detail": "해당 날짜의 NutritionLog가 없습니다."}, status=404), etag)
+        return _with_etag(Response(self.get_serializer(inst).data), etag)
 
     @action(detail=False, methods=["post"], url_path="ensure")
     def ensure(self, request):
@@ -33,6 +33,7 @@
 
   let revokeUrl = null;
   let lastSavePayload = null;
+  let lastPreviewSummary = null; // 프리뷰 응답의 {label_ko, meal_type, macros} (save_payload 는 토큰만 담음)
   let lastPreviewPhotoUrl = null;
 
   // ---------- utils ----------
@@ -80,6 +81,7 @@
       commitButton.removeAttribute('data-payload');
     }
     lastSavePayload = null;
+    lastPreviewSummary = null;
     lastPreviewPhotoUrl = null;
 
     if (macrosTotalEl)  macrosTotalEl.innerHTML  = '';
@@ -203,7 +205,9 @@
         const emptyRow = historyList.querySelector('[data-history-empty]');
         if (emptyRow) emptyRow.remove();
 
-        const macros = lastSavePayload.macros || {};
+        // 서버가 실제 저장한 값 우선(servings/덮어쓰기 반영), 없으면 프리뷰 값
+        const saved = data.item || lastPreviewSummary || {};
+        const macros = saved.macros || {};
         const card = document.createElement('article');
         card.className = 'meal-history__item';
         card.dataset.historyItem = 'true';
@@ -220,19 +224,19 @@
 
         const serverPhotoUrl = data.photo_url || null;
         const thumbHtml = serverPhotoUrl
-          ? `<img src="${serverPhotoUrl}" alt="${escapeHtml(lastSavePayload.label_ko || '식사 사진')}">`
+          ? `<img src="${serverPhotoUrl}" alt="${escapeHtml(saved.label_ko || '식사 사진')}">`
           : (previewImage && previewImage.src
-              ? `<img src="${previewImage.src}" alt="${escapeHtml(lastSavePayload.label_ko || '식사 사진')}">`
+              ? `<img src="${previewImage.src}" alt="${escapeHtml(saved.label_ko || '식사 사진')}">`
               : '<span class="meal-history__emoji">🥗</span>');
 
-        const mealType = lastSavePayload.meal_type || '식사';
+        const mealType = saved.meal_type || '식사';
         card.innerHTML = `
           <div class="meal-history__thumb" aria-hidden="true">
             ${thumbHtml}
           </div>
           <div class="meal-history__info">
             <div class="meal-history__title-row">
-              <strong>${escapeHtml(lastSavePayload.label_ko || '분석 식사')}</strong>
+              <strong>${escapeHtml(saved.label_ko || '분석 식사')}</strong>
               <span class="badge badge--subtle meal-type--${mealTypeClass(mealType)}">${escapeHtml(mealType)}</span>
               <span class="badge badge--ai"><span aria-hidden="true">⚡</span>AI</span>
             </div>
@@ -247,6 +251,7 @@
 
       commitButton.hidden = true;
       lastSavePayload = null;
+      lastPreviewSummary = null;
     } catch (err) {
       if (commitErrorBox) {
         commitErrorBox.textContent = stringifyErr(err) || '저장 중 오류가 발생했습니다.';
@@ -352,11 +357,17 @@
       if (commitButton) {
         if (data.can_save && data.save_payload) {
           lastSavePayload = data.save_payload;
+          lastPreviewSummary = {
+            label_ko: data.label_ko || data.label || '',
+            meal_type: data.meal_type || '',
+            macros: data.macros_total || {},
+          };
           commitButton.hidden = false;
           commitButton.disabled = false;
           commitButton.dataset.payload = JSON.stringify(lastSavePayload);
         } else {
           lastSavePayload = null;
+          lastPreviewSummary = null;
           commitButton.hidden = true;
         }
       }
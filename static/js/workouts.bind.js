@@ -217,15 +217,11 @@
   }
 
   async function refreshSmartPanels(iso, planId) {
-    // 백엔드가 없어도 에러 없이 "No ..."로 안전 처리
-    const summary = await api.authFetch(`${API_BASE}/workoutplans/summary/?date=${encodeURIComponent(iso)}`);
-    renderSummary(summary);
-
-    const reco = await fetchJsonSafe(`${API_BASE}/recommendations/?date=${encodeURIComponent(iso)}${planId?`&workout_plan=${planId}`:""}`);
-    renderRecommendations(Array.isArray(reco?.results) ? reco.results : reco);
-
-    const insights = await fetchJsonSafe(`${API_BASE}/insights/today/?date=${encodeURIComponent(iso)}${planId?`&workout_plan=${planId}`:""}`);
-    renderInsights(insights);
+    // 요약/추천/인사이트를 통합 엔드포인트 한 번으로 (백엔드가 없어도 "No ..."로 안전 처리)
+    const day = await fetchJsonSafe(`${API_BASE}/workouts/day/?date=${encodeURIComponent(iso)}${planId?`&workout_plan=${planId}`:""}`);
+    renderSummary(day?.summary);
+    renderRecommendations(day?.recommendations);
+    renderInsights(day?.insights);
   }
 
   // ========= 목록 렌더 & 상호작용 =========
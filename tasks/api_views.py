@@ -1,29 +1,20 @@
 # tasks/api_views.py
-from datetime import datetime
+from dataclasses import dataclass, field
+from datetime import date, datetime
 from typing import Optional
 
-from django.conf import settings
-from django.core.exceptions import FieldError
-from django.db.models import Count, DateField, Q, Sum
-from django.db.models.functions import Cast
+from django.db.models import Case, Exists, IntegerField, OuterRef, Q, Value, When, Window
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from tasks.models import WorkoutLog
 
+from . import day_cache
+from .calories import completed_kcal_expr, norm_intensity
 from .models import TaskItem, WorkoutPlan
 
 # ---------- 설정 ----------
-kcal_per_min_default = getattr(settings, "WORKOUT_KCAL_PER_MIN", 5)
-INTENSITY_KCAL_MAP = {
-    "light": 4,
-    "low": 4,
-    "mid": 6,
-    "medium": 6,
-    "high": 8,
-    "hard": 9,
-}
 INTENSITY_WEIGHT = {
     "light": 1.0,
     "low": 1.0,
@@ -42,312 +33,242 @@ def parse_yyyy_mm_dd(s: str):
         return None
 
 
-def _has_field(model_cls, field_name: str) -> bool:
-    try:
-        model_cls._meta.get_field(field_name)
-        return True
-    except Exception:
-        return False
+# ---------- (user, date) → 플랜 해석 ----------
+# 요약/추천/인사이트가 같은 규칙으로 같은 플랜을 보도록 한 곳에서 결정.
+# 해석 1회(인덱스 wp_user_plan_date_idx) + Task 목록 1회(values), 결과는 요청 객체에 캐시
+DAY_CACHE_ATTR = "_workout_day_cache"
+TASK_FIELDS = ("id", "duration_min", "intensity", "completed", "exercise__name", "exercise__target")
+RECO_REMAIN_LIMIT = 200
 
 
-def filter_by_user(qs, user):
-    try:
-        return qs.filter(workout_plan__user=user)
-    except FieldError:
-        pass
-    try:
-        return qs.filter(user=user)
-    except FieldError:
-        pass
-    return qs
+@dataclass
+class WorkoutDay:
+    day: date
+    plan: Optional[WorkoutPlan]
+    tasks: list = field(default_factory=list)  # TASK_FIELDS dict 목록
+    calories: float = 0.0  # 완료 항목 kcal 합계 (DB SUM)
 
+    @property
+    def plan_id(self):
+        return self.plan.id if self.plan else None
 
-def any_date_filter(qs, d):
-    plan_date_fields = ["date", "plan_date", "scheduled_date", "scheduled_for", "day"]
-    for f in plan_date_fields:
-        try:
-            return qs.filter(**{f"workout_plan__{f}": d})
-        except FieldError:
-            continue
-    task_date_fields = [
-        "date",
-        "workout_date",
-        "scheduled_date",
-        "created_at__date",
-        "completed_at__date",
-    ]
-    for f in task_date_fields:
-        try:
-            return qs.filter(**{f: d})
-        except FieldError:
-            continue
-    return None
 
-
-def latest_plan_tasks(qs):
-    plan_ids = list(
-        qs.exclude(workout_plan__isnull=True)
-        .values_list("workout_plan_id", flat=True)
-        .distinct()
+def resolve_plan(user, d, plan_id=None):
+    """
+    쿼리 1회로 플랜 결정. 우선순위(같은 순위면 최신 created_at, id):
+    0) workout_plan 지정 시 그 플랜 (본인 소유만)
+    1) 그날 WorkoutLog 가 연결된 플랜
+    2) plan_date == d
+    3) Task 가 있는 가장 최근 플랜 (폴백)
+    """
+    plans = WorkoutPlan.objects.filter(user=user)
+    if plan_id:
+        return plans.filter(id=plan_id).first()
+    logged = WorkoutLog.objects.filter(user=user, date=d).values("workout_plan_id")
+    has_tasks = Exists(TaskItem.objects.filter(workout_plan=OuterRef("pk")))
+    return (
+        plans.filter(Q(id__in=logged) | Q(plan_date=d) | has_tasks)
+        .annotate(
+            _rank=Case(
+                When(id__in=logged, then=Value(0)),
+                When(plan_date=d, then=Value(1)),
+                default=Value(2),
+                output_field=IntegerField(),
+            )
+        )
+        .order_by("_rank", "-created_at", "-id")
+        .first()
     )
-    candidates = WorkoutPlan.objects.all()
-    if plan_ids:
-        candidates = candidates.filter(id__in=plan_ids)
-    for field in ["-created_at", "-created", "-updated_at", "-updated", "-id"]:
-        try:
-            latest = candidates.order_by(field).first()
-            if latest:
-                return qs.filter(workout_plan=latest)
-        except FieldError:
-            continue
-    return qs.none()
 
 
-def base_qs(request_user, date_str: str, plan_id: Optional[str]):
-    d = parse_yyyy_mm_dd(date_str)
+def _parse_day_params(date_str, plan_id):
+    d = parse_yyyy_mm_dd(date_str or "")
     if not d:
         raise ValueError("invalid date format")
-    qs = TaskItem.objects.select_related("workout_plan", "exercise")
-    qs = filter_by_user(qs, request_user)
-
     if plan_id:
         try:
-            pid = int(plan_id)
-        except Exception:
+            plan_id = int(plan_id)
+        except (TypeError, ValueError):
             raise ValueError("invalid workout_plan id")
-        return qs.filter(workout_plan_id=pid)
+    return d, plan_id or None
 
-    matched = any_date_filter(qs, d)
-    if matched is not None and matched.exists():
-        return matched
 
-    for f in ["created_at", "created", "updated_at", "updated"]:
-        try:
-            casted = qs.annotate(
-                _pdate=Cast(f"workout_plan__{f}", output_field=DateField())
+def _request_memo(request):
+    holder = getattr(request, "_request", request)  # DRF Request → HttpRequest 에 저장
+    return holder.__dict__.setdefault(DAY_CACHE_ATTR, {})
+
+
+def resolve_day(request, date_str, plan_id=None) -> WorkoutDay:
+    """
+    요청 단위 캐시. 같은 요청 안에서 (date, plan) 이 같으면 DB 재조회 없음.
+    잘못된 date / workout_plan 은 ValueError.
+    """
+    d, plan_id = _parse_day_params(date_str, plan_id)
+    memo = _request_memo(request)
+    key = ("day", request.user.pk, d, plan_id)
+    if key not in memo:
+        plan = resolve_plan(request.user, d, plan_id)
+        tasks = []
+        if plan:
+            # 완료 kcal 합계는 창 함수(SUM ... OVER ())로 같은 쿼리에서 → 파이썬 합산 없음
+            tasks = list(
+                plan.tasks.order_by("order", "id")
+                .values(*TASK_FIELDS, done_kcal=Window(completed_kcal_expr()))
             )
-            tmp = casted.filter(_pdate=d)
-            if tmp.exists():
-                return tmp
-        except FieldError:
-            continue
-    return latest_plan_tasks(qs)
-
-
-def norm_intensity(val: str | None) -> str:
-    if not val:
-        return "medium"
-    v = str(val).strip().lower()
-    if v in ("mid",):
-        return "medium"
-    if v in ("light", "low"):
-        return "light"
-    if v in ("high", "hard", "intense"):
-        return "high"
-    if v not in ("light", "medium", "high"):
-        return "medium"
-    return v
-
-
-def kcal_per_min_for(task) -> int:
-    try:
-        intensity = norm_intensity(getattr(task, "intensity", None))
-        return INTENSITY_KCAL_MAP.get(intensity, kcal_per_min_default)
-    except Exception:
-        return kcal_per_min_default
+        calories = (tasks[0]["done_kcal"] or 0.0) if tasks else 0.0
+        memo[key] = WorkoutDay(day=d, plan=plan, tasks=tasks, calories=calories)
+    return memo[key]
 
 
 def task_group_key(t):
-    for f in (
-        "muscle_group",
-        "body_part",
-        "category",
-        "exercise_group",
-        "type",
-        "target",
-    ):
-        try:
-            val = getattr(t, f, None)
-            if val:
-                return str(val)
-        except Exception:
-            continue
-    try:
-        val = t.exercise and getattr(t.exercise, "group", None)
-        if val:
-            return str(val)
-    except Exception:
-        pass
-    return "기타"
+    """추천 그룹: 운동 대상 부위(Exercise.target), 없으면 '기타'."""
+    return str(t.get("exercise__target") or "기타")
+
+
+# ---------- 하루 요약 (요약/칼로리/추천/인사이트 한 번에) ----------
+def day_payload(day: WorkoutDay):
+    """Task 목록을 한 번 훑어 summary / recommendations / insights 를 모두 계산."""
+    total_min = done_count = 0
+    remain_minutes = remain_count = 0
+    groups = {}  # 남은 항목: 부위 → [개수, 분]
+    ints = {"light": 0, "medium": 0, "high": 0}
+    best_name, best_score = None, -1
+
+    for t in day.tasks:
+        mins = int(t["duration_min"] or 0)
+        inten = norm_intensity(t["intensity"])
+        total_min += mins
+
+        # 대표 운동: duration_min * 강도 가중치
+        score = mins * INTENSITY_WEIGHT.get(inten, 1.2)
+        if score > best_score:
+            best_score, best_name = score, t["exercise__name"] or "Exercise"
+
+        if t["completed"]:
+            done_count += 1
+        elif remain_count < RECO_REMAIN_LIMIT:
+            remain_count += 1
+            remain_minutes += mins
+            ints[inten] += 1
+            g = groups.setdefault(task_group_key(t), [0, 0])
+            g[0] += 1
+            g[1] += mins
+
+    date_str = day.day.isoformat()
+    summary = {
+        "date": date_str,
+        "workout_plan": day.plan_id,
+        "total_min": total_min,
+        "tasks_count": len(day.tasks),
+        "completed_count": done_count,
+        "calories": int(day.calories),  # 완료 항목만 (calories.completed_kcal_expr)
+        "note": "기본 요약입니다.",
+    }
+
+    # 추천
+    # 1) 할 일 없음 → 플랜 생성 유도
+    # 2) 남은 항목 그룹핑 → 최다 그룹 추천
+    # 3) 남은 항목 강도/총 시간에 따라 가이드 문구
+    if not day.tasks:
+        recos = [
+            {
+                "title": "오늘 계획이 없어요",
+                "action_text": "플랜 생성",
+                "action_url": "/tasks/workouts/#wk-ensure-today",
+            }
+        ]
+    else:
+        recos = []
+        if groups:
+            gname, (n, _) = max(groups.items(), key=lambda kv: (kv[1][0], kv[1][1]))
+            recos.append({"title": f"{gname} 중심으로 마무리해보세요 ({n}개 남음)"})
+        hi, med, low = ints["high"], ints["medium"], ints["light"]
+        if remain_minutes <= 20 and med + low >= hi:
+            recos.append({"title": "남은 시간 20분 이하 — 전신 서킷으로 깔끔하게!"})
+        elif hi >= med + low:
+            recos.append({"title": "고강도 위주 — 세트 간 휴식 90초로 품질 유지"})
+        else:
+            recos.append({"title": "중강도 위주 — 마지막은 스트레칭으로 마무리"})
+
+    # 인사이트
+    bullets = []
+    if best_name:
+        bullets.append(f"대표 운동: {best_name}")
+    if day.tasks:
+        bullets.append(f"진행: {done_count}/{len(day.tasks)}")
+    bullets.append(f"총 계획 시간: {total_min}분")
+
+    return {
+        "date": date_str,
+        "workout_plan": day.plan_id,
+        "summary": summary,
+        "recommendations": recos,
+        "insights": {"bullets": bullets},
+    }
+
+
+def workout_day(request, date_str, plan_id=None):
+    """
+    하루 요약 payload. 요청 안에서는 메모, 요청 사이에는 캐시(day_cache, 쓰기 시 무효화).
+    잘못된 date / workout_plan 은 ValueError.
+    """
+    d, plan_id = _parse_day_params(date_str, plan_id)
+    memo = _request_memo(request)
+    key = ("payload", request.user.pk, d, plan_id)
+    if key not in memo:
+        memo[key] = day_cache.get_or_build(
+            request.user.pk, d, plan_id, lambda: day_payload(resolve_day(request, date_str, plan_id))
+        )
+    return memo[key]
 
 
 # ---------- API ----------
-class WorkoutSummaryView(APIView):
+class WorkoutDayView(APIView):
+    """
+    GET /api/workouts/day/?date=YYYY-MM-DD[&workout_plan=<id>]
+    운동 페이지 Today 패널용 통합 응답: summary + recommendations + insights
+    """
+
     permission_classes = [IsAuthenticated]
 
     def get(self, request):
         date_str = request.query_params.get("date")
-        plan_id = request.query_params.get("workout_plan")
         if not date_str:
             return Response({"detail": "date is required (YYYY-MM-DD)"}, status=400)
-
-        # 이 파일 상단에 이미 있는 유틸 사용
-        qdate = parse_yyyy_mm_dd(date_str)
-        if not qdate:
-            return Response({"detail": "invalid date format (YYYY-MM-DD)"}, status=400)
-
-        user = request.user
-
-        # 1) plan_id가 없으면, ★WorkoutLog(user, date)에서 plan 먼저 유추
-        if not plan_id:
-            plan = WorkoutPlan.objects.filter(
-                user=user,
-                id__in=WorkoutLog.objects.filter(user=user, date=qdate).values_list(
-                    "workout_plan_id", flat=True
-                ),
-            ).first()
-
-            # 2) 그래도 못 찾으면, 모델에 date 필드가 있을 때만 보조로 시도
-            if plan is None and hasattr(WorkoutPlan, "date"):
-                plan = WorkoutPlan.objects.filter(user=user, date=qdate).first()
-
-            if plan:
-                plan_id = str(plan.id)
-
-        # 3) 이후 로직은 기존과 동일: base_qs로 쿼리 구성
         try:
-            qs = base_qs(user, date_str, plan_id)
+            payload = workout_day(request, date_str, request.query_params.get("workout_plan"))
         except ValueError as e:
             return Response({"detail": str(e)}, status=400)
+        return Response(payload)
 
-        has_completed = _has_field(TaskItem, "completed")
 
-        agg = qs.aggregate(
-            total_min=Sum("duration_min"),
-            tasks_count=Count("id"),
-        )
-        total_min = int(agg.get("total_min") or 0)
-        tasks_count = int(agg.get("tasks_count") or 0)
-
-        if has_completed:
-            try:
-                completed_count = int(qs.filter(completed=True).count())
-            except Exception:
-                completed_count = 0
-        else:
-            completed_count = 0
+# 아래 세 뷰는 기존 프런트 호환용: 통합 payload 의 일부만 반환
+class WorkoutSummaryView(APIView):
+    permission_classes = [IsAuthenticated]
 
-        # 칼로리 집계
-        calories_sum = 0
+    def get(self, request):
+        date_str = request.query_params.get("date")
+        if not date_str:
+            return Response({"detail": "date is required (YYYY-MM-DD)"}, status=400)
         try:
-            done_iterable = qs.filter(completed=True) if has_completed else qs
-            for t in done_iterable.values("duration_min", "intensity"):
-                minutes = int(t.get("duration_min") or 0)
-                intensity = norm_intensity(t.get("intensity"))
-                rate = INTENSITY_KCAL_MAP.get(intensity, kcal_per_min_default)
-                calories_sum += minutes * rate
-        except Exception:
-            try:
-                for t in done_iterable[:200] if has_completed else qs[:200]:
-                    minutes = int(getattr(t, "duration_min", 0) or 0)
-                    rate = kcal_per_min_for(t)
-                    calories_sum += minutes * rate
-            except Exception:
-                calories_sum = 0
-
-        return Response(
-            {
-                "date": date_str,
-                "workout_plan": (
-                    int(plan_id) if plan_id else None
-                ),  # ← 이제 null 아님(유추 성공 시)
-                "total_min": total_min,
-                "tasks_count": tasks_count,
-                "completed_count": completed_count,
-                "calories": int(calories_sum),
-                "note": "기본 요약입니다.",
-            }
-        )
+            payload = workout_day(request, date_str, request.query_params.get("workout_plan"))
+        except ValueError as e:
+            return Response({"detail": str(e)}, status=400)
+        return Response(payload["summary"])
 
 
 class RecommendationsView(APIView):
-    """
-    규칙:
-    1) 할 일 없음 → 플랜 생성 유도
-    2) 남은(Task.completed=False) 항목 그룹핑 → 최다 그룹 추천
-    3) 남은 항목 평균 강도/총 시간에 따라 가이드 문구
-    """
-
     permission_classes = [IsAuthenticated]
 
     def get(self, request):
         date_str = request.query_params.get("date")
-        plan_id = request.query_params.get("workout_plan")
         if not date_str:
             return Response({"detail": "date is required"}, status=400)
         try:
-            qs = base_qs(request.user, date_str, plan_id)
+            payload = workout_day(request, date_str, request.query_params.get("workout_plan"))
         except ValueError as e:
             return Response({"detail": str(e)}, status=400)
-
-        total = qs.count()
-        if total == 0:
-            return Response(
-                [
-                    {
-                        "title": "오늘 계획이 없어요",
-                        "action_text": "플랜 생성",
-                        "action_url": "/tasks/workouts/#wk-ensure-today",
-                    }
-                ]
-            )
-
-        # 남은 항목 계산 (completed 필드 유무 가드)
-        has_completed = _has_field(TaskItem, "completed")
-        try:
-            remain_qs = qs.filter(completed=False) if has_completed else qs
-        except Exception:
-            remain_qs = qs
-
-        remain = list(remain_qs[:200])
-
-        # 2) 그룹핑
-        groups = {}
-        for t in remain:
-            key = task_group_key(t)
-            groups.setdefault(key, {"items": [], "minutes": 0, "ints": []})
-            groups[key]["items"].append(t)
-            groups[key]["minutes"] += int(getattr(t, "duration_min", 0) or 0)
-            groups[key]["ints"].append(norm_intensity(getattr(t, "intensity", None)))
-
-        recos = []
-        if groups:
-            gname, info = sorted(
-                groups.items(),
-                key=lambda kv: (len(kv[1]["items"]), kv[1]["minutes"]),
-                reverse=True,
-            )[0]
-            recos.append(
-                {
-                    "title": f"{gname} 중심으로 마무리해보세요 ({len(info['items'])}개 남음)"
-                }
-            )
-
-        # 3) 강도/시간 기반 가이드
-        remain_minutes = sum(int(getattr(t, "duration_min", 0) or 0) for t in remain)
-        ints = [norm_intensity(getattr(t, "intensity", None)) for t in remain]
-        hi = sum(1 for x in ints if x == "high")
-        med = sum(1 for x in ints if x == "medium")
-        low = sum(1 for x in ints if x == "light")
-
-        if remain_minutes <= 20 and med + low >= hi:
-            recos.append({"title": "남은 시간 20분 이하 — 전신 서킷으로 깔끔하게!"})
-        elif hi >= med + low:
-            recos.append({"title": "고강도 위주 — 세트 간 휴식 90초로 품질 유지"})
-        else:
-            recos.append({"title": "중강도 위주 — 마지막은 스트레칭으로 마무리"})
-
-        return Response(recos)
+        return Response(payload["recommendations"])
 
 
 class TodayInsightsView(APIView):
@@ -362,121 +283,18 @@ class TodayInsightsView(APIView):
 
     def get(self, request):
         date_str = request.query_params.get("date")
-        plan_id = request.query_params.get("workout_plan")
         debug = request.query_params.get("debug") == "1"
-
         if not date_str:
             return Response({"detail": "date is required"}, status=400)
-
         try:
-            qs = base_qs(request.user, date_str, plan_id)
+            payload = workout_day(request, date_str, request.query_params.get("workout_plan"))
         except ValueError as e:
             return Response({"detail": str(e)}, status=400)
         except Exception as e:
             if debug:
                 return Response(
-                    {"detail": f"base_qs error: {e.__class__.__name__}: {e}"},
-                    status=500,
-                )
-            return Response({"bullets": []}, status=200)
-
-        bullets = []
-        try:
-            # 1) 대표 운동 후보
-            candidates = []
-            try:
-                candidates = list(
-                    qs.values("exercise_name", "duration_min", "intensity")
-                )
-            except Exception:
-                candidates = []
-
-            if not candidates:
-                try:
-                    candidates = list(
-                        qs.values("exercise__name", "duration_min", "intensity")
-                    )
-                except Exception:
-                    candidates = []
-
-            if not candidates:
-                tmp = []
-                for t in qs[:50]:
-                    try:
-                        name = getattr(t, "exercise_name", None)
-                        if not name and getattr(t, "exercise", None):
-                            name = getattr(t.exercise, "name", None)
-                        if not name:
-                            name = (
-                                getattr(t, "name", None)
-                                or getattr(t, "title", None)
-                                or getattr(t, "label", None)
-                                or "Exercise"
-                            )
-                        mins = int(getattr(t, "duration_min", 0) or 0)
-                        inten = getattr(t, "intensity", None)
-                        tmp.append({"_name": name, "_mins": mins, "_intensity": inten})
-                    except Exception:
-                        continue
-                if tmp:
-                    candidates = [
-                        {
-                            "exercise_name": x["_name"],
-                            "duration_min": x["_mins"],
-                            "intensity": x["_intensity"],
-                        }
-                        for x in tmp
-                    ]
-
-            # 2) 가중치 스코어
-            best_name, best_score = None, -1
-            for t in candidates:
-                try:
-                    name = (
-                        t.get("exercise_name") or t.get("exercise__name") or "Exercise"
-                    )
-                    mins = int(t.get("duration_min") or 0)
-                    inten = t.get("intensity")
-                    v = str(inten).strip().lower() if inten else "medium"
-                    if v == "mid":
-                        v = "medium"
-                    weight = INTENSITY_WEIGHT.get(v, 1.2)
-                    score = mins * weight
-                    if score > best_score:
-                        best_score = score
-                        best_name = name
-                except Exception:
-                    continue
-            if best_name:
-                bullets.append(f"대표 운동: {best_name}")
-
-            # 3) 진행도
-            has_completed = _has_field(TaskItem, "completed")
-            try:
-                total = qs.count()
-                if total:
-                    done = qs.filter(completed=True).count() if has_completed else 0
-                    bullets.append(f"진행: {done}/{total}")
-            except Exception:
-                pass
-
-            # 4) 총 계획 시간
-            try:
-                total_min = (
-                    qs.aggregate(Sum("duration_min")).get("duration_min__sum") or 0
-                )
-                bullets.append(f"총 계획 시간: {int(total_min)}분")
-            except Exception:
-                pass
-
-            return Response({"bullets": bullets})
-        except Exception as e:
-            if debug:
-                return Response(
-                    {
-                        "detail": f"insights error: {e.__class__.__name__}: {e}",
-                        "bullets": [],
-                    },
+                    {"detail": f"insights error: {e.__class__.__name__}: {e}", "bullets": []},
                     status=500,
                 )
             return Response({"bullets": []})
+        return Response(payload["insights"])
@@ -0,0 +1,73 @@
+"""
+tasks/calories.py
+
+TaskItem 소모 칼로리 = duration_min × 분당 kcal.
+분당 kcal 은 Exercise.kcal_burned_per_min(> 0) 우선, 없으면 강도별 기본값(INTENSITY_KCAL_MAP).
+
+- kcal_expr(): 같은 규칙의 SQL 식 (annotate / aggregate 에 그대로 사용)
+- completed_kcal_expr(): 완료 항목 칼로리 합계 SUM 식
+  (하루 요약은 Task 목록 조회에 창 함수로 붙여 같은 쿼리에서 합계를 받음 — api_views.resolve_day)
+- kcal_per_min(rate, intensity): 이미 읽어 온 값용 파이썬 버전 (WorkoutLog 동기화 → 대시보드/일일 합계가 읽음)
+"""
+from django.conf import settings
+from django.db.models import Case, ExpressionWrapper, F, FloatField, Q, Sum, Value, When
+from django.db.models.functions import Lower, Trim
+from django.db.models.lookups import In
+
+kcal_per_min_default = getattr(settings, "WORKOUT_KCAL_PER_MIN", 5)
+INTENSITY_KCAL_MAP = {
+    "light": 4,
+    "low": 4,
+    "mid": 6,
+    "medium": 6,
+    "high": 8,
+    "hard": 9,
+}
+# norm_intensity 와 같은 묶음 (그 외 값/빈 값은 medium)
+LIGHT_ALIASES = ("light", "low")
+HIGH_ALIASES = ("high", "hard", "intense")
+
+
+def norm_intensity(val: str | None) -> str:
+    if not val:
+        return "medium"
+    v = str(val).strip().lower()
+    if v in LIGHT_ALIASES:
+        return "light"
+    if v in HIGH_ALIASES:
+        return "high"
+    return "medium"
+
+
+def kcal_per_min_for(intensity) -> int:
+    return INTENSITY_KCAL_MAP.get(norm_intensity(intensity), kcal_per_min_default)
+
+
+def kcal_per_min(rate, intensity) -> float:
+    """운동별 분당 kcal 이 있으면 그 값, 없으면 강도 기본값."""
+    return float(rate) if rate and rate > 0 else float(kcal_per_min_for(intensity))
+
+
+def kcal_rate_expr(prefix=""):
+    """분당 kcal SQL 식. prefix: TaskItem 까지의 경로 (예: "task_items__")."""
+    inten = Lower(Trim(f"{prefix}intensity"))
+    by_intensity = Case(
+        When(In(inten, LIGHT_ALIASES), then=Value(float(kcal_per_min_for("light")))),
+        When(In(inten, HIGH_ALIASES), then=Value(float(kcal_per_min_for("high")))),
+        default=Value(float(kcal_per_min_for("medium"))),
+        output_field=FloatField(),
+    )
+    rate = f"{prefix}exercise__kcal_burned_per_min"
+    return Case(
+        When(**{f"{rate}__gt": 0}, then=F(rate)),
+        default=by_intensity,
+        output_field=FloatField(),
+    )
+
+
+def kcal_expr(prefix=""):
+    return ExpressionWrapper(F(f"{prefix}duration_min") * kcal_rate_expr(prefix), output_field=FloatField())
+
+
+def completed_kcal_expr(prefix=""):
+    return Sum(kcal_expr(prefix), filter=Q(**{f"{prefix}completed": True}), output_field=FloatField())
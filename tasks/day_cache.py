@@ -0,0 +1,66 @@
+"""
+tasks/day_cache.py
+
+운동 하루 요약(/api/workouts/day/) 응답 캐시.
+
+- 키: (user, date, workout_plan) + 사용자별 버전
+- TaskItem / WorkoutLog / WorkoutPlan 저장·삭제 시 버전 증가(signals.py, 커밋 후)
+  → 날짜 해석에 폴백(최근 플랜)이 있어 특정 날짜만 지우기 어렵기 때문에 사용자 단위로 무효화
+- 버전 키가 사라지면 time_ns() 로 새로 시작 → 예전 캐시 항목과 절대 겹치지 않음
+- settings.WORKOUT_DAY_CACHE_TTL=0 이면 캐시 안 함 (LocMem 기본값)
+"""
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+VERSION_TIMEOUT = 60 * 60 * 24 * 7
+
+
+def _ver_key(user_id):
+    return f"tasks:workoutday:ver:{user_id}"
+
+
+def cache_ttl():
+    return int(getattr(settings, "WORKOUT_DAY_CACHE_TTL", 0) or 0)
+
+
+def bump_user_version(user_id):
+    if not (user_id and cache_ttl()):
+        return
+    key = _ver_key(user_id)
+
+    def _incr():
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.set(key, time.time_ns(), VERSION_TIMEOUT)
+
+    transaction.on_commit(_incr)
+
+
+def _version(user_id):
+    key = _ver_key(user_id)
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, time.time_ns(), VERSION_TIMEOUT)
+        version = cache.get(key)
+    return version
+
+
+def _key(user_id, d, plan_id):
+    return f"tasks:workoutday:{user_id}:{d.isoformat()}:{plan_id or '-'}:{_version(user_id)}"
+
+
+def get_or_build(user_id, d, plan_id, build):
+    """캐시에 있으면 그대로, 없으면 build() 결과를 저장 후 반환."""
+    ttl = cache_ttl()
+    if not ttl:
+        return build()
+    key = _key(user_id, d, plan_id)
+    payload = cache.get(key)
+    if payload is None:
+        payload = build()
+        cache.set(key, payload, ttl)
+    return payload
@@ -0,0 +1,101 @@
+"""
+tasks/exercise_cache.py
+
+운동 카탈로그(/api/exercises/, /api/exercises/targets/)와 fixture(/api/fixtures/exercises/) 응답 캐시.
+
+- 배포/관리자 수정 때만 바뀌는 데이터 → 프로세스 메모리에 응답 payload 보관
+- 카탈로그: 공유 캐시의 버전 키로 무효화. Exercise 저장/삭제 시 커밋 후 버전 증가(signals.py)
+  (LocMem 은 프로세스마다 버전이 따로라 settings.EXERCISE_CATALOG_TTL 로 최대 지연을 제한)
+- fixture: 파일 (경로, mtime, 크기)가 같으면 다시 읽거나 파싱하지 않음
+- ETag = payload 해시 → 프로세스/버전과 무관하게 내용이 같으면 같은 값 (If-None-Match 일치 시 304)
+"""
+import hashlib
+import json
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+VERSION_KEY = "tasks:exercises:ver"
+VERSION_TIMEOUT = 60 * 60 * 24 * 7
+# 필터 값(target 등)마다 항목이 생기므로 상한 초과 시 통째로 비움
+MEMO_MAX_ENTRIES = 256
+
+_memo = {}  # key → (version, 만료 monotonic, payload, etag)
+_lock = threading.Lock()
+
+
+def catalog_ttl():
+    return int(getattr(settings, "EXERCISE_CATALOG_TTL", 300) or 0)
+
+
+def http_max_age():
+    return int(getattr(settings, "EXERCISE_HTTP_MAX_AGE", 60) or 0)
+
+
+def bump_version():
+    def _incr():
+        try:
+            cache.incr(VERSION_KEY)
+        except ValueError:
+            cache.set(VERSION_KEY, time.time_ns(), VERSION_TIMEOUT)
+        _memo.clear()  # 같은 프로세스는 다음 요청부터 바로 반영
+
+    transaction.on_commit(_incr)
+
+
+def catalog_version():
+    version = cache.get(VERSION_KEY)
+    if version is None:
+        cache.add(VERSION_KEY, time.time_ns(), VERSION_TIMEOUT)
+        version = cache.get(VERSION_KEY)
+    return version
+
+
+def payload_etag(kind, payload):
+    raw = json.dumps(payload, sort_keys=True, ensure_ascii=False, default=str).encode("utf-8")
+    return f'W/"{kind}-{hashlib.sha1(raw).hexdigest()[:20]}"'
+
+
+def get_or_build(kind, params, build, version=None):
+    """
+    (kind, params) 응답을 메모리에서 꺼내거나 build() 로 만들어 보관.
+    version 을 주지 않으면 카탈로그 버전 사용. 반환: (payload, etag)
+    """
+    ttl = catalog_ttl()
+    if not ttl:
+        payload = build()
+        return payload, payload_etag(kind, payload)
+
+    version = catalog_version() if version is None else version
+    key = (kind, params)
+    now = time.monotonic()
+    hit = _memo.get(key)
+    if hit and hit[0] == version and hit[1] > now:
+        return hit[2], hit[3]
+
+    payload = build()
+    etag = payload_etag(kind, payload)
+    with _lock:
+        if len(_memo) >= MEMO_MAX_ENTRIES:
+            _memo.clear()
+        _memo[key] = (version, now + ttl, payload, etag)
+    return payload, etag
+
+
+def clear():
+    _memo.clear()
+
+
+def if_none_match(request, etag):
+    header = request.META.get("HTTP_IF_NONE_MATCH", "")
+    return bool(etag) and (header.strip() == "*" or etag in [t.strip() for t in header.split(",")])
+
+
+def with_cache_headers(response, etag):
+    response["ETag"] = etag
+    # 로그인 사용자 전용 → 공유 캐시 저장 금지, max-age 동안은 재요청 없이, 이후엔 If-None-Match 로 재검증
+    response["Cache-Control"] = f"private, max-age={http_max_age()}"
+    return response
@@ -0,0 +1,32 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from tasks.models import WorkoutPlan
+from tasks.plan_dates import backfill_plan_dates
+
+
+class Command(BaseCommand):
+    help = (
+        "WorkoutPlan.plan_date 가 비어 있는 행을 created_at 의 현지 날짜로 배치 백필 "
+        "(0007 적용 후, 0008/0009 전에 미리 돌려 두면 마이그레이션 잠금 시간이 짧아짐)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=2000, help="배치당 행 수 (기본 2000)")
+        parser.add_argument("--dry-run", action="store_true", help="대상 건수만 출력")
+
+    def handle(self, *args, **opt):
+        if opt["batch_size"] <= 0:
+            raise CommandError("--batch-size 는 양수여야 합니다.")
+        n = backfill_plan_dates(
+            WorkoutPlan,
+            batch_size=opt["batch_size"],
+            dry_run=opt["dry_run"],
+            connection=connection,
+            log=self.stdout.write,
+        )
+        if opt["dry_run"]:
+            self.stdout.write(f"[대상] plan_date 비어 있음: {n}건")
+            self.stdout.write(self.style.WARNING("DRY-RUN: 변경하지 않았습니다."))
+            return
+        self.stdout.write(self.style.SUCCESS(f"plan_date 백필 완료: {n}건"))
@@ -0,0 +1,40 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.utils import timezone
+
+from tasks.models import DailyTaskProgress, WorkoutPlan
+from tasks.progress import refresh_days
+from users.models import CustomUser
+
+
+class Command(BaseCommand):
+    help = "TaskItem 기록으로 일별 진행 롤업(DailyTaskProgress)을 다시 만든다 (progress-history 용)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--weeks", type=int, default=52, help="최근 몇 주를 다시 계산할지 (기본 52)")
+        parser.add_argument("--only-user", type=str, default=None, help="특정 사용자만")
+
+    def handle(self, *args, **opt):
+        if opt["weeks"] <= 0:
+            raise CommandError("--weeks 는 양수여야 합니다.")
+        since = timezone.localdate() - timedelta(weeks=opt["weeks"])
+        plans = WorkoutPlan.objects.filter(plan_date__gte=since)
+        if opt["only_user"]:
+            users = CustomUser.objects.filter(username=opt["only_user"])
+            if not users.exists():
+                raise CommandError(f"username={opt['only_user']} 없음")
+            plans = plans.filter(user__in=users)
+
+        dates_by_user = {}
+        for user_id, d in plans.values_list("user_id", "plan_date").distinct().iterator():
+            dates_by_user.setdefault(user_id, set()).add(d)
+
+        for user_id, dates in dates_by_user.items():
+            with transaction.atomic():
+                # 플랜이 없어진 날짜의 남은 행도 정리
+                stale = DailyTaskProgress.objects.filter(user_id=user_id, date__gte=since).exclude(date__in=dates)
+                stale.delete()
+                refresh_days(user_id, dates)
+        self.stdout.write(self.style.SUCCESS(f"진행 롤업 재계산 완료: 사용자 {len(dates_by_user)}명"))
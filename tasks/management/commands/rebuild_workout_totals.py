@@ -0,0 +1,34 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.db.models import Sum
+from django.utils import timezone
+
+from tasks.models import DailyWorkoutTotal, WorkoutLog
+
+
+class Command(BaseCommand):
+    help = "WorkoutLog 로 하루 운동 합계(DailyWorkoutTotal)를 다시 계산 (관리자 수정/시드 등으로 어긋났을 때)"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--days", type=int, default=90, help="최근 며칠을 다시 계산할지 (기본 90)")
+
+    def handle(self, *args, **opt):
+        if opt["days"] <= 0:
+            raise CommandError("--days 는 양수여야 합니다.")
+        since = timezone.localdate() - timedelta(days=opt["days"])
+        rows = (
+            WorkoutLog.objects.filter(date__gte=since)
+            .values("user_id", "date")
+            .annotate(minutes=Sum("duration_min"), kcal=Sum("kcal_burned"))
+            .order_by()
+        )
+        totals = [
+            DailyWorkoutTotal(user_id=r["user_id"], date=r["date"], minutes=r["minutes"] or 0, kcal=r["kcal"] or 0.0)
+            for r in rows
+        ]
+        with transaction.atomic():
+            DailyWorkoutTotal.objects.filter(date__gte=since).delete()
+            DailyWorkoutTotal.objects.bulk_create(totals, batch_size=1000)
+        self.stdout.write(self.style.SUCCESS(f"하루 운동 합계 재계산 완료: {len(totals)}건"))
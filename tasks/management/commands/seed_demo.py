@@ -217,6 +217,7 @@ class Command(BaseCommand):
             wp, _ = WorkoutPlan.objects.get_or_create(
                 user=u, title=title,
                 defaults={
+                    "plan_date": day,
                     "description": "demo",
                     "summary": "demo",
                     "target_focus": "general",
@@ -226,10 +227,13 @@ class Command(BaseCommand):
                     "updated_at": timezone.now(),
                 }
             )
-            # created_at이 당일로 보이도록 보정
+            # created_at / plan_date 가 당일로 보이도록 보정
             if getattr(wp, "created_at", None) and wp.created_at.date() != day:
                 wp.created_at = aware(datetime.combine(day, time(9, 0)))
                 wp.save(update_fields=["created_at"])
+            if wp.plan_date != day:
+                wp.plan_date = day
+                wp.save(update_fields=["plan_date"])
             return wp  # type: ignore[return-value]
 
         def make_task(wp: 'WP', ex: 'EX', day: date, order: int, done: bool) -> 'TI':
@@ -0,0 +1,22 @@
+# Generated by Django 5.2.7 on 2026-10-18 21:04
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("goals", "0002_initial"),
+        ("tasks", "0005_taskitem_completed_taskitem_completed_at_and_more"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="workoutplan",
+            index=models.Index(
+                fields=["user", "created_at", "id"], name="wp_user_created_id_idx"
+            ),
+        ),
+    ]
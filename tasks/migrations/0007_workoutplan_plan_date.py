@@ -0,0 +1,29 @@
+# Generated by Django 5.2.7 on 2026-10-18 21:36
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("goals", "0002_initial"),
+        ("tasks", "0006_workoutplan_user_created_id_idx"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    # 우선 NULL 허용으로 추가 (callable default 를 기존 행 전체에 같은 날짜로 채우지 않도록)
+    # → 0008 에서 created_at 기준 백필 → 0009 에서 NOT NULL
+    operations = [
+        migrations.AddField(
+            model_name="workoutplan",
+            name="plan_date",
+            field=models.DateField(db_index=True, null=True, verbose_name="계획 날짜"),
+        ),
+        migrations.AddIndex(
+            model_name="workoutplan",
+            index=models.Index(
+                fields=["user", "plan_date"], name="wp_user_plan_date_idx"
+            ),
+        ),
+    ]
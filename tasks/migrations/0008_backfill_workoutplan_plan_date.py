@@ -0,0 +1,47 @@
+from django.conf import settings
+from django.db import migrations
+from django.utils import timezone
+
+BATCH_SIZE = 2000
+
+
+def backfill(apps, schema_editor):
+    """
+    plan_date 가 빈 행을 created_at 의 현지(TIME_ZONE) 날짜로 id 구간 배치 채움.
+    큰 테이블은 배포 전에 manage.py backfill_plan_dates 로 미리 채워 두면 여기선 남은 행만 처리.
+    마이그레이션 시점 모델만 사용 (tasks.plan_dates 와 같은 규칙을 여기에 고정)
+    """
+    WorkoutPlan = apps.get_model("tasks", "WorkoutPlan")
+    connection = schema_editor.connection
+    table = connection.ops.quote_name(WorkoutPlan._meta.db_table)
+    pending = WorkoutPlan.objects.filter(plan_date__isnull=True)
+    last_id = 0
+    while True:
+        ids = list(pending.filter(id__gt=last_id).order_by("id").values_list("id", flat=True)[:BATCH_SIZE])
+        if not ids:
+            break
+        last_id = ids[-1]
+        if connection.vendor == "postgresql":
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    f"UPDATE {table} SET plan_date = (created_at AT TIME ZONE %s)::date "
+                    "WHERE id = ANY(%s) AND plan_date IS NULL",
+                    [settings.TIME_ZONE, ids],
+                )
+        else:
+            rows = [
+                WorkoutPlan(id=pk, plan_date=timezone.localtime(created_at).date())
+                for pk, created_at in WorkoutPlan.objects.filter(id__in=ids).values_list("id", "created_at")
+            ]
+            WorkoutPlan.objects.bulk_update(rows, ["plan_date"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tasks", "0007_workoutplan_plan_date"),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.7 on 2026-10-18 21:36
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tasks", "0008_backfill_workoutplan_plan_date"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="workoutplan",
+            name="plan_date",
+            field=models.DateField(
+                db_index=True,
+                default=django.utils.timezone.localdate,
+                verbose_name="계획 날짜",
+            ),
+        ),
+    ]
@@ -0,0 +1,66 @@
+# Generated by Django 5.2.7 on 2026-10-18 21:49
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tasks", "0009_alter_workoutplan_plan_date"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DailyTaskProgress",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("date", models.DateField(verbose_name="날짜")),
+                (
+                    "total",
+                    models.PositiveIntegerField(default=0, verbose_name="전체 작업 수"),
+                ),
+                (
+                    "completed",
+                    models.PositiveIntegerField(default=0, verbose_name="완료 수"),
+                ),
+                (
+                    "skipped",
+                    models.PositiveIntegerField(default=0, verbose_name="스킵 수"),
+                ),
+                (
+                    "updated_at",
+                    models.DateTimeField(auto_now=True, verbose_name="수정일"),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to=settings.AUTH_USER_MODEL,
+                        verbose_name="사용자",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "일별 작업 진행 집계",
+                "verbose_name_plural": "일별 작업 진행 집계 목록",
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("user", "date"),
+                        name="unique_task_progress_per_user_date",
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,62 @@
+# Generated by Django 5.2.7 on 2026-10-18 21:52
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("tasks", "0010_dailytaskprogress"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DailyWorkoutTotal",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("date", models.DateField(verbose_name="날짜")),
+                (
+                    "minutes",
+                    models.IntegerField(default=0, verbose_name="운동 시간 합계(분)"),
+                ),
+                (
+                    "kcal",
+                    models.FloatField(default=0.0, verbose_name="소모 칼로리 합계"),
+                ),
+                (
+                    "updated_at",
+                    models.DateTimeField(auto_now=True, verbose_name="수정일"),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to=settings.AUTH_USER_MODEL,
+                        verbose_name="사용자",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "일별 운동 합계",
+                "verbose_name_plural": "일별 운동 합계 목록",
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("user", "date"),
+                        name="unique_workout_total_per_user_date",
+                    )
+                ],
+            },
+        ),
+    ]
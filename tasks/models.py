@@ -1,6 +1,8 @@
 # tasks/models.py
 from django.conf import settings
 from django.db import models
+from django.db.models import Count, Prefetch, Sum
+from django.db.models.functions import Coalesce
 from django.utils import timezone
 
 
@@ -19,6 +21,20 @@ class Exercise(models.Model):
         verbose_name_plural = "운동 목록"
 
 
+class WorkoutPlanQuerySet(models.QuerySet):
+    def with_tasks(self):
+        """
+        직렬화용: Task 개수/총 시간은 SQL 집계, Task 목록은 exercise 조인해서 한 번에 prefetch.
+        → 플랜 N개 목록이 (플랜 1 + Task 1) 쿼리로 끝남
+        """
+        return self.annotate(
+            tasks_count=Count("tasks"),
+            total_duration_min=Coalesce(Sum("tasks__duration_min"), 0),
+        ).prefetch_related(
+            Prefetch("tasks", queryset=TaskItem.objects.select_related("exercise").order_by("id"))
+        )
+
+
 class WorkoutPlan(models.Model):
     """사용자의 운동 계획 (AI 생성 메타데이터 포함)"""
 
@@ -41,6 +57,8 @@ class WorkoutPlan(models.Model):
         blank=True,
         verbose_name="연계 목표",
     )
+    # 운동하는 날 (생성 시각과 별개) — 날짜 조회는 모두 이 컬럼 (user, plan_date) 인덱스 사용
+    plan_date = models.DateField(default=timezone.localdate, db_index=True, verbose_name="계획 날짜")
     title = models.CharField(max_length=100, verbose_name="제목")
     description = models.TextField(blank=True, verbose_name="설명")   # 자기회고 저장용
     summary = models.TextField(blank=True, verbose_name="요약")       # AI 회고 요약
@@ -66,12 +84,20 @@ class WorkoutPlan(models.Model):
     updated_at = models.DateTimeField(auto_now=True, verbose_name="수정일")
     last_synced_at = models.DateTimeField(null=True, blank=True, verbose_name="AI 마지막 동기화")
 
+    objects = WorkoutPlanQuerySet.as_manager()
+
     def __str__(self):
         return f"{self.user} - {self.title}"
 
     class Meta:
         verbose_name = "운동 계획"
         verbose_name_plural = "운동 계획 목록"
+        indexes = [
+            # 목록 커서 페이지네이션 (user, created_at, id)
+            models.Index(fields=("user", "created_at", "id"), name="wp_user_created_id_idx"),
+            # 날짜별 조회 (user, plan_date) = d / BETWEEN
+            models.Index(fields=("user", "plan_date"), name="wp_user_plan_date_idx"),
+        ]
 
 
 class TaskItem(models.Model):
@@ -174,6 +200,63 @@ class WorkoutLog(models.Model):
         verbose_name_plural = "운동 기록 목록"
 
 
+class DailyTaskProgress(models.Model):
+    """
+    (user, plan_date) 단위 TaskItem 집계 롤업 — 여러 주 진행 기록(progress-history) 조회용.
+    TaskItem 저장/삭제·토글 시 tasks/progress.py 가 커밋 후 다시 계산해 갱신
+    """
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="+",
+        verbose_name="사용자",
+    )
+    date = models.DateField(verbose_name="날짜")
+    total = models.PositiveIntegerField(default=0, verbose_name="전체 작업 수")
+    completed = models.PositiveIntegerField(default=0, verbose_name="완료 수")
+    skipped = models.PositiveIntegerField(default=0, verbose_name="스킵 수")
+    updated_at = models.DateTimeField(auto_now=True, verbose_name="수정일")
+
+    class Meta:
+        verbose_name = "일별 작업 진행 집계"
+        verbose_name_plural = "일별 작업 진행 집계 목록"
+        constraints = [
+            models.UniqueConstraint(fields=("user", "date"), name="unique_task_progress_per_user_date"),
+        ]
+
+    def __str__(self):
+        return f"{self.user_id} {self.date} {self.completed}/{self.total}"
+
+
+class DailyWorkoutTotal(models.Model):
+    """
+    (user, date) 하루 운동 합계 캐시 — WorkoutLog 가 쓰일 때 증분(F 식)으로 갱신 (tasks/workout_sync.py).
+    대시보드/오늘 요약은 WorkoutLog 를 매번 합산하지 않고 이 행 하나를 읽는다.
+    """
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="+",
+        verbose_name="사용자",
+    )
+    date = models.DateField(verbose_name="날짜")
+    minutes = models.IntegerField(default=0, verbose_name="운동 시간 합계(분)")
+    kcal = models.FloatField(default=0.0, verbose_name="소모 칼로리 합계")
+    updated_at = models.DateTimeField(auto_now=True, verbose_name="수정일")
+
+    class Meta:
+        verbose_name = "일별 운동 합계"
+        verbose_name_plural = "일별 운동 합계 목록"
+        constraints = [
+            models.UniqueConstraint(fields=("user", "date"), name="unique_workout_total_per_user_date"),
+        ]
+
+    def __str__(self):
+        return f"{self.user_id} {self.date} {self.minutes}min"
+
+
 class WorkoutPlanGenerationLog(models.Model):
     """AI가 생성하거나 수정한 운동 계획 기록"""
 
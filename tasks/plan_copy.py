@@ -0,0 +1,137 @@
+"""
+tasks/plan_copy.py
+
+날짜 구간 단위 플랜 복제 (copy_week / copy_range 공용).
+
+(원본 날짜 → 타깃 날짜) 쌍 목록을 받아 일수와 무관하게 고정된 쿼리 수로 처리:
+- 원본 플랜 1회 + 원본 Task 1회
+- 타깃 플랜 1회 (Task 보유 여부는 Exists 로 같이)
+- overwrite 대상 Task 삭제 (집합 단위: 조회 1회 + WorkoutLog 연결 해제 1회 + 삭제 1회, 행 단위 시그널 생략)
+- 새 타깃 플랜 bulk_create 1회 + Task bulk_create 1회
+같은 날짜에 플랜이 여러 개면 원본/타깃 모두 최신(created_at, id) 하나만 사용.
+"""
+from dataclasses import dataclass, field
+
+from django.db import transaction
+from django.db.models import Exists, OuterRef
+
+from .day_cache import bump_user_version
+from .models import TaskItem, WorkoutPlan
+from .progress import schedule_refresh
+from .signals import muted
+
+# 복제 시 그대로 옮기는 TaskItem 필드 (완료/스킵 상태는 초기값으로)
+COPY_TASK_FIELDS = (
+    "exercise_id",
+    "duration_min",
+    "target_sets",
+    "target_reps",
+    "intensity",
+    "notes",
+    "is_ai_recommended",
+    "ai_goal",
+    "ai_metadata",
+    "recommended_weight_range",
+)
+
+
+@dataclass
+class CopyResult:
+    created_plans: int = 0
+    created_items: int = 0
+    skipped_days: list = field(default_factory=list)
+    overwritten_days: list = field(default_factory=list)
+
+
+def _latest_by_date(plans):
+    """created_at, id 오름차순 목록 → {plan_date: 최신 플랜}"""
+    out = {}
+    for p in plans:
+        out[p.plan_date] = p
+    return out
+
+
+def copy_days(user, pairs, *, overwrite=False):
+    """
+    pairs: [(src_day, tgt_day), ...]  (타깃 날짜는 중복 없어야 함)
+    - 원본 플랜/Task 가 없는 날, overwrite=False 인데 타깃에 Task 가 있는 날은 skipped_days
+    - 한 트랜잭션으로 처리
+    """
+    result = CopyResult()
+    if not pairs:
+        return result
+    src_dates = {s for s, _ in pairs}
+    tgt_dates = [t for _, t in pairs]
+
+    src_plans = _latest_by_date(
+        WorkoutPlan.objects.filter(user=user, plan_date__in=src_dates).order_by("created_at", "id")
+    )
+    src_items = {}
+    for it in (
+        TaskItem.objects.filter(workout_plan__in=list(src_plans.values()))
+        .order_by("order", "id")
+        .values("workout_plan_id", "order", *COPY_TASK_FIELDS)
+    ):
+        src_items.setdefault(it.pop("workout_plan_id"), []).append(it)
+
+    with transaction.atomic():
+        tgt_plans = _latest_by_date(
+            WorkoutPlan.objects.filter(user=user, plan_date__in=tgt_dates)
+            .annotate(has_tasks=Exists(TaskItem.objects.filter(workout_plan=OuterRef("pk"))))
+            .order_by("created_at", "id")
+        )
+
+        jobs = []  # (타깃 날짜, 원본 플랜, 기존 타깃 플랜 or None)
+        wipe = []
+        for src_day, tgt_day in pairs:
+            src = src_plans.get(src_day)
+            if not src or not src_items.get(src.id):
+                result.skipped_days.append(tgt_day.isoformat())
+                continue
+            tgt = tgt_plans.get(tgt_day)
+            if tgt is not None and tgt.has_tasks:
+                if not overwrite:
+                    result.skipped_days.append(tgt_day.isoformat())
+                    continue
+                wipe.append(tgt.id)
+                result.overwritten_days.append(tgt_day.isoformat())
+            jobs.append((tgt_day, src, tgt))
+
+        if wipe:
+            # 행 단위 시그널 처리 생략 — 아래에서 캐시/롤업을 한 번에 갱신
+            with muted():
+                TaskItem.objects.filter(workout_plan_id__in=wipe).delete()
+
+        new_plans = WorkoutPlan.objects.bulk_create(
+            [
+                WorkoutPlan(
+                    user=user,
+                    plan_date=tgt_day,
+                    title=f"{tgt_day.isoformat()} {src.title or f'{src.plan_date.isoformat()} Workout'}",
+                    description="",
+                    summary="",
+                    target_focus=src.target_focus,
+                    source=src.source,
+                )
+                for tgt_day, src, tgt in jobs
+                if tgt is None
+            ]
+        )
+        result.created_plans = len(new_plans)
+        fresh = iter(new_plans)
+
+        clones = []
+        for tgt_day, src, tgt in jobs:
+            tgt = tgt or next(fresh)
+            clones.extend(
+                TaskItem(workout_plan_id=tgt.id, order=it["order"] or 1, **{f: it[f] for f in COPY_TASK_FIELDS})
+                for it in src_items[src.id]
+            )
+        TaskItem.objects.bulk_create(clones)
+        result.created_items = len(clones)
+
+        # bulk_create 는 시그널이 없으므로 하루 요약 캐시/진행 롤업 직접 갱신
+        if clones:
+            bump_user_version(user.id)
+            schedule_refresh(user.id, {tgt_day for tgt_day, _, _ in jobs})
+    return result
@@ -0,0 +1,47 @@
+"""
+tasks/plan_dates.py
+
+WorkoutPlan.plan_date 백필: 비어 있는 행을 created_at 의 현지(TIME_ZONE) 날짜로 채운다.
+manage.py backfill_plan_dates 가 사용. 마이그레이션(0008)은 같은 규칙을 과거 모델로 자체 구현.
+"""
+from django.conf import settings
+from django.utils import timezone
+
+
+def backfill_plan_dates(plan_model, *, batch_size=2000, dry_run=False, connection=None, log=None):
+    """
+    plan_date IS NULL 인 행을 id 구간 배치로 채움. 반환: 채운 행 수.
+    - PostgreSQL: 배치당 UPDATE 1회 ((created_at AT TIME ZONE tz)::date)
+    - 그 외: 배치를 읽어 파이썬에서 현지 날짜 계산 후 bulk_update
+    """
+    pending = plan_model.objects.filter(plan_date__isnull=True)
+    if dry_run:
+        return pending.count()
+
+    table = plan_model._meta.db_table
+    updated = 0
+    last_id = 0
+    while True:
+        ids = list(pending.filter(id__gt=last_id).order_by("id").values_list("id", flat=True)[:batch_size])
+        if not ids:
+            break
+        last_id = ids[-1]
+        if connection is not None and connection.vendor == "postgresql":
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    f"UPDATE {connection.ops.quote_name(table)} "
+                    "SET plan_date = (created_at AT TIME ZONE %s)::date "
+                    "WHERE id = ANY(%s) AND plan_date IS NULL",
+                    [settings.TIME_ZONE, ids],
+                )
+                updated += cursor.rowcount
+        else:
+            rows = [
+                plan_model(id=pk, plan_date=timezone.localtime(created_at).date())
+                for pk, created_at in plan_model.objects.filter(id__in=ids).values_list("id", "created_at")
+            ]
+            plan_model.objects.bulk_update(rows, ["plan_date"])
+            updated += len(rows)
+        if log:
+            log(f"... id ≤ {last_id}: {updated}건")
+    return updated
@@ -0,0 +1,98 @@
+"""
+tasks/progress.py
+
+TaskItem 진행 집계.
+
+- day_counts(qs): plan_date 별 전체/완료/스킵 수를 GROUP BY 쿼리 1회로
+- DailyTaskProgress 롤업: TaskItem 이 바뀐 (user, date) 만 커밋 후 다시 계산 (signals.py / bulk 경로)
+  → progress-history 는 롤업 테이블 한 번 읽고 주 단위로 묶기만 함
+- 롤업이 비었거나 어긋났으면 manage.py rebuild_task_progress
+"""
+from datetime import timedelta
+
+from django.db import transaction
+from django.db.models import Count, Q
+
+from .models import DailyTaskProgress, TaskItem
+
+HISTORY_MAX_WEEKS = 52
+
+
+def day_counts(qs):
+    """TaskItem qs → {plan_date: (total, completed, skipped)}"""
+    rows = (
+        qs.order_by()
+        .values("workout_plan__plan_date")
+        .annotate(
+            total=Count("id"),
+            done=Count("id", filter=Q(completed=True)),
+            skipped=Count("id", filter=Q(skipped=True)),
+        )
+    )
+    return {r["workout_plan__plan_date"]: (r["total"], r["done"], r["skipped"]) for r in rows}
+
+
+def best_streak(flags):
+    """연속 True 최댓값."""
+    cur = best = 0
+    for flag in flags:
+        cur = cur + 1 if flag else 0
+        best = max(best, cur)
+    return best
+
+
+def refresh_days(user_id, dates):
+    """(user, dates) 롤업을 TaskItem 에서 다시 계산. Task 가 없어진 날은 행 삭제."""
+    dates = {d for d in dates if d}
+    if not (user_id and dates):
+        return
+    counts = day_counts(
+        TaskItem.objects.filter(workout_plan__user_id=user_id, workout_plan__plan_date__in=dates)
+    )
+    if counts:
+        DailyTaskProgress.objects.bulk_create(
+            [
+                DailyTaskProgress(user_id=user_id, date=d, total=t, completed=c, skipped=s)
+                for d, (t, c, s) in counts.items()
+            ],
+            update_conflicts=True,
+            unique_fields=["user", "date"],
+            update_fields=["total", "completed", "skipped", "updated_at"],
+        )
+    empty = dates - counts.keys()
+    if empty:
+        DailyTaskProgress.objects.filter(user_id=user_id, date__in=empty).delete()
+
+
+def schedule_refresh(user_id, dates):
+    """커밋 후 롤업 갱신 (롤백되면 아무것도 안 함)."""
+    dates = set(dates)
+    if user_id and dates:
+        transaction.on_commit(lambda: refresh_days(user_id, dates))
+
+
+def history(user_id, last_monday, weeks):
+    """last_monday 주까지 weeks 주의 주별 진행 (오래된 주 → 최근 주)."""
+    first = last_monday - timedelta(weeks=weeks - 1)
+    by_day = {
+        r.date: r
+        for r in DailyTaskProgress.objects.filter(
+            user_id=user_id, date__range=(first, last_monday + timedelta(days=6))
+        )
+    }
+    out = []
+    for w in range(weeks):
+        start = first + timedelta(weeks=w)
+        days = [by_day.get(start + timedelta(days=i)) for i in range(7)]
+        total = sum(r.total for r in days if r)
+        done = sum(r.completed for r in days if r)
+        out.append({
+            "start": start.isoformat(),
+            "end": (start + timedelta(days=6)).isoformat(),
+            "total": total,
+            "completed": done,
+            "skipped": sum(r.skipped for r in days if r),
+            "completion_rate": round(done * 100.0 / total, 1) if total else 0.0,
+            "best_streak": best_streak(bool(r and r.completed) for r in days),
+        })
+    return out
@@ -84,9 +84,8 @@ class TaskItemSerializer(serializers.ModelSerializer):
 
 
 # ---------------------------------------
-# 하루 운동 계획 (역참조 이름 자동 인식 버전)
-# - related_name이 없으면 기본은 taskitem_set
-# - related_name="tasks"로 정의한 프로젝트도 지원
+# 하루 운동 계획
+# - tasks / tasks_count / total_duration_min 은 뷰의 with_tasks() 결과를 사용
 # ---------------------------------------
 class WorkoutPlanSerializer(serializers.ModelSerializer):
     tasks = serializers.SerializerMethodField(read_only=True)
@@ -98,6 +97,7 @@ class WorkoutPlanSerializer(serializers.ModelSerializer):
         fields = [
             "id",
             "user",
+            "plan_date",
             "title",
             "description",          # 자기 회고
             "summary",              # AI 회고
@@ -124,39 +124,20 @@ class WorkoutPlanSerializer(serializers.ModelSerializer):
             "total_duration_min",
         ]
 
-    # 내부 유틸: 역참조 쿼리셋 얻기
-    def _task_qs(self, obj):
-        qs = None
-        # 1) 기본 역참조 이름
-        if hasattr(obj, "taskitem_set"):
-            try:
-                qs = obj.taskitem_set.all()
-            except Exception:
-                qs = None
-        # 2) 커스텀 related_name="tasks" 대응
-        if qs is None and hasattr(obj, "tasks"):
-            try:
-                qs = obj.tasks.all()
-            except Exception:
-                qs = None
-        return qs or []
-
+    # WorkoutPlan.objects.with_tasks() 로 조회했다면 prefetch/annotate 값을 그대로 사용
+    # (단건 생성 응답처럼 없으면 직접 계산)
     def get_tasks(self, obj):
-        qs = self._task_qs(obj)
-        return TaskItemSerializer(qs, many=True, context=self.context).data
+        return TaskItemSerializer(obj.tasks.all(), many=True, context=self.context).data
 
     def get_tasks_count(self, obj) -> int:
-        qs = self._task_qs(obj)
-        try:
-            return qs.count() if hasattr(qs, "count") else len(list(qs))
-        except Exception:
-            return 0
+        if hasattr(obj, "tasks_count"):
+            return obj.tasks_count
+        return obj.tasks.count()
 
     def get_total_duration_min(self, obj) -> int:
-        try:
-            return sum((ti.duration_min or 0) for ti in self._task_qs(obj))
-        except Exception:
-            return 0
+        if hasattr(obj, "total_duration_min"):
+            return obj.total_duration_min
+        return sum((ti.duration_min or 0) for ti in obj.tasks.all())
 
 
 # ---------------------------------------
@@ -186,24 +167,73 @@ if HAS_WORKOUT_LOG:
 
 
 # ---------------------------------------
-# 대량 생성(프런트 배치 입력용)
+# 대량 생성(프런트 배치 입력 / AI 생성 플랜)
+# - 운동 id 는 in_bulk 한 번으로 검증 → 하나라도 없으면 아무것도 쓰지 않음
+# - create_for_plan(): bulk_create 1회, 반환 객체에 exercise 가 채워져 있어 재조회 없이 직렬화 가능
 # ---------------------------------------
 class BulkTaskItemSerializer(serializers.Serializer):
     exercise = serializers.IntegerField()
-    order = serializers.IntegerField(min_value=1)
-    duration_min = serializers.IntegerField(min_value=1)
-    sets = serializers.IntegerField(min_value=0, required=False, default=0)
-    reps = serializers.IntegerField(min_value=0, required=False, default=0)
-    intensity = serializers.CharField(required=False, default="medium")
+    order = serializers.IntegerField(min_value=1, required=False, default=1)
+    duration_min = serializers.IntegerField(min_value=0, required=False, default=0)
+    target_sets = serializers.IntegerField(min_value=0, required=False, allow_null=True)
+    target_reps = serializers.IntegerField(min_value=0, required=False, allow_null=True)
+    sets = serializers.IntegerField(min_value=0, required=False)  # target_sets 별칭
+    reps = serializers.IntegerField(min_value=0, required=False)  # target_reps 별칭
+    intensity = serializers.CharField(required=False, allow_null=True, default="medium")
+    notes = serializers.CharField(required=False, allow_blank=True, allow_null=True, default="")
+    ai_goal = serializers.CharField(required=False, allow_blank=True, default="", max_length=100)
+    ai_metadata = serializers.JSONField(required=False, allow_null=True, default=None)
+    recommended_weight_range = serializers.CharField(required=False, allow_blank=True, default="", max_length=50)
 
     def validate_intensity(self, v):
-        if v == "mid":
+        if not v or v == "mid":
             return TaskItem.IntensityLevel.MEDIUM
         valid = [c[0] for c in TaskItem.IntensityLevel.choices]
         if v not in valid:
             raise serializers.ValidationError(f"intensity는 {valid} 중 하나여야 합니다.")
         return v
 
+    def validate(self, attrs):
+        attrs["notes"] = attrs.get("notes") or ""
+        if "sets" in attrs:
+            attrs.setdefault("target_sets", attrs["sets"])
+        if "reps" in attrs:
+            attrs.setdefault("target_reps", attrs["reps"])
+        attrs.pop("sets", None)
+        attrs.pop("reps", None)
+        return attrs
+
 
 class BulkTaskItemListSerializer(serializers.Serializer):
     items = BulkTaskItemSerializer(many=True)
+
+    def validate_items(self, items):
+        if not items:
+            raise serializers.ValidationError("items가 비어 있습니다.")
+        ids = {it["exercise"] for it in items}
+        self._exercises = Exercise.objects.in_bulk(ids)
+        missing = sorted(ids - self._exercises.keys())
+        if missing:
+            raise serializers.ValidationError(f"존재하지 않는 운동 id: {missing}")
+        return items
+
+    def create_for_plan(self, plan, *, ai=False):
+        """검증된 items 를 plan 에 bulk_create. 트랜잭션은 호출 쪽에서."""
+        rows = [
+            TaskItem(
+                workout_plan=plan,
+                exercise=self._exercises[it["exercise"]],
+                duration_min=it["duration_min"],
+                target_sets=it.get("target_sets"),
+                target_reps=it.get("target_reps"),
+                intensity=it["intensity"],
+                notes=it["notes"],
+                order=it["order"],
+                is_ai_recommended=ai,
+                ai_goal=it["ai_goal"],
+                ai_metadata=it["ai_metadata"],
+                recommended_weight_range=it["recommended_weight_range"],
+            )
+            for it in self.validated_data["items"]
+        ]
+        return TaskItem.objects.bulk_create(rows)
@@ -0,0 +1,154 @@
+"""
+tasks/signals.py
+
+TaskItem / WorkoutLog / WorkoutPlan 변경 →
+- 운동 하루 요약 캐시 무효화 (day_cache.py)
+- (user, plan_date) 진행 롤업 갱신 (progress.py)
+Exercise 변경 → 운동 카탈로그 캐시 버전 증가 (exercise_cache.py)
+
+행마다 on_commit 을 걸지 않고 트랜잭션(커넥션)별 묶음에 (user, date) 를 모아 커밋 후 한 번에 처리.
+TaskItem 의 소유자/날짜는 같은 묶음 안에서 플랜당 1회만 조회 (플랜 저장/삭제 시그널이 미리 채움).
+bulk_create / QuerySet.update 는 시그널이 없으므로 호출한 쪽에서 bump_user_version / schedule_refresh 를 직접 부른다.
+직접 갱신하는 경로(plan_copy 등)는 muted() 로 행 단위 시그널 처리를 건너뛴다.
+"""
+import threading
+import weakref
+from contextlib import contextmanager
+
+from django.db import transaction
+from django.db.models.signals import post_delete, post_init, post_save, pre_delete
+from django.dispatch import receiver
+
+from . import exercise_cache
+from .day_cache import bump_user_version
+from .models import Exercise, TaskItem, WorkoutLog, WorkoutPlan
+from .progress import refresh_days
+
+BATCH_ATTR = "_tasks_signal_batch"
+
+_local = threading.local()
+
+
+@contextmanager
+def muted():
+    """블록 안의 TaskItem/WorkoutPlan 행 단위 시그널 처리 생략 (호출한 쪽이 직접 무효화/롤업)."""
+    _local.muted = getattr(_local, "muted", 0) + 1
+    try:
+        yield
+    finally:
+        _local.muted -= 1
+
+
+def _is_muted():
+    return getattr(_local, "muted", 0) > 0
+
+
+class _Batch:
+    def __init__(self):
+        self.dirty = {}  # user_id → {date, ...}
+        self.owners = {}  # plan_id → (user_id, plan_date)
+        self.callback_ref = None  # on_commit 에 건 콜백의 약한 참조
+
+    def pending(self):
+        """커밋 대기 중인지. 롤백되면 Django 가 콜백을 버려 약한 참조가 끊긴다."""
+        return self.callback_ref is not None and self.callback_ref() is not None
+
+    def flush(self):
+        for user_id, dates in self.dirty.items():
+            bump_user_version(user_id)
+            if dates:
+                refresh_days(user_id, dates)
+
+
+def _batch():
+    """
+    현재 트랜잭션의 묶음. 처음 만들 때만 on_commit 등록.
+    콜백은 on_commit 목록만 강하게 참조 → (세이브포인트) 롤백으로 버려지면 새 묶음으로 시작.
+    """
+    conn = transaction.get_connection()
+    batch = getattr(conn, BATCH_ATTR, None)
+    if batch is not None and batch.pending():
+        return batch
+
+    batch = _Batch()
+    if conn.in_atomic_block:
+        def _run():
+            batch.callback_ref = None
+            if getattr(conn, BATCH_ATTR, None) is batch:
+                setattr(conn, BATCH_ATTR, None)
+            batch.flush()
+
+        batch.callback_ref = weakref.ref(_run)
+        setattr(conn, BATCH_ATTR, batch)
+        transaction.on_commit(_run)
+    return batch
+
+
+def _mark(batch, user_id, *dates):
+    if user_id:
+        batch.dirty.setdefault(user_id, set()).update(d for d in dates if d)
+
+
+def _flush_if_autocommit(batch):
+    # 트랜잭션 밖(autocommit)이면 묶을 것이 없으므로 바로 처리
+    if not transaction.get_connection().in_atomic_block:
+        batch.flush()
+
+
+def _plan_owner_and_date(batch, task):
+    plan_id = task.workout_plan_id
+    if plan_id in batch.owners:
+        return batch.owners[plan_id]
+    plan = task._state.fields_cache.get("workout_plan")
+    if plan is not None:
+        owner = (plan.user_id, plan.plan_date)
+    else:
+        owner = (
+            WorkoutPlan.objects.filter(pk=plan_id).values_list("user_id", "plan_date").first()
+            or (None, None)
+        )
+    batch.owners[plan_id] = owner
+    return owner
+
+
+@receiver(post_init, sender=WorkoutPlan)
+def _remember_plan_date(sender, instance, **kwargs):
+    # 로드 시점 날짜 기억 → 날짜가 바뀌면 이전 날짜 롤업도 갱신
+    instance._plan_date_at_load = instance.__dict__.get("plan_date")
+
+
+@receiver(pre_delete, sender=WorkoutPlan)
+def _plan_deleting(sender, instance, **kwargs):
+    # 연쇄 삭제되는 TaskItem 들이 플랜을 다시 조회하지 않도록 소유자 미리 기록
+    if not _is_muted():
+        _batch().owners[instance.pk] = (instance.user_id, instance.plan_date)
+
+
+@receiver([post_save, post_delete], sender=WorkoutPlan)
+def _plan_changed(sender, instance, **kwargs):
+    if not _is_muted():
+        batch = _batch()
+        batch.owners[instance.pk] = (instance.user_id, instance.plan_date)
+        _mark(batch, instance.user_id, instance.plan_date, instance._plan_date_at_load)
+        _flush_if_autocommit(batch)
+    instance._plan_date_at_load = instance.plan_date
+
+
+@receiver([post_save, post_delete], sender=WorkoutLog)
+def _bump_for_owner(sender, instance, **kwargs):
+    bump_user_version(instance.user_id)
+
+
+@receiver([post_save, post_delete], sender=TaskItem)
+def _task_changed(sender, instance, **kwargs):
+    if _is_muted():
+        return
+    batch = _batch()
+    user_id, plan_date = _plan_owner_and_date(batch, instance)
+    _mark(batch, user_id, plan_date)
+    _flush_if_autocommit(batch)
+
+
+@receiver([post_save, post_delete], sender=Exercise)
+def _exercise_changed(sender, instance, **kwargs):
+    exercise_cache.bump_version()
@@ -0,0 +1,50 @@
+import pytest
+
+from tasks.models import Exercise, TaskItem, WorkoutPlan
+
+
+@pytest.fixture
+def plan_and_exercises(user):
+    plan = WorkoutPlan.objects.create(user=user, title="AI 플랜")
+    exercises = [Exercise.objects.create(target="전신", name=f"운동{i}", kcal_burned_per_min=5) for i in range(3)]
+    return plan, exercises
+
+
+@pytest.mark.django_db
+def test_generate_ai_bulk_creates_tasks(auth_client, plan_and_exercises, django_assert_max_num_queries):
+    plan, exercises = plan_and_exercises
+    tasks = [
+        {"exercise": ex.id, "duration_min": 10 * (i + 1), "order": i + 1, "intensity": "mid", "ai_goal": "근력"}
+        for i, ex in enumerate(exercises * 4)
+    ]
+    tasks.append({"exercise": None, "duration_min": 5})  # 운동 없는 항목은 건너뜀
+
+    # 인증 + 플랜(집계) + tasks prefetch + 운동 검증 + savepoint/UPDATE/INSERT/release — 항목 수와 무관
+    with django_assert_max_num_queries(8):
+        r = auth_client.post(f"/api/workoutplans/{plan.id}/generate-ai/", {"tasks": tasks}, format="json")
+    assert r.status_code == 200, r.content
+    body = r.json()
+    assert len(body["created_tasks"]) == 12
+    assert all(t["id"] and t["exercise_name"].startswith("운동") for t in body["created_tasks"])
+    assert body["plan"]["tasks_count"] == 12
+    assert TaskItem.objects.filter(workout_plan=plan, is_ai_recommended=True, intensity="medium").count() == 12
+
+
+@pytest.mark.django_db
+def test_bulk_tasks_rejects_unknown_exercise_without_writes(auth_client, plan_and_exercises):
+    plan, exercises = plan_and_exercises
+    items = [{"exercise": exercises[0].id, "duration_min": 10}, {"exercise": 999999, "duration_min": 10}]
+
+    r = auth_client.post(f"/api/workoutplans/{plan.id}/tasks/bulk/", {"items": items}, format="json")
+    assert r.status_code == 400
+    assert "999999" in str(r.json())
+    assert not TaskItem.objects.exists()
+
+    r = auth_client.post(f"/api/workoutplans/{plan.id}/generate-ai/", {"title": "바뀜", "tasks": items}, format="json")
+    assert r.status_code == 400
+    plan.refresh_from_db()
+    assert plan.title == "AI 플랜" and not TaskItem.objects.exists()
+
+    r = auth_client.post(f"/api/workoutplans/{plan.id}/tasks/bulk/", {"items": items[:1]}, format="json")
+    assert r.status_code == 201
+    assert r.json()["created_tasks"][0]["exercise_detail"]["name"] == "운동0"
@@ -0,0 +1,82 @@
+import os
+import time
+from datetime import date
+
+import pytest
+from rest_framework.test import APIRequestFactory
+
+from tasks.api_views import day_payload, resolve_day
+from tasks.calories import completed_kcal_expr, kcal_expr, kcal_per_min
+from tasks.models import Exercise, TaskItem, WorkoutPlan
+
+# 기본은 CI용 10k, 더 큰 벤치는 KCAL_BENCH_ROWS=100000 으로 실행
+BENCH_ROWS = int(os.getenv("KCAL_BENCH_ROWS", "10000"))
+# 시간 상한은 KCAL_BENCH_CEILING(초)을 줄 때만 검사 (기본 실행은 결과/쿼리 수만)
+BENCH_CEILING_SEC = float(os.getenv("KCAL_BENCH_CEILING") or 0)
+
+
+def _completed_kcal(qs):
+    return round(qs.aggregate(kcal=completed_kcal_expr())["kcal"] or 0.0, 1)
+
+
+@pytest.mark.django_db
+def test_sql_expression_matches_python_rule(user):
+    rated = Exercise.objects.create(target="전신", name="버피", kcal_burned_per_min=10)
+    unrated = Exercise.objects.create(target="코어", name="플랭크", kcal_burned_per_min=0)
+    plan = WorkoutPlan.objects.create(user=user, title="루틴")
+    for ex in (rated, unrated):
+        for inten in ("light", "low", "medium", "mid", "high", "hard", " HIGH ", "intense", "", "???"):
+            TaskItem.objects.create(workout_plan=plan, exercise=ex, duration_min=12, intensity=inten, completed=True)
+
+    rows = TaskItem.objects.values("duration_min", "intensity", "exercise__kcal_burned_per_min", kcal=kcal_expr())
+    for r in rows:
+        expected = r["duration_min"] * kcal_per_min(r["exercise__kcal_burned_per_min"], r["intensity"])
+        assert r["kcal"] == pytest.approx(expected), r
+
+    # 운동별 값 우선: 10 × 12 × 10개 / 강도 기본값: light 4 ×2, high 8 ×4, medium 6 ×4
+    assert _completed_kcal(TaskItem.objects.filter(exercise=rated)) == 1200.0
+    assert _completed_kcal(TaskItem.objects.filter(exercise=unrated)) == 12 * (4 * 2 + 8 * 4 + 6 * 4)
+
+    TaskItem.objects.filter(exercise=rated).update(completed=False)
+    assert _completed_kcal(TaskItem.objects.filter(exercise=rated)) == 0.0
+
+
+@pytest.mark.django_db
+def test_day_summary_calories_benchmark(user, django_assert_num_queries):
+    """하루 요약(WorkoutSummaryView/workout_day 경로)의 완료 kcal 합계 — 플랜 해석 + Task 목록 쿼리 2회."""
+    day = date(2025, 3, 5)
+    exercises = [
+        Exercise.objects.create(target="전신", name=f"운동{i}", kcal_burned_per_min=(i % 3) * 4.5) for i in range(6)
+    ]
+    plan = WorkoutPlan.objects.create(user=user, title="벤치", plan_date=day)
+    intensities = ("light", "medium", "high", "hard")
+    TaskItem.objects.bulk_create(
+        [
+            TaskItem(
+                workout_plan=plan, exercise=exercises[i % 6], duration_min=5 + i % 40,
+                intensity=intensities[i % 4], completed=i % 3 != 0,
+            )
+            for i in range(BENCH_ROWS)
+        ],
+        batch_size=2000,
+    )
+    request = APIRequestFactory().get("/")
+    request.user = user
+
+    t0 = time.perf_counter()
+    with django_assert_num_queries(2):
+        summary = day_payload(resolve_day(request, day.isoformat()))["summary"]
+    sec = time.perf_counter() - t0
+
+    # 비교: 행을 파이썬으로 가져와 합산하던 방식
+    qs = TaskItem.objects.filter(workout_plan=plan, completed=True)
+    expected = sum(
+        r["duration_min"] * kcal_per_min(r["exercise__kcal_burned_per_min"], r["intensity"])
+        for r in qs.values("duration_min", "intensity", "exercise__kcal_burned_per_min")
+    )
+
+    assert summary["tasks_count"] == BENCH_ROWS
+    assert abs(summary["calories"] - expected) < 1  # 응답은 int
+    assert _completed_kcal(TaskItem.objects.filter(workout_plan=plan)) == pytest.approx(round(expected, 1))
+    if BENCH_CEILING_SEC:
+        assert sec < BENCH_CEILING_SEC
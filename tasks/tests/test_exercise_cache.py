@@ -0,0 +1,57 @@
+import pytest
+from django.core.cache import cache
+
+from tasks import exercise_cache
+from tasks.models import Exercise
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    cache.clear()
+    exercise_cache.clear()
+    yield
+    cache.clear()
+    exercise_cache.clear()
+
+
+@pytest.mark.django_db
+def test_catalog_served_from_memory_until_exercise_changes(
+    auth_client, django_assert_num_queries, django_capture_on_commit_callbacks
+):
+    Exercise.objects.create(target="하체", name="스쿼트")
+    Exercise.objects.create(target="가슴", name="벤치프레스")
+
+    r = auth_client.get("/api/exercises/")
+    assert r.status_code == 200 and [e["name"] for e in r.json()] == ["벤치프레스", "스쿼트"]
+    etag = r["ETag"]
+    assert r["Cache-Control"].startswith("private, max-age=")
+    assert auth_client.get("/api/exercises/targets/").json() == ["가슴", "하체"]
+
+    with django_assert_num_queries(2):  # 요청마다 JWT 사용자 조회만
+        assert auth_client.get("/api/exercises/").json() == r.json()
+        assert auth_client.get("/api/exercises/targets/").json() == ["가슴", "하체"]
+    assert auth_client.get("/api/exercises/", HTTP_IF_NONE_MATCH=etag).status_code == 304
+
+    # 필터 값은 별도 항목
+    assert [e["name"] for e in auth_client.get("/api/exercises/", {"target": "하체"}).json()] == ["스쿼트"]
+
+    with django_capture_on_commit_callbacks(execute=True):
+        Exercise.objects.create(target="등", name="데드리프트")
+    r2 = auth_client.get("/api/exercises/", HTTP_IF_NONE_MATCH=etag)
+    assert r2.status_code == 200 and r2["ETag"] != etag
+    assert len(r2.json()) == 3
+    assert auth_client.get("/api/exercises/targets/").json() == ["가슴", "등", "하체"]
+
+
+@pytest.mark.django_db
+def test_fixture_payload_cached_with_etag(auth_client, monkeypatch):
+    r = auth_client.get("/api/fixtures/exercises/")
+    assert r.status_code == 200 and r.json()
+    assert auth_client.get("/api/fixtures/exercises/", HTTP_IF_NONE_MATCH=r["ETag"]).status_code == 304
+
+    # 파일이 그대로면 다시 파싱하지 않음
+    def _fail(path):
+        raise AssertionError("fixture re-parsed")
+
+    monkeypatch.setattr("tasks.views._parse_exercise_fixture", _fail)
+    assert auth_client.get("/api/fixtures/exercises/").json() == r.json()
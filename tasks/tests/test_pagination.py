@@ -0,0 +1,32 @@
+import pytest
+
+from tasks.models import Exercise, TaskItem, WorkoutPlan
+
+TASKITEMS_URL = "/api/taskitems/"
+
+
+@pytest.mark.django_db
+def test_taskitems_cursor_pages_for_one_plan(auth_client, user):
+    ex = Exercise.objects.create(target="전신", name="버피", kcal_burned_per_min=8)
+    plan = WorkoutPlan.objects.create(user=user, title="하체", plan_date="2025-05-01")
+    other = WorkoutPlan.objects.create(user=user, title="상체", plan_date="2025-05-02")
+    TaskItem.objects.bulk_create(
+        [TaskItem(workout_plan=plan, exercise=ex, order=i, duration_min=10) for i in range(7)]
+        + [TaskItem(workout_plan=other, exercise=ex, order=i, duration_min=10) for i in range(3)]
+    )
+
+    seen, url, pages = [], TASKITEMS_URL, 0
+    while url:
+        r = auth_client.get(url, {"workout_plan": plan.id, "page_size": 3} if pages == 0 else None)
+        assert r.status_code == 200
+        body = r.json()
+        assert set(body) >= {"next", "results"}
+        seen.extend(t["id"] for t in body["results"])
+        url, pages = body["next"], pages + 1
+
+    # 다음 페이지 링크에도 플랜 필터가 유지되어 다른 플랜 항목이 섞이지 않음
+    assert pages == 3
+    assert seen == sorted(TaskItem.objects.filter(workout_plan=plan).values_list("id", flat=True), reverse=True)
+
+    r = auth_client.get(TASKITEMS_URL, {"workout_plan": plan.id, "paginate": "false"})
+    assert isinstance(r.json(), list) and len(r.json()) == 7
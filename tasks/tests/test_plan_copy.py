@@ -0,0 +1,84 @@
+from datetime import date, timedelta
+
+import pytest
+
+from tasks.models import Exercise, TaskItem, WorkoutPlan
+
+MON = date(2025, 3, 3)
+
+
+@pytest.fixture
+def source_week(user):
+    exercises = [Exercise.objects.create(target="전신", name=f"운동{i}", kcal_burned_per_min=5) for i in range(3)]
+    for i in (0, 2, 4):  # 월/수/금
+        plan = WorkoutPlan.objects.create(user=user, title=f"루틴{i}", plan_date=MON + timedelta(days=i))
+        for o, ex in enumerate(exercises, start=1):
+            TaskItem.objects.create(workout_plan=plan, exercise=ex, duration_min=10 * o, order=o, completed=True)
+    return exercises
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("repeat", [1, 12])
+def test_copy_range_fixed_query_count(auth_client, user, source_week, repeat, django_assert_max_num_queries):
+    # 인증 + 원본 플랜/Task + 타깃 플랜 + savepoint/플랜 insert/Task insert/release — 주 수와 무관
+    # (SQLite 는 변수 개수 제한으로 큰 bulk_create 를 나눠 보내므로 여유 2)
+    with django_assert_max_num_queries(10):
+        r = auth_client.post(
+            "/api/workoutplans/copy_range/",
+            {"source_start": MON.isoformat(), "weeks": 1, "repeat": repeat},
+            format="json",
+        )
+    assert r.status_code == 200, r.content
+    body = r.json()
+    assert body["created_plans"] == 3 * repeat
+    assert body["created_items"] == 9 * repeat
+    assert body["target"]["end"] == (MON + timedelta(days=7 * (repeat + 1) - 1)).isoformat()
+
+    last_fri = MON + timedelta(days=7 * repeat + 4)
+    plan = WorkoutPlan.objects.get(user=user, plan_date=last_fri)
+    assert list(plan.tasks.order_by("order").values_list("duration_min", "completed")) == [
+        (10, False), (20, False), (30, False)
+    ]
+
+
+@pytest.mark.django_db
+def test_copy_range_overwrite_and_skip(auth_client, user, source_week):
+    tgt_mon = MON + timedelta(days=7)
+    existing = WorkoutPlan.objects.create(user=user, title="기존", plan_date=tgt_mon)
+    TaskItem.objects.create(workout_plan=existing, exercise=source_week[0], duration_min=99)
+
+    r = auth_client.post("/api/workoutplans/copy_range/", {"source_start": MON.isoformat()}, format="json")
+    assert tgt_mon.isoformat() in r.json()["skipped_days"]
+    assert existing.tasks.count() == 1
+
+    r = auth_client.post(
+        "/api/workoutplans/copy_range/", {"source_start": MON.isoformat(), "overwrite": True}, format="json"
+    )
+    assert tgt_mon.isoformat() in r.json()["overwritten_days"]
+    assert sorted(existing.tasks.values_list("duration_min", flat=True)) == [10, 20, 30]
+
+    r = auth_client.post(
+        "/api/workoutplans/copy_range/", {"source_start": MON.isoformat(), "target_start": MON.isoformat()},
+        format="json",
+    )
+    assert r.status_code == 400
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("repeat", [1, 12])
+def test_copy_range_overwrite_fixed_query_count(
+    auth_client, user, source_week, repeat, django_assert_max_num_queries, django_capture_on_commit_callbacks
+):
+    body = {"source_start": MON.isoformat(), "weeks": 1, "repeat": repeat}
+    with django_capture_on_commit_callbacks(execute=True):
+        auth_client.post("/api/workoutplans/copy_range/", body, format="json")
+
+    # 덮어쓰기: 위 예산 + 기존 Task 삭제(조회/WorkoutLog 연결 해제/삭제) — 항목 수와 무관,
+    # 커밋 후 콜백은 롤업 갱신 1회분(조회 + upsert)만
+    with django_capture_on_commit_callbacks(execute=True) as callbacks:
+        with django_assert_max_num_queries(14):
+            r = auth_client.post("/api/workoutplans/copy_range/", {**body, "overwrite": True}, format="json")
+    assert r.status_code == 200, r.content
+    assert len(r.json()["overwritten_days"]) == 3 * repeat
+    assert len(callbacks) <= 2
+    assert TaskItem.objects.filter(workout_plan__user=user).count() == 9 * (repeat + 1)
@@ -0,0 +1,40 @@
+from datetime import date, datetime, timedelta
+
+import pytest
+from django.utils import timezone
+
+from tasks.models import Exercise, TaskItem, WorkoutPlan
+
+D = date(2025, 3, 3)  # 월요일
+
+
+@pytest.mark.django_db
+def test_by_date_uses_local_plan_date(auth_client, user):
+    # 현지 00:30 생성 → UTC 로는 전날. plan_date 는 현지 날짜
+    created = timezone.make_aware(datetime.combine(D, datetime.min.time()) + timedelta(minutes=30))
+    plan = WorkoutPlan.objects.create(user=user, title="새벽 플랜", plan_date=D)
+    WorkoutPlan.objects.filter(pk=plan.pk).update(created_at=created)
+    WorkoutPlan.objects.create(user=user, title="전날 플랜", plan_date=D - timedelta(days=1))
+
+    r = auth_client.get("/api/workoutplans/by-date/", {"date": D.isoformat(), "debug": "1"})
+    assert r.status_code == 200
+    body = r.json()
+    assert body["strategy"] == "primary"
+    assert [p["title"] for p in body["data"]] == ["새벽 플랜"]
+    assert body["data"][0]["plan_date"] == D.isoformat()
+
+
+@pytest.mark.django_db
+def test_ensure_today_and_copy_week_set_plan_date(auth_client, user):
+    r = auth_client.post("/api/workoutplans/today/ensure/")
+    assert r.status_code == 201
+    assert r.json()["plan_date"] == timezone.localdate().isoformat()
+
+    ex = Exercise.objects.create(target="전신", name="버피", kcal_burned_per_min=8)
+    src = WorkoutPlan.objects.create(user=user, title="월 플랜", plan_date=D)
+    TaskItem.objects.create(workout_plan=src, exercise=ex, duration_min=20, order=1)
+
+    r = auth_client.post(f"/api/workoutplans/copy_week/?source_start={D.isoformat()}")
+    assert r.status_code == 200
+    tgt = WorkoutPlan.objects.get(user=user, plan_date=D + timedelta(days=7))
+    assert tgt.tasks.count() == 1
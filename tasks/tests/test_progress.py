@@ -0,0 +1,86 @@
+from datetime import date, timedelta
+
+import pytest
+from django.core.management import call_command
+from django.db import transaction
+
+from tasks.models import DailyTaskProgress, Exercise, TaskItem, WorkoutPlan
+
+MON = date(2025, 3, 3)
+
+
+@pytest.fixture
+def week_tasks(user, django_capture_on_commit_callbacks):
+    ex = Exercise.objects.create(target="전신", name="버피", kcal_burned_per_min=8)
+    tasks = {}
+    with django_capture_on_commit_callbacks(execute=True):
+        for i in range(4):  # 월~목, 하루 2개
+            plan = WorkoutPlan.objects.create(user=user, title=f"d{i}", plan_date=MON + timedelta(days=i))
+            tasks[i] = [TaskItem.objects.create(workout_plan=plan, exercise=ex, duration_min=10) for _ in range(2)]
+    return tasks
+
+
+@pytest.mark.django_db
+def test_weekly_progress_single_grouped_query(auth_client, week_tasks, django_assert_max_num_queries):
+    for i in (0, 1, 3):
+        TaskItem.objects.filter(pk=week_tasks[i][0].pk).update(completed=True)
+    TaskItem.objects.filter(pk=week_tasks[2][0].pk).update(skipped=True)
+
+    # 인증 + GROUP BY 1회
+    with django_assert_max_num_queries(2):
+        r = auth_client.get("/api/taskitems/weekly_progress/", {"start": MON.isoformat()})
+    body = r.json()
+    assert body["tasks"] == {"total": 8, "completed": 3, "skipped": 1, "completion_rate": 37.5}
+    assert body["streak"]["best_in_week"] == 2
+
+
+@pytest.mark.django_db
+def test_progress_history_rollup_follows_toggles(
+    auth_client, user, week_tasks, django_capture_on_commit_callbacks, django_assert_max_num_queries
+):
+    with django_capture_on_commit_callbacks(execute=True):
+        for i in range(3):
+            r = auth_client.post(f"/api/taskitems/{week_tasks[i][0].id}/toggle-complete/", {"value": True})
+            assert r.status_code == 200
+    assert DailyTaskProgress.objects.get(user=user, date=MON).completed == 1
+
+    # 인증 + 롤업 1회
+    with django_assert_max_num_queries(2):
+        r = auth_client.get("/api/taskitems/progress-history/", {"weeks": 2, "end": MON.isoformat()})
+    weeks = r.json()["weeks"]
+    assert [w["start"] for w in weeks] == [(MON - timedelta(weeks=1)).isoformat(), MON.isoformat()]
+    assert weeks[0]["total"] == 0
+    assert (weeks[1]["total"], weeks[1]["completed"], weeks[1]["best_streak"]) == (8, 3, 3)
+    assert weeks[1]["completion_rate"] == 37.5
+
+    # Task 삭제 → 해당 날짜 롤업 갱신, rebuild 커맨드 결과와 동일
+    with django_capture_on_commit_callbacks(execute=True):
+        for t in week_tasks[3]:
+            t.delete()
+    assert not DailyTaskProgress.objects.filter(user=user, date=MON + timedelta(days=3)).exists()
+    before = list(DailyTaskProgress.objects.order_by("date").values_list("date", "total", "completed"))
+    DailyTaskProgress.objects.all().delete()
+    call_command("rebuild_task_progress", weeks=520)
+    assert list(DailyTaskProgress.objects.order_by("date").values_list("date", "total", "completed")) == before
+
+    assert auth_client.get("/api/taskitems/progress-history/", {"weeks": 53}).status_code == 400
+
+
+@pytest.mark.django_db
+def test_rollup_batch_restarts_after_savepoint_rollback(user, week_tasks, django_capture_on_commit_callbacks):
+    plan = week_tasks[0][0].workout_plan
+    with django_capture_on_commit_callbacks(execute=True) as callbacks:
+        with transaction.atomic():
+            try:
+                with transaction.atomic():
+                    # 첫 저장이 세이브포인트 안에서 묶음 콜백을 걸고, 롤백으로 콜백이 버려짐
+                    TaskItem.objects.create(workout_plan=plan, exercise=week_tasks[0][0].exercise, duration_min=5)
+                    raise RuntimeError
+            except RuntimeError:
+                pass
+            TaskItem.objects.filter(pk=week_tasks[0][1].pk).update(completed=True)
+            week_tasks[0][1].refresh_from_db()
+            week_tasks[0][1].save()  # 새 묶음 + 새 콜백
+
+    assert len(callbacks) == 1
+    assert DailyTaskProgress.objects.get(user=user, date=MON).completed == 1
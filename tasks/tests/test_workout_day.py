@@ -0,0 +1,92 @@
+from datetime import date, timedelta
+
+import pytest
+from rest_framework.test import APIRequestFactory
+
+from tasks.api_views import resolve_day
+from tasks.models import Exercise, TaskItem, WorkoutLog, WorkoutPlan
+
+D = date(2025, 3, 5)
+# 인증(사용자 조회) + 플랜 해석 1회 + Task(exercise 조인) 1회
+DAY_QUERY_BUDGET = 3
+
+
+@pytest.fixture
+def day_plans(user, django_capture_on_commit_callbacks):
+    # 시그널 묶음(커밋 후 1회)을 여기서 끝내 두어야 테스트 본문의 쓰기가 새 묶음으로 잡힘
+    with django_capture_on_commit_callbacks(execute=True):
+        ex = Exercise.objects.create(target="하체", name="스쿼트", kcal_burned_per_min=6)
+        dated = WorkoutPlan.objects.create(user=user, title="그날 플랜", plan_date=D)
+        logged = WorkoutPlan.objects.create(user=user, title="기록된 플랜", plan_date=D - timedelta(days=1))
+        TaskItem.objects.create(workout_plan=dated, exercise=ex, duration_min=30, intensity="high", completed=True)
+        TaskItem.objects.create(workout_plan=dated, exercise=ex, duration_min=10, intensity="low")
+        TaskItem.objects.create(workout_plan=logged, exercise=ex, duration_min=15)
+    return ex, dated, logged
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("url", ["/api/workoutplans/summary/", "/api/recommendations/", "/api/insights/today/"])
+def test_day_endpoints_query_budget(auth_client, day_plans, url, django_assert_max_num_queries):
+    with django_assert_max_num_queries(DAY_QUERY_BUDGET):
+        r = auth_client.get(url, {"date": D.isoformat()})
+    assert r.status_code == 200
+
+
+@pytest.mark.django_db
+def test_summary_resolution_order(auth_client, user, day_plans):
+    ex, dated, logged = day_plans
+    body = auth_client.get("/api/workoutplans/summary/", {"date": D.isoformat()}).json()
+    assert body["workout_plan"] == dated.id
+    assert (body["total_min"], body["tasks_count"], body["completed_count"]) == (40, 2, 1)
+    assert body["calories"] == 30 * 6  # 운동별 분당 kcal(6)이 강도 기본값보다 우선
+
+    # 그날 WorkoutLog 가 연결된 플랜이 plan_date 보다 우선
+    WorkoutLog.objects.create(user=user, workout_plan=logged, exercise=ex, date=D, duration_min=15)
+    body = auth_client.get("/api/workoutplans/summary/", {"date": D.isoformat()}).json()
+    assert body["workout_plan"] == logged.id
+
+    # 해당 날짜 플랜이 없으면 Task 있는 최신 플랜
+    body = auth_client.get("/api/workoutplans/summary/", {"date": "2030-01-01"}).json()
+    assert body["workout_plan"] == logged.id
+
+
+@pytest.mark.django_db
+def test_resolve_day_cached_per_request(user, day_plans, django_assert_num_queries):
+    request = APIRequestFactory().get("/")
+    request.user = user
+    with django_assert_num_queries(2):
+        first = resolve_day(request, D.isoformat())
+    with django_assert_num_queries(0):
+        assert resolve_day(request, D.isoformat()) is first
+    with pytest.raises(ValueError):
+        resolve_day(request, "2025-13-01")
+
+
+@pytest.mark.django_db
+def test_workout_day_payload_cached_and_invalidated(
+    auth_client, user, day_plans, settings, django_assert_max_num_queries, django_capture_on_commit_callbacks
+):
+    from django.core.cache import cache
+
+    settings.WORKOUT_DAY_CACHE_TTL = 60
+    cache.clear()
+    ex, dated, _ = day_plans
+    url = "/api/workouts/day/"
+
+    body = auth_client.get(url, {"date": D.isoformat()}).json()
+    assert body["summary"]["tasks_count"] == 2
+    assert body["recommendations"][0]["title"] == "하체 중심으로 마무리해보세요 (1개 남음)"
+    assert body["insights"]["bullets"][0] == "대표 운동: 스쿼트"
+
+    # 캐시 적중: 인증 외 쿼리 없음, 기존 엔드포인트도 같은 payload 사용
+    with django_assert_max_num_queries(1):
+        assert auth_client.get(url, {"date": D.isoformat()}).json() == body
+    with django_assert_max_num_queries(1):
+        r = auth_client.get("/api/workoutplans/summary/", {"date": D.isoformat()})
+    assert r.json() == body["summary"]
+
+    # TaskItem 쓰기 → 무효화
+    with django_capture_on_commit_callbacks(execute=True):
+        TaskItem.objects.create(workout_plan=dated, exercise=ex, duration_min=5)
+    assert auth_client.get(url, {"date": D.isoformat()}).json()["summary"]["tasks_count"] == 3
+    cache.clear()
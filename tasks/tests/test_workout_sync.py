@@ -0,0 +1,99 @@
+import pytest
+from django.core.management import call_command
+from django.utils import timezone
+
+from tasks.models import DailyWorkoutTotal, Exercise, TaskItem, WorkoutLog, WorkoutPlan
+
+
+@pytest.fixture
+def routine(user):
+    ex = Exercise.objects.create(target="하체", name="스쿼트", kcal_burned_per_min=6)
+    plan = WorkoutPlan.objects.create(user=user, title="루틴")
+    tasks = [TaskItem.objects.create(workout_plan=plan, exercise=ex, duration_min=10 * (i + 1), order=i + 1) for i in range(3)]
+    return plan, tasks
+
+
+def _total(user):
+    row = DailyWorkoutTotal.objects.filter(user=user, date=timezone.localdate()).first()
+    return (row.minutes, row.kcal) if row else (0, 0.0)
+
+
+@pytest.mark.django_db
+def test_toggle_complete_writes_workoutlog_and_total(auth_client, user, routine):
+    _, tasks = routine
+    url = f"/api/taskitems/{tasks[1].id}/toggle-complete/"
+
+    assert auth_client.post(url, {"value": True}).status_code == 200
+    log = WorkoutLog.objects.get(task_item=tasks[1])
+    assert (log.duration_min, log.kcal_burned, log.date) == (20, 120.0, timezone.localdate())
+    assert _total(user) == (20, 120.0)
+
+    # 같은 날 다시 완료해도 중복 없음
+    auth_client.post(url, {"value": True})
+    assert WorkoutLog.objects.count() == 1 and _total(user) == (20, 120.0)
+
+    assert auth_client.post(url, {"value": False}).status_code == 200
+    assert not WorkoutLog.objects.exists() and _total(user) == (0, 0.0)
+
+
+@pytest.mark.django_db
+def test_skip_completed_task_removes_workoutlog(auth_client, user, routine):
+    _, tasks = routine
+    auth_client.post(f"/api/taskitems/{tasks[0].id}/toggle-complete/", {"value": True})
+    assert _total(user) == (10, 60.0)
+
+    r = auth_client.post(f"/api/taskitems/{tasks[0].id}/toggle-skip/", {"value": True, "reason": "피곤"})
+    assert r.status_code == 200 and r.json()["skipped"] is True
+    tasks[0].refresh_from_db()
+    assert not tasks[0].completed
+    assert not WorkoutLog.objects.exists() and _total(user) == (0, 0.0)
+
+
+@pytest.mark.django_db
+def test_bulk_toggle_whole_routine(auth_client, user, routine, django_assert_max_num_queries):
+    plan, tasks = routine
+    # 인증 + savepoint + 잠금 조회 + UPDATE + 로그 조회 + bulk_create + 합계 UPDATE/INSERT(+savepoint) + 응답용 합계
+    with django_assert_max_num_queries(12):
+        r = auth_client.post("/api/taskitems/bulk-toggle/", {"workout_plan": plan.id, "value": True}, format="json")
+    assert r.status_code == 200, r.content
+    assert r.json()["workout_minutes"] == 60
+    assert TaskItem.objects.filter(completed=True).count() == 3
+    assert WorkoutLog.objects.count() == 3
+
+    r = auth_client.post("/api/taskitems/bulk-toggle/", {"ids": [tasks[0].id], "value": False}, format="json")
+    assert r.json()["workout_minutes"] == 50
+    assert _total(user) == (50, 300.0)
+
+    r = auth_client.post("/api/taskitems/bulk-toggle/", {"ids": [tasks[0].id, 999999]}, format="json")
+    assert r.status_code == 400
+    for body in ({"ids": ["a"]}, {"ids": [{}]}, {"workout_plan": "x"}):
+        assert auth_client.post("/api/taskitems/bulk-toggle/", body, format="json").status_code == 400
+
+    # 재계산 커맨드 결과 == 증분 합계
+    DailyWorkoutTotal.objects.all().delete()
+    call_command("rebuild_workout_totals")
+    assert _total(user) == (50, 300.0)
+
+
+@pytest.mark.django_db
+def test_patch_completed_syncs_like_toggle(auth_client, user, routine):
+    _, tasks = routine
+    url = f"/api/taskitems/{tasks[2].id}/"
+
+    r = auth_client.patch(url, {"completed": True}, format="json")
+    assert r.status_code == 200 and r.json()["completed_at"]
+    assert WorkoutLog.objects.filter(task_item=tasks[2]).count() == 1
+    assert _total(user) == (30, 180.0)
+
+    # 완료 상태 그대로 다른 필드만 바꾸면 로그 추가 없음
+    auth_client.patch(url, {"notes": "좋았음"}, format="json")
+    assert WorkoutLog.objects.count() == 1
+
+    assert auth_client.patch(url, {"completed": False}, format="json").status_code == 200
+    assert not WorkoutLog.objects.exists() and _total(user) == (0, 0.0)
+
+    # 대시보드 타일도 같은 합계를 읽음
+    auth_client.patch(url, {"completed": True}, format="json")
+    auth_client.force_login(user)
+    ctx = auth_client.get("/tasks/dashboard/").context
+    assert (ctx["today_totals"]["workout_minutes"], ctx["today_totals"]["workout_kcal"]) == (30, 180)
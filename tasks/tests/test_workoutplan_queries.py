@@ -0,0 +1,32 @@
+import pytest
+
+from tasks.models import Exercise, TaskItem, WorkoutPlan
+
+PLANS_URL = "/api/workoutplans/"
+# 인증(사용자 조회) + 플랜 목록(집계 포함) + tasks(exercise 조인) prefetch
+PLANS_QUERY_BUDGET = 3
+
+
+@pytest.mark.django_db
+def test_workoutplan_list_query_budget(auth_client, user, django_assert_max_num_queries):
+    exercises = [Exercise.objects.create(target="전신", name=f"운동{i}", kcal_burned_per_min=5) for i in range(5)]
+    plans = [WorkoutPlan.objects.create(user=user, title=f"플랜{i}") for i in range(30)]
+    TaskItem.objects.bulk_create(
+        [
+            TaskItem(workout_plan=plan, exercise=exercises[(p + t) % 5], duration_min=10 * (t + 1), order=t + 1)
+            for p, plan in enumerate(plans)
+            for t in range(p % 4)  # 0~3개 (Task 없는 플랜 포함)
+        ]
+    )
+
+    with django_assert_max_num_queries(PLANS_QUERY_BUDGET):
+        r = auth_client.get(PLANS_URL, {"page_size": 30})
+    assert r.status_code == 200
+
+    rows = r.json()["results"]
+    assert len(rows) == 30
+    for row in rows:
+        n = int(row["title"].removeprefix("플랜")) % 4
+        assert row["tasks_count"] == len(row["tasks"]) == n
+        assert row["total_duration_min"] == sum(10 * (t + 1) for t in range(n))
+        assert all(t["exercise_detail"]["name"] == t["exercise_name"] for t in row["tasks"])
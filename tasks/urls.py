@@ -44,7 +44,11 @@ api_urlpatterns = [
     path("", include(router.urls)),  # /exercises, /workoutplans, /taskitems, /workoutlogs?, /tasks(alias)
     path("fixtures/exercises/", views.fixtures_exercises, name="fixtures-exercises"),
 
-    # ✅ Today 패널용 최소 API
+    # ✅ Today 패널용 통합 API (summary + recommendations + insights, 캐시)
+    # GET /api/workouts/day/?date=YYYY-MM-DD[&workout_plan=<id>]
+    path("workouts/day/", api_views.WorkoutDayView.as_view(), name="workout-day"),
+
+    # ✅ Today 패널용 최소 API (workouts/day 의 일부만 반환, 기존 호출 호환)
     # GET /api/workoutplans/summary/?date=YYYY-MM-DD[&workout_plan=<id>]
     path("workoutplans/summary/", api_views.WorkoutSummaryView.as_view(), name="workout-summary"),
 
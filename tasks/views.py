@@ -7,10 +7,9 @@ import json
 from typing import Optional
 
 from django.contrib.auth.decorators import login_required
-from django.core.files.storage import default_storage
 from django.core.exceptions import FieldError
 from django.db import transaction
-from django.db.models import Sum, Q
+from django.db.models import Sum
 from django.shortcuts import render
 from django.urls import reverse
 from django.utils import timezone
@@ -22,15 +21,26 @@ from rest_framework.exceptions import PermissionDenied, NotFound
 from rest_framework.response import Response
 from rest_framework.filters import OrderingFilter
 
+from utils.pagination import KeysetPagination
+
+from . import exercise_cache
+from .day_cache import bump_user_version
+from .plan_copy import copy_days
+from .progress import HISTORY_MAX_WEEKS, best_streak, day_counts, history, schedule_refresh
+from .workout_sync import add_to_daily_total, daily_minutes, daily_totals, sync_completion
 from .models import Exercise, WorkoutPlan, TaskItem
 
 # 선택: 인테이크 모델 존재 시 사용
 try:
     from intakes.models import NutritionLog, MealItem
+    from intakes.photo_urls import photo_urls
+    from intakes.thumbnails import thumbnail_urls
     HAS_INTAKE_MODELS = True
 except Exception:
     NutritionLog = None
     MealItem = None
+    photo_urls = None
+    thumbnail_urls = None
     HAS_INTAKE_MODELS = False
 
 # WorkoutLog 모델이 있으면 사용
@@ -40,7 +50,12 @@ try:
 except Exception:
     HAS_WORKOUT_LOG = False
 
-from .serializers import ExerciseSerializer, WorkoutPlanSerializer, TaskItemSerializer
+from .serializers import (
+    BulkTaskItemListSerializer,
+    ExerciseSerializer,
+    TaskItemSerializer,
+    WorkoutPlanSerializer,
+)
 if HAS_WORKOUT_LOG:
     from .serializers import WorkoutLogSerializer
 
@@ -74,6 +89,14 @@ def parse_iso_date(s: Optional[str]) -> Optional[date]:
 # ----------------------------------------------------------------------
 # Exercise (카탈로그) - 읽기 전용 + 드릴다운
 # ----------------------------------------------------------------------
+def _cached_response(request, kind, params, build, version=None):
+    """exercise_cache 응답 + ETag/Cache-Control. If-None-Match 일치 시 본문 없이 304."""
+    payload, etag = exercise_cache.get_or_build(kind, params, build, version)
+    if exercise_cache.if_none_match(request, etag):
+        return exercise_cache.with_cache_headers(Response(status=status.HTTP_304_NOT_MODIFIED), etag)
+    return exercise_cache.with_cache_headers(Response(payload), etag)
+
+
 class ExerciseViewSet(viewsets.ReadOnlyModelViewSet):
     queryset = Exercise.objects.all().order_by("name")
     serializer_class = ExerciseSerializer
@@ -88,29 +111,62 @@ class ExerciseViewSet(viewsets.ReadOnlyModelViewSet):
             qs = qs.filter(target=target)
         return qs.order_by("name")
 
+    # 목록은 필터/정렬 값별로 메모리 캐시 (exercise_cache.py)
+    def list(self, request, *args, **kwargs):
+        params = (request.query_params.get("target") or "", request.query_params.get("ordering") or "")
+        return _cached_response(
+            request,
+            "exercises",
+            params,
+            lambda: list(self.get_serializer(self.filter_queryset(self.get_queryset()), many=True).data),
+        )
+
     # /exercises/targets/  → ["chest","back","legs",...]
     @action(detail=False, methods=["get"], url_path="targets")
     def targets(self, request):
-        targets = (
-            Exercise.objects.exclude(target__isnull=True)
-            .exclude(target__exact="")
-            .order_by("target")
-            .values_list("target", flat=True)
-            .distinct()
-        )
-        return Response(list(targets))
+        def build():
+            return list(
+                Exercise.objects.exclude(target__isnull=True)
+                .exclude(target__exact="")
+                .order_by("target")
+                .values_list("target", flat=True)
+                .distinct()
+            )
+
+        return _cached_response(request, "exercise-targets", (), build)
+
+
+# copy_range 한 번에 만들 수 있는 최대 타깃 일수
+COPY_RANGE_MAX_DAYS = 366
+
+
+def _append_prefetched_tasks(plan, created):
+    """
+    with_tasks() 로 읽은 플랜에 방금 bulk_create 한 Task 를 메모리에서 합침.
+    (집계/prefetch 가 생성 전 값이라 그대로 직렬화하면 틀리고, 다시 읽으면 쿼리가 늘어남)
+    """
+    cached = getattr(plan, "_prefetched_objects_cache", {}).get("tasks")
+    if cached is None:
+        return
+    rows = sorted([*cached, *created], key=lambda t: t.id)  # with_tasks() 와 같은 id 순
+    cached._result_cache = rows
+    if hasattr(plan, "tasks_count"):
+        plan.tasks_count = len(rows)
+    if hasattr(plan, "total_duration_min"):
+        plan.total_duration_min = sum(t.duration_min or 0 for t in rows)
 
 
 # ----------------------------------------------------------------------
 # WorkoutPlan - 소유자 전용
-# - 날짜 필터: plan.date / plan.log_date / created_at__date 순으로 시도
+# - 날짜 필터: plan_date (인덱스 wp_user_plan_date_idx, 현지 날짜 기준)
 # ----------------------------------------------------------------------
 class WorkoutPlanViewSet(viewsets.ModelViewSet):
     queryset = WorkoutPlan.objects.all()
     serializer_class = WorkoutPlanSerializer
     permission_classes = [permissions.IsAuthenticated]
+    pagination_class = KeysetPagination
     lookup_value_regex = r"\d+"  # pk 숫자 제한
-    ordering = ("-id",)
+    ordering = ("-created_at", "-id")  # 커서 키 = (created_at, id) ↔ wp_user_created_id_idx
     filter_backends = [OrderingFilter]
     ordering_fields = ("id", "created_at")
 
@@ -119,31 +175,17 @@ class WorkoutPlanViewSet(viewsets.ModelViewSet):
         return parse_iso_date(qp.get("log_date") or qp.get("date"))
 
     def _with_date_filter(self, qs):
-        """여러 후보 경로로 날짜 필터링. 첫 매칭 전략 사용."""
+        """plan_date 로 날짜 필터링 (created_at__date 와 달리 인덱스를 그대로 탄다)."""
         d = self._get_date_param()
         if not d:
             return qs
-
-        tried = []
-        if _has_field(WorkoutPlan, "date"):
-            tried.append(Q(date=d))
-        if _has_field(WorkoutPlan, "log_date"):
-            tried.append(Q(log_date=d))
-        tried.append(Q(created_at__date=d))
-
-        for cond in tried:
-            try:
-                tmp = qs.filter(cond).distinct()
-            except FieldError:
-                continue
-            if tmp.exists():
-                return tmp
-        return qs.none()
+        return qs.filter(plan_date=d)
 
     def get_queryset(self):
         qs = WorkoutPlan.objects.filter(user=self.request.user)
         qs = self._with_date_filter(qs)
-        return qs.order_by(*self.ordering)
+        # tasks/tasks_count/total_duration_min: 목록 크기와 무관하게 고정 쿼리 수
+        return qs.with_tasks().order_by(*self.ordering)
 
     def perform_create(self, serializer):
         serializer.save(user=self.request.user)
@@ -154,8 +196,8 @@ class WorkoutPlanViewSet(viewsets.ModelViewSet):
         d = self._get_date_param()
         if not d:
             return Response({"detail": "date=YYYY-MM-DD 쿼리 파라미터가 필요합니다."}, status=400)
-        base = WorkoutPlan.objects.filter(user=request.user)
-        
+        base = WorkoutPlan.objects.filter(user=request.user).with_tasks()
+
         # 1차: 기본 전략
         qs1 = self._with_date_filter(base)
         debug = {
@@ -166,11 +208,11 @@ class WorkoutPlanViewSet(viewsets.ModelViewSet):
         }
         qs = qs1
         match_strategy = "primary"
-        # 2차: created_at__date in {d-1, d, d+1}
+        # 2차: plan_date in {d-1, d, d+1}
         if not qs.exists():
             from datetime import timedelta as _td
             around = [d - _td(days=1), d, d + _td(days=1)]
-            qs2 = base.filter(created_at__date__in=around).order_by("id")
+            qs2 = base.filter(plan_date__in=around).order_by("id")
             debug.update({"match2_candidates": [x.isoformat() for x in around], "match2_count": qs2.count()})
             if qs2.exists():
                 qs = qs2
@@ -192,7 +234,8 @@ class WorkoutPlanViewSet(viewsets.ModelViewSet):
     def today(self, request):
         today_ = timezone.localdate()
         plan = (
-            WorkoutPlan.objects.filter(user=request.user, created_at__date=today_)
+            WorkoutPlan.objects.filter(user=request.user, plan_date=today_)
+            .with_tasks()
             .order_by("-created_at", "-id")
             .first()
         )
@@ -205,7 +248,8 @@ class WorkoutPlanViewSet(viewsets.ModelViewSet):
     def ensure_today(self, request):
         today_ = timezone.localdate()
         plan = (
-            WorkoutPlan.objects.filter(user=request.user, created_at__date=today_)
+            WorkoutPlan.objects.filter(user=request.user, plan_date=today_)
+            .with_tasks()
             .order_by("-created_at", "-id")
             .first()
         )
@@ -221,14 +265,9 @@ class WorkoutPlanViewSet(viewsets.ModelViewSet):
                           or getattr(WorkoutPlan, "PlanSource", None)
                           or None,
             }
-            plan = WorkoutPlan.objects.create(user=request.user, **defaults)
+            plan = WorkoutPlan.objects.create(user=request.user, plan_date=today_, **defaults)
             created = True
 
-            # 모델에 date 필드가 있으면 '오늘' 기록 (시차 예방)
-            if _has_field(WorkoutPlan, "date"):
-                plan.date = today_
-                plan.save(update_fields=["date"] + (["updated_at"] if _has_field(WorkoutPlan, "updated_at") else []))
-
         ser = self.get_serializer(plan)
         return Response(ser.data, status=status.HTTP_201_CREATED if created else status.HTTP_200_OK)
 
@@ -273,6 +312,15 @@ class WorkoutPlanViewSet(viewsets.ModelViewSet):
     def generate_ai(self, request, pk=None):
         plan = self.get_object()
         data = request.data or {}
+
+        # 운동 id 가 없는 항목은 예전처럼 건너뜀. 나머지는 쓰기 전에 한 번에 검증
+        tasks_ser = BulkTaskItemListSerializer(
+            data={"items": [t for t in (data.get("tasks") or []) if t.get("exercise")]}
+        )
+        has_tasks = bool(tasks_ser.initial_data["items"])
+        if has_tasks and not tasks_ser.is_valid():
+            return Response({"detail": "tasks 검증 실패", "errors": tasks_ser.errors.get("items")}, status=400)
+
         plan.title = data.get("title", plan.title)
         if _has_field(WorkoutPlan, "target_focus"):
             plan.target_focus = data.get("target_focus", getattr(plan, "target_focus", ""))
@@ -290,38 +338,15 @@ class WorkoutPlanViewSet(viewsets.ModelViewSet):
         ):
             if _has_field(WorkoutPlan, f):
                 setattr(plan, f, ai.get(k, getattr(plan, f, None)))
-        plan.save()
-
-        created: list[TaskItem] = []
-        for t in data.get("tasks") or []:
-            ex_id = t.get("exercise")
-            if not ex_id:
-                continue
-            intensity_value = t.get("intensity") or getattr(TaskItem.IntensityLevel, "MEDIUM", "medium")
-            if intensity_value == "mid":  # 호환
-                intensity_value = getattr(TaskItem.IntensityLevel, "MEDIUM", "medium")
-
-            kwargs = dict(
-                workout_plan=plan,
-                exercise_id=ex_id,
-                duration_min=t.get("duration_min") or 0,
-                target_sets=t.get("target_sets"),
-                target_reps=t.get("target_reps"),
-                intensity=intensity_value,
-                notes=t.get("notes") or "",
-                order=t.get("order") or 1,
-            )
-            # 선택 필드
-            if _has_field(TaskItem, "is_ai_recommended"):
-                kwargs["is_ai_recommended"] = True
-            if _has_field(TaskItem, "ai_goal"):
-                kwargs["ai_goal"] = t.get("ai_goal") or ""
-            if _has_field(TaskItem, "ai_metadata"):
-                kwargs["ai_metadata"] = t.get("ai_metadata")
-            if _has_field(TaskItem, "recommended_weight_range"):
-                kwargs["recommended_weight_range"] = t.get("recommended_weight_range") or ""
-
-            created.append(TaskItem.objects.create(**kwargs))
+
+        with transaction.atomic():
+            plan.save()
+            created = tasks_ser.create_for_plan(plan, ai=True) if has_tasks else []
+        if created:
+            # bulk_create 는 시그널 없음
+            bump_user_version(plan.user_id)
+            schedule_refresh(plan.user_id, {plan.plan_date})
+            _append_prefetched_tasks(plan, created)
 
         return Response(
             {
@@ -332,143 +357,50 @@ class WorkoutPlanViewSet(viewsets.ModelViewSet):
             status=status.HTTP_200_OK,
         )
 
+    # POST /workoutplans/{id}/tasks/bulk/  body: {"items": [{exercise, order, duration_min, ...}, ...]}
+    @action(detail=True, methods=["post"], url_path="tasks/bulk")
+    def bulk_tasks(self, request, pk=None):
+        """운동 id 검증 1회 + bulk_create 1회. 하나라도 잘못되면 아무것도 만들지 않음."""
+        plan = self.get_object()
+        ser = BulkTaskItemListSerializer(data=request.data)
+        ser.is_valid(raise_exception=True)
+        with transaction.atomic():
+            created = ser.create_for_plan(plan)
+        bump_user_version(plan.user_id)
+        schedule_refresh(plan.user_id, {plan.plan_date})
+        return Response(
+            {"created_tasks": TaskItemSerializer(created, many=True).data},
+            status=status.HTTP_201_CREATED,
+        )
+
     # POST /workoutplans/copy_week/?source_start=YYYY-MM-DD&target_start=YYYY-MM-DD&overwrite=true|false
     @action(detail=False, methods=["post"], url_path="copy_week")
     def copy_week(self, request):
         """
-        기준 주(월~일)의 계획/TaskItem을 타깃 주로 복제.
-        WorkoutPlan.created_at의 '날짜' 기준으로 동작 (date 필드 없이 사용 가능)
+        기준 주(월~일)의 계획/TaskItem을 타깃 주로 복제. (copy_range 의 1주 버전)
+        WorkoutPlan.plan_date 기준으로 동작
         - source_start: YYYY-MM-DD (옵션, 기본: 이번 주 월요일)
         - target_start: YYYY-MM-DD (옵션, 기본: source_start + 7일)
         - overwrite: true/false (옵션, 기본 false)
         """
-        user = request.user
         q = request.query_params
         overwrite = (q.get("overwrite") or "false").lower() == "true"
-
-        src_raw = q.get("source_start")
-        tgt_raw = q.get("target_start")
-        src0 = monday_of(parse_iso_date(src_raw) or date.today())
-        tgt0 = monday_of(parse_iso_date(tgt_raw) or (src0 + timedelta(days=7)))
-
-        src_days = [src0 + timedelta(days=i) for i in range(7)]
-        tgt_days = [tgt0 + timedelta(days=i) for i in range(7)]
-
-        src_plans = (
-            WorkoutPlan.objects.filter(user=user)
-            .filter(created_at__date__range=(src0, src0 + timedelta(days=6)))
-            .order_by("created_at", "id")
-        )
-
-        # 같은 날짜의 최신 플랜으로 매핑
-        src_map = {}
-        for p in src_plans:
-            d0 = p.created_at.date()
-            src_map[d0] = p
-
-        created_plans = 0
-        created_items = 0
-        skipped_days: list[str] = []
-        overwritten_days: list[str] = []
+        src0 = monday_of(parse_iso_date(q.get("source_start")) or date.today())
+        tgt0 = monday_of(parse_iso_date(q.get("target_start")) or (src0 + timedelta(days=7)))
 
         try:
-            with transaction.atomic():
-                for src_day, tgt_day in zip(src_days, tgt_days):
-                    src_plan = src_map.get(src_day)
-                    if not src_plan:
-                        skipped_days.append(tgt_day.isoformat())
-                        continue
-
-                    # 타깃 날짜 플랜 탐색
-                    tgt_plan = (
-                        WorkoutPlan.objects.filter(user=user)
-                        .filter(created_at__date=tgt_day)
-                        .order_by("-created_at", "-id")
-                        .first()
-                    )
-
-                    if not tgt_plan:
-                        base_title = src_plan.title or f"{src_day.isoformat()} Workout"
-                        tgt_plan = WorkoutPlan.objects.create(
-                            user=user,
-                            title=f"{tgt_day.isoformat()} {base_title}",
-                            description="",
-                            summary="",
-                            target_focus=getattr(src_plan, "target_focus", ""),
-                            source=getattr(src_plan, "source", getattr(WorkoutPlan.PlanSource, "MANUAL", None)),
-                        )
-                        created_plans += 1
-                        
-                        # date 필드가 있으면 타깃 날짜로 보정
-                        if _has_field(WorkoutPlan, "date"):
-                            tgt_plan.date = tgt_day
-                            tgt_plan.save(update_fields=["date"] + (["updated_at"] if _has_field(WorkoutPlan, "updated_at") else []))
-                    
-                    else:
-                        if not overwrite and TaskItem.objects.filter(workout_plan=tgt_plan).exists():
-                            skipped_days.append(tgt_day.isoformat())
-                            continue
-                        if overwrite:
-                            TaskItem.objects.filter(workout_plan=tgt_plan).delete()
-                            overwritten_days.append(tgt_day.isoformat())
-
-                    # --- 소스 아이템 복제 ---
-                    src_items = (
-                        TaskItem.objects.select_related("exercise")
-                        .filter(workout_plan=src_plan)
-                        .order_by("order", "id")
-                    )
-
-                    if not src_items.exists():
-                        skipped_days.append(tgt_day.isoformat())
-                        continue
-
-                    taskitem_fields = {f.name for f in TaskItem._meta.get_fields()}
-
-                    clones = []
-                    for it in src_items:
-                        attrs = {
-                            "workout_plan": tgt_plan,
-                            "exercise": it.exercise,
-                            "duration_min": it.duration_min,
-                            "target_sets": getattr(it, "target_sets", None),
-                            "target_reps": getattr(it, "target_reps", None),
-                            "intensity": getattr(it, "intensity", None),
-                            "notes": getattr(it, "notes", ""),
-                            "order": (it.order or 1),
-                        }
-                        # AI/보조 필드
-                        if "is_ai_recommended" in taskitem_fields:
-                            attrs["is_ai_recommended"] = getattr(it, "is_ai_recommended", False)
-                        if "ai_goal" in taskitem_fields:
-                            attrs["ai_goal"] = getattr(it, "ai_goal", "")
-                        if "ai_metadata" in taskitem_fields:
-                            attrs["ai_metadata"] = getattr(it, "ai_metadata", None)
-                        if "recommended_weight_range" in taskitem_fields:
-                            attrs["recommended_weight_range"] = getattr(it, "recommended_weight_range", "")
-
-                        # 상태 관련 필드 초기화
-                        if "completed" in taskitem_fields:
-                            attrs["completed"] = False
-                        if "skipped" in taskitem_fields:
-                            attrs["skipped"] = False
-                        if "skip_reason" in taskitem_fields:
-                            attrs["skip_reason"] = None
-                        if "completed_at" in taskitem_fields:
-                            attrs["completed_at"] = None
-
-                        clones.append(TaskItem(**attrs))
-
-                    TaskItem.objects.bulk_create(clones)
-                    created_items += len(clones)
-
+            res = copy_days(
+                request.user,
+                [(src0 + timedelta(days=i), tgt0 + timedelta(days=i)) for i in range(7)],
+                overwrite=overwrite,
+            )
             return Response({
                 "source_week": {"start": src0.isoformat(), "end": (src0 + timedelta(days=6)).isoformat()},
                 "target_week": {"start": tgt0.isoformat(), "end": (tgt0 + timedelta(days=6)).isoformat()},
-                "created_plans": created_plans,
-                "created_items": created_items,
-                "skipped_days": skipped_days,
-                "overwritten_days": overwritten_days,
+                "created_plans": res.created_plans,
+                "created_items": res.created_items,
+                "skipped_days": res.skipped_days,
+                "overwritten_days": res.overwritten_days,
                 "overwrite": overwrite,
             }, status=status.HTTP_200_OK)
 
@@ -477,6 +409,58 @@ class WorkoutPlanViewSet(viewsets.ModelViewSet):
         except Exception as e:
             return Response({"detail": f"copy_week failed: {e}"}, status=500)
 
+    # POST /workoutplans/copy_range/
+    #   body(또는 쿼리): source_start, source_end | weeks, target_start, repeat, overwrite
+    @action(detail=False, methods=["post"], url_path="copy_range")
+    def copy_range(self, request):
+        """
+        원본 구간 [source_start, source_end] 를 target_start 부터 repeat 번 이어 붙여 복제.
+        - source_start: YYYY-MM-DD (기본: 이번 주 월요일)
+        - source_end: YYYY-MM-DD (기본: source_start + weeks*7 - 1, weeks 기본 1)
+        - target_start: YYYY-MM-DD (기본: source_end 다음 날)
+        - repeat: 반복 횟수 (기본 1) — 예) 1주 루틴을 12주로: weeks=1&repeat=12
+        - overwrite: true/false (기본 false)
+        일수와 무관하게 고정된 쿼리 수 (tasks/plan_copy.py)
+        """
+        params = {**request.query_params.dict(), **(request.data if isinstance(request.data, dict) else {})}
+        overwrite = str(params.get("overwrite") or "false").lower() == "true"
+        try:
+            weeks = int(params.get("weeks") or 1)
+            repeat = int(params.get("repeat") or 1)
+        except (TypeError, ValueError):
+            return Response({"detail": "weeks/repeat 는 정수여야 합니다."}, status=400)
+        if weeks < 1 or repeat < 1:
+            return Response({"detail": "weeks/repeat 는 1 이상이어야 합니다."}, status=400)
+
+        src0 = parse_iso_date(params.get("source_start")) or monday_of(date.today())
+        src1 = parse_iso_date(params.get("source_end")) or (src0 + timedelta(days=weeks * 7 - 1))
+        if src1 < src0:
+            return Response({"detail": "source_end 는 source_start 이후여야 합니다."}, status=400)
+        span = (src1 - src0).days + 1
+        tgt0 = parse_iso_date(params.get("target_start")) or (src1 + timedelta(days=1))
+        tgt1 = tgt0 + timedelta(days=span * repeat - 1)
+        if span * repeat > COPY_RANGE_MAX_DAYS:
+            return Response({"detail": f"한 번에 최대 {COPY_RANGE_MAX_DAYS}일까지 복제할 수 있습니다."}, status=400)
+        if tgt0 <= src1 and src0 <= tgt1:
+            return Response({"detail": "원본과 타깃 구간이 겹칩니다."}, status=400)
+
+        pairs = [
+            (src0 + timedelta(days=i), tgt0 + timedelta(days=r * span + i))
+            for r in range(repeat)
+            for i in range(span)
+        ]
+        res = copy_days(request.user, pairs, overwrite=overwrite)
+        return Response({
+            "source": {"start": src0.isoformat(), "end": src1.isoformat()},
+            "target": {"start": tgt0.isoformat(), "end": tgt1.isoformat()},
+            "repeat": repeat,
+            "created_plans": res.created_plans,
+            "created_items": res.created_items,
+            "skipped_days": res.skipped_days,
+            "overwritten_days": res.overwritten_days,
+            "overwrite": overwrite,
+        }, status=status.HTTP_200_OK)
+
 
 # ----------------------------------------------------------------------
 # TaskItem - 계획 내 운동 항목 (+ 완료/스킵 토글, 주간 집계)
@@ -485,6 +469,7 @@ class TaskItemViewSet(viewsets.ModelViewSet):
     queryset = TaskItem.objects.select_related("workout_plan", "exercise").all()
     serializer_class = TaskItemSerializer
     permission_classes = [permissions.IsAuthenticated]
+    pagination_class = KeysetPagination
     lookup_value_regex = r"\d+"
     ordering = ("-id",)
     filter_backends = [OrderingFilter]
@@ -497,14 +482,22 @@ class TaskItemViewSet(viewsets.ModelViewSet):
         )
         d = parse_iso_date(self.request.query_params.get("date") or self.request.query_params.get("log_date"))
         if d:
-            qs = qs.filter(workout_plan__created_at__date=d)
+            qs = qs.filter(workout_plan__plan_date=d)
+        plan_id = self.request.query_params.get("workout_plan")
+        if plan_id and plan_id.isdigit():
+            # 대시보드: 플랜별 작업 목록 (페이지 단위 응답에서도 다른 플랜 항목이 섞이지 않도록)
+            qs = qs.filter(workout_plan_id=int(plan_id))
         return qs.order_by(*self.ordering)
 
     def perform_create(self, serializer):
         plan = serializer.validated_data.get("workout_plan")
         if plan.user_id != self.request.user.id:
             raise PermissionDenied("다른 사용자의 계획에는 항목을 추가할 수 없습니다.")
-        serializer.save()
+        completed = bool(serializer.validated_data.get("completed"))
+        with transaction.atomic():
+            ti = serializer.save(completed_at=timezone.now() if completed else None)
+            if completed:
+                sync_completion(self.request.user, [ti], True)
 
     def perform_update(self, serializer):
         instance_plan = serializer.instance.workout_plan
@@ -513,7 +506,62 @@ class TaskItemViewSet(viewsets.ModelViewSet):
         new_plan = serializer.validated_data.get("workout_plan", instance_plan)
         if new_plan.user_id != self.request.user.id:
             raise PermissionDenied("다른 사용자의 계획으로 이동할 수 없습니다.")
-        serializer.save()
+
+        # 화면은 PATCH {"completed": ...} 로 완료 처리 → toggle-complete 와 같은 WorkoutLog/하루 합계 동기화
+        was_completed = serializer.instance.completed
+        completed = serializer.validated_data.get("completed", was_completed)
+        extra = {}
+        if completed != was_completed:
+            extra["completed_at"] = timezone.now() if completed else None
+        with transaction.atomic():
+            ti = serializer.save(**extra)
+            if completed != was_completed:
+                sync_completion(self.request.user, [ti], completed)
+
+    # ✅ POST /taskitems/bulk-toggle/  body: {"ids": [..]} 또는 {"workout_plan": id}, "value": true|false
+    @action(detail=False, methods=["post"], url_path="bulk-toggle")
+    def bulk_toggle(self, request):
+        """루틴 전체 체크/해제를 한 요청·한 트랜잭션으로. WorkoutLog/합계 동기화는 toggle-complete 와 동일."""
+        data = request.data
+        new_val = data.get("value", True) in (True, "true", "True", 1, "1")
+        qs = TaskItem.objects.filter(workout_plan__user=request.user).select_related("exercise", "workout_plan")
+        ids = None
+        try:
+            if data.get("workout_plan"):
+                qs = qs.filter(workout_plan_id=int(data.get("workout_plan")))
+            elif isinstance(data.get("ids"), list) and data["ids"]:
+                ids = [int(i) for i in data["ids"]]
+                qs = qs.filter(id__in=ids)
+            else:
+                return Response({"detail": "ids(목록) 또는 workout_plan 이 필요합니다."}, status=400)
+        except (TypeError, ValueError):
+            return Response({"detail": "ids/workout_plan 은 정수여야 합니다."}, status=400)
+
+        with transaction.atomic():
+            tasks = list(qs.select_for_update(of=("self",)))
+            if not tasks:
+                raise NotFound("대상 항목이 없습니다.")
+            if ids is not None:
+                found = {t.id for t in tasks}
+                missing = [i for i in ids if i not in found]
+                if missing:
+                    return Response({"detail": f"내 항목이 아니거나 없는 id: {missing}"}, status=400)
+
+            changes = {"completed": new_val, "completed_at": timezone.now() if new_val else None}
+            if new_val:
+                changes.update(skipped=False, skip_reason=None)
+            TaskItem.objects.filter(id__in=[t.id for t in tasks]).update(**changes)
+            d = sync_completion(request.user, tasks, new_val)
+
+        # QuerySet.update 는 시그널이 없으므로 캐시/롤업 직접 갱신
+        bump_user_version(request.user.id)
+        schedule_refresh(request.user.id, {t.workout_plan.plan_date for t in tasks})
+        return Response({
+            "ok": True,
+            "ids": [t.id for t in tasks],
+            "completed": new_val,
+            "workout_minutes": daily_minutes(request.user.id, d),
+        })
 
     # ✅ POST /taskitems/{id}/toggle-complete/
     @action(detail=True, methods=["post"], url_path="toggle-complete")
@@ -546,45 +594,10 @@ class TaskItemViewSet(viewsets.ModelViewSet):
         if "updated_at" in field_names:
             update_fields.append("updated_at")
 
-        ti.save(update_fields=update_fields)
-        return Response({"ok": True, "id": ti.id, "completed": ti.completed, "completed_at": ti.completed_at})
-
-        # ✅ WorkoutLog 동기화 (모델 있을 때만)
-        if HAS_WORKOUT_LOG:
-            today_ = timezone.localdate()
-            dur = int(getattr(ti, "duration_min", 0) or 0)
-
-            if new_val:
-                # 완료 → 오늘 로그 업서트
-                wl, created = WorkoutLog.objects.get_or_create(
-                    user=request.user,
-                    task_item=ti,
-                    date=today_,                      # ← 키에 date 포함 (권장)
-                    defaults={"duration_min": dur},
-                )
-                if not created and wl.duration_min != dur:
-                    wl.duration_min = dur
-                    wl.save(update_fields=["duration_min"])
-            else:
-                # 완료 해제 → 오늘 로그만 제거(다른 날짜 보존)
-                WorkoutLog.objects.filter(
-                    user=request.user, task_item=ti, date=today_
-                ).delete()
-
-
-            # 3) (선택) DailyGoal의 workout_minutes_actual 업데이트
-            try:
-                from goals.models import DailyGoal
-                total_min = (
-                    WorkoutLog.objects
-                    .filter(user=request.user, date=today_)
-                    .aggregate(Sum("duration_min"))["duration_min__sum"] or 0
-                )
-                dg, _ = DailyGoal.objects.get_or_create(user=request.user, date=today_)
-                dg.workout_minutes_actual = int(total_min)
-                dg.save(update_fields=["workout_minutes_actual"])
-            except Exception:
-                pass
+        with transaction.atomic():
+            ti.save(update_fields=update_fields)
+            # ✅ WorkoutLog 동기화 + 하루 운동 합계 증분
+            sync_completion(request.user, [ti], new_val)
 
         return Response({"ok": True, "id": ti.id, "completed": ti.completed, "completed_at": ti.completed_at})
     
@@ -602,6 +615,7 @@ class TaskItemViewSet(viewsets.ModelViewSet):
         val = request.data.get("value")
         new_val = True if val in (True, "true", "True", 1, "1") else False
         reason = (request.data.get("reason") or "").strip()
+        was_completed = bool(getattr(ti, "completed", False))
 
         ti.skipped = new_val
         if "completed" in field_names:
@@ -621,7 +635,11 @@ class TaskItemViewSet(viewsets.ModelViewSet):
         if "updated_at" in field_names:
             update_fields.append("updated_at")
 
-        ti.save(update_fields=update_fields)
+        with transaction.atomic():
+            ti.save(update_fields=update_fields)
+            if was_completed:
+                # 완료 → 스킵: toggle-complete 해제와 같이 WorkoutLog/하루 합계에서 뺌
+                sync_completion(request.user, [ti], False)
         return Response({
             "ok": True,
             "id": ti.id,
@@ -635,45 +653,21 @@ class TaskItemViewSet(viewsets.ModelViewSet):
         """
         주간 TaskItem 집계 + 간단 피드백.
         ?start=YYYY-MM-DD (옵션, 기본: 이번 주 월요일)
-        WorkoutPlan.created_at의 '날짜' 기준으로 필터링.
+        WorkoutPlan.plan_date 기준으로 필터링.
         """
         start = monday_of(parse_iso_date(request.query_params.get("start")) or date.today())
         end = start + timedelta(days=6)
 
-        items = self.get_queryset().filter(workout_plan__created_at__date__range=(start, end))
-        total = items.count()
-
-        field_names = {f.name for f in TaskItem._meta.get_fields()}
-        has_completed = "completed" in field_names
-        has_skipped = "skipped" in field_names
-
-        done = items.filter(completed=True).count() if has_completed else 0
-        skipped = items.filter(skipped=True).count() if has_skipped else 0
+        # plan_date 별 전체/완료/스킵 — GROUP BY 쿼리 1회
+        counts = day_counts(self.get_queryset().filter(workout_plan__plan_date__range=(start, end)))
+        total = sum(t for t, _, _ in counts.values())
+        done = sum(c for _, c, _ in counts.values())
+        skipped = sum(s for _, _, s in counts.values())
         rate = round((done * 100.0 / total), 1) if total else 0.0
 
-        # 일자별 완료 여부
-        day_has_done = {start + timedelta(days=i): False for i in range(7)}
-        if total:
-            if has_completed:
-                for dt, c in items.values_list("workout_plan__created_at", "completed"):
-                    d0 = dt.date()
-                    if start <= d0 <= end and c:
-                        day_has_done[d0] = True
-            else:
-                for dt in items.values_list("workout_plan__created_at", flat=True):
-                    d0 = dt.date()
-                    if start <= d0 <= end:
-                        day_has_done[d0] = True
-
-        # best streak
-        cur = best = 0
-        for i in range(7):
-            d0 = start + timedelta(days=i)
-            if day_has_done.get(d0, False):
-                cur += 1
-                best = max(best, cur)
-            else:
-                cur = 0
+        # best streak: 완료 항목이 하나라도 있는 날 연속
+        week = [start + timedelta(days=i) for i in range(7)]
+        best = best_streak(counts.get(d0, (0, 0, 0))[1] > 0 for d0 in week)
 
         if rate >= 80:
             feedback = "아주 좋아요! 이번 주 루틴을 안정적으로 유지했어요. 다음 주엔 난이도를 살짝 올려볼까요?"
@@ -689,6 +683,23 @@ class TaskItemViewSet(viewsets.ModelViewSet):
             "feedback": feedback,
         }, status=status.HTTP_200_OK)
 
+    # GET /taskitems/progress-history/?weeks=N&end=YYYY-MM-DD
+    @action(detail=False, methods=["get"], url_path="progress-history")
+    def progress_history(self, request):
+        """
+        주별 완료율/best streak (오래된 주 → 최근 주). 롤업(DailyTaskProgress) 1회 조회.
+        - weeks: 1~52 (기본 12)
+        - end: 이 날짜가 속한 주까지 (기본 오늘)
+        """
+        try:
+            weeks = int(request.query_params.get("weeks") or 12)
+        except ValueError:
+            return Response({"detail": "weeks 는 정수여야 합니다."}, status=400)
+        if not 1 <= weeks <= HISTORY_MAX_WEEKS:
+            return Response({"detail": f"weeks 는 1~{HISTORY_MAX_WEEKS} 사이여야 합니다."}, status=400)
+        last = monday_of(parse_iso_date(request.query_params.get("end")) or timezone.localdate())
+        return Response({"weeks": history(request.user.id, last, weeks)})
+
 
 # ----------------------------------------------------------------------
 # WorkoutLog (선택) - user 기준 필터/주입
@@ -708,17 +719,55 @@ if HAS_WORKOUT_LOG:
                 "task_item", "task_item__workout_plan", "task_item__exercise"
             )
 
+        # 하루 운동 합계(DailyWorkoutTotal)는 로그 쓰기마다 변화량만 반영
         def perform_create(self, serializer):
             ti = serializer.validated_data.get("task_item")
             if ti is not None and getattr(ti.workout_plan, "user_id", None) != self.request.user.id:
                 raise PermissionDenied("다른 사용자의 계획/항목에 로그를 추가할 수 없습니다.")
-            serializer.save(user=self.request.user)
+            with transaction.atomic():
+                wl = serializer.save(user=self.request.user)
+                add_to_daily_total(wl.user_id, wl.date, wl.duration_min, wl.kcal_burned)
+
+        def perform_update(self, serializer):
+            before = serializer.instance
+            old = (before.date, before.duration_min, before.kcal_burned)
+            with transaction.atomic():
+                wl = serializer.save()
+                add_to_daily_total(wl.user_id, old[0], -old[1], -old[2])
+                add_to_daily_total(wl.user_id, wl.date, wl.duration_min, wl.kcal_burned)
+
+        def perform_destroy(self, instance):
+            with transaction.atomic():
+                add_to_daily_total(instance.user_id, instance.date, -instance.duration_min, -instance.kcal_burned)
+                instance.delete()
 
 
 # ----------------------------------------------------------------------
 # Fixtures → 간단 JSON으로 노출 (프런트 시드용)
 # GET /api/fixtures/exercises/
 # ----------------------------------------------------------------------
+class _FixtureSchemaError(ValueError):
+    pass
+
+
+def _parse_exercise_fixture(path):
+    raw = json.loads(path.read_text(encoding="utf-8"))
+    if not isinstance(raw, list):
+        raise _FixtureSchemaError("fixture schema must be a JSON list")
+
+    out = []
+    for rec in raw:
+        model_name = str(rec.get("model", "")).lower()
+        if not model_name.endswith("exercise"):
+            continue
+        pk = rec.get("pk")
+        fields = rec.get("fields", {}) or {}
+        if not isinstance(fields, dict):
+            continue
+        out.append({"id": pk, **fields})
+    return out
+
+
 @api_view(["GET"])
 @permission_classes([permissions.IsAuthenticated])
 def fixtures_exercises(request):
@@ -737,27 +786,22 @@ def fixtures_exercises(request):
         return Response({"detail": "fixture not found (exercise[s].json)"}, status=404)
 
     try:
-        if fixture_path.stat().st_size > 1_000_000:
+        st = fixture_path.stat()
+        if st.st_size > 1_000_000:
             return Response({"detail": "fixture too large (>1MB)"}, status=400)
-        raw = json.loads(fixture_path.read_text(encoding="utf-8"))
+        # 파일이 그대로면 (경로, mtime, 크기) 키로 파싱 결과 재사용 — 오류는 캐시하지 않음
+        return _cached_response(
+            request,
+            "exercise-fixture",
+            (str(fixture_path), st.st_mtime_ns, st.st_size),
+            lambda: _parse_exercise_fixture(fixture_path),
+            version="file",
+        )
+    except _FixtureSchemaError as e:
+        return Response({"detail": str(e)}, status=400)
     except Exception as e:
         return Response({"detail": f"fixture read error: {e}"}, status=400)
 
-    if not isinstance(raw, list):
-        return Response({"detail": "fixture schema must be a JSON list"}, status=400)
-
-    out = []
-    for rec in raw:
-        model_name = str(rec.get("model", "")).lower()
-        if not model_name.endswith("exercise"):
-            continue
-        pk = rec.get("pk")
-        fields = rec.get("fields", {}) or {}
-        if not isinstance(fields, dict):
-            continue
-        out.append({"id": pk, **fields})
-    return Response(out)
-
 
 # ----------------------------------------------------------------------
 # 템플릿 뷰 (대시보드/워크아웃/밀)
@@ -837,36 +881,16 @@ def dashboard(request):
     today = timezone.localdate()
     today_totals = {
         "workout_minutes": 0,
+        "workout_kcal": 0,
         "meals": {"calories": 0, "protein": 0, "carbs": 0, "fat": 0},
         "goals": {"total": 0, "completed": 0},
     }
 
-    # 1) 운동 합계 (WorkoutLog 있을 때)
-    if HAS_WORKOUT_LOG:
-        wl_sum = (
-            WorkoutLog.objects
-            .filter(user=request.user, date=today)
-            .aggregate(total=Sum("duration_min"))
-            .get("total") or 0
-        )
-        today_totals["workout_minutes"] = int(wl_sum)
-    else:
-        today_totals["workout_minutes"] = 0
-        
-    # ✅ 폴백: WorkoutLog가 0이면, 오늘 완료된 TaskItem duration 합계로 보정
-    if today_totals["workout_minutes"] == 0:
-        try:
-            ti_sum = (
-                TaskItem.objects
-                .filter(workout_plan__user=request.user,
-                        workout_plan__created_at__date=today,
-                        completed=True)
-                .aggregate(Sum("duration_min"))["duration_min__sum"]
-                or 0
-            )
-            today_totals["workout_minutes"] = ti_sum
-        except Exception:
-            pass
+    # 1) 운동 합계 — 완료 시 증분 갱신되는 하루 합계 행 하나만 읽음 (workout_sync.py)
+    #    분/kcal 모두 같은 행 → 타일 두 숫자가 어긋나지 않음 (kcal 규칙은 calories.kcal_per_min)
+    minutes, kcal = daily_totals(request.user.id, today)
+    today_totals["workout_minutes"] = int(minutes)
+    today_totals["workout_kcal"] = int(kcal)
 
     # 2) 식단 합계 (NutritionLog 우선, 없으면 MealItem 대안)
     if HAS_INTAKE_MODELS:
@@ -1002,9 +1026,15 @@ def meals(request):
                 "fat":      float(getattr(log, "fat_total_g", 0)),
             }
             # 상세 히스토리: NutritionLog만으로는 아이템 목록이 없으니 아래 MealItem로 보강
-            items = MealItem.objects.filter(meal__user=request.user, meal__log_date=today).order_by("-id")
+            items = (
+                MealItem.objects.filter(meal__user=request.user, meal__log_date=today)
+                .select_related("meal", "food").with_nutrients().order_by("-id")
+            )
         else:
-            items = MealItem.objects.filter(meal__user=request.user, meal__log_date=today).order_by("-id")
+            items = (
+                MealItem.objects.filter(meal__user=request.user, meal__log_date=today)
+                .select_related("meal", "food").with_nutrients().order_by("-id")
+            )
             def _nut(i, k): return i.resolved_nutrients().get(k, 0)
             consumed = {
                 "calories": sum(_nut(i, "kcal") for i in items),
@@ -1018,15 +1048,12 @@ def meals(request):
             "아침": "breakfast", "점심": "lunch", "저녁": "dinner", "간식": "snack",
             "breakfast": "breakfast", "lunch": "lunch", "dinner": "dinner", "snack": "snack",
         }
+        # ✅ 사진 URL: 목록 전체를 한 번에 (presigned URL 캐시)
+        photo_map = photo_urls(item.photo.name for item in items if item.photo)
+        thumb_map = thumbnail_urls(item.photo.name for item in items if item.photo and item.thumbs_ready)
         for item in items:
             n = item.resolved_nutrients()
-            # ✅ 사진 URL
-            photo_url = None
-            try:
-                if getattr(item, "photo", None) and item.photo:
-                    photo_url = default_storage.url(item.photo.name)
-            except Exception:
-                photo_url = None
+            photo_url = photo_map.get(item.photo.name) if item.photo else None
 
             meal_history.append(
                 {
@@ -1040,6 +1067,7 @@ def meals(request):
                     "source": "AI",
                     "type_class": type_class_map.get(item.meal.meal_type, "default"),
                     "photo_url": photo_url,
+                    "photo_thumbs": thumb_map.get(item.photo.name) if item.photo else None,
                 }
             )
 
@@ -0,0 +1,91 @@
+"""
+tasks/workout_sync.py
+
+TaskItem 완료/해제 → WorkoutLog 동기화 + 하루 운동 합계(DailyWorkoutTotal) 증분 갱신.
+
+- 완료: (task, 날짜) WorkoutLog 를 한 번에 조회 후 없는 것만 bulk_create, 바뀐 것만 bulk_update
+- 해제: 그날 로그만 삭제 (다른 날짜 기록 보존)
+- 합계는 변화량(분, kcal)을 모아 UPDATE ... SET minutes = minutes + Δ 한 번 (행 없으면 생성)
+- 날짜 = 완료 처리한 날(현지). WorkoutLog 를 직접 CRUD 하는 API 도 add_to_daily_total 로 같은 합계를 맞춘다
+- 합계가 어긋났으면 manage.py rebuild_workout_totals
+"""
+from django.db import IntegrityError, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from .calories import kcal_per_min
+from .models import DailyWorkoutTotal, WorkoutLog
+
+
+def task_kcal(task, minutes):
+    """요약/대시보드와 같은 규칙 (calories.kcal_expr 의 파이썬 버전)."""
+    rate = getattr(task.exercise, "kcal_burned_per_min", 0) or 0
+    return round(minutes * kcal_per_min(rate, task.intensity), 1)
+
+
+def add_to_daily_total(user_id, d, minutes=0, kcal=0.0):
+    """(user, d) 합계에 변화량 반영. 동시 요청은 F 식 UPDATE 로 합산된다."""
+    if not (user_id and d) or not (minutes or kcal):
+        return
+    qs = DailyWorkoutTotal.objects.filter(user_id=user_id, date=d)
+    delta = {"minutes": F("minutes") + minutes, "kcal": F("kcal") + kcal, "updated_at": timezone.now()}
+    if qs.update(**delta):
+        return
+    try:
+        with transaction.atomic():
+            DailyWorkoutTotal.objects.create(user_id=user_id, date=d, minutes=minutes, kcal=kcal)
+    except IntegrityError:
+        # 다른 요청이 먼저 만들었으면 그 행에 더함
+        qs.update(**delta)
+
+
+def daily_totals(user_id, d):
+    """(분, kcal) — 행이 없으면 (0, 0.0)."""
+    row = DailyWorkoutTotal.objects.filter(user_id=user_id, date=d).values_list("minutes", "kcal").first()
+    return row or (0, 0.0)
+
+
+def daily_minutes(user_id, d):
+    return daily_totals(user_id, d)[0]
+
+
+def sync_completion(user, tasks, completed, on_date=None):
+    """
+    tasks: exercise 가 로드된 TaskItem 목록 (completed 값은 호출 쪽에서 이미 저장)
+    반환: 반영한 날짜
+    """
+    d = on_date or timezone.localdate()
+    if not tasks:
+        return d
+    existing = {
+        wl.task_item_id: wl
+        for wl in WorkoutLog.objects.filter(user=user, date=d, task_item_id__in=[t.id for t in tasks])
+    }
+    d_min, d_kcal = 0, 0.0
+
+    if completed:
+        new, changed = [], []
+        for t in tasks:
+            mins = int(t.duration_min or 0)
+            kcal = task_kcal(t, mins)
+            wl = existing.get(t.id)
+            if wl is None:
+                new.append(WorkoutLog(
+                    user=user, workout_plan_id=t.workout_plan_id, exercise_id=t.exercise_id,
+                    task_item=t, date=d, duration_min=mins, kcal_burned=kcal,
+                ))
+                d_min, d_kcal = d_min + mins, d_kcal + kcal
+            elif (wl.duration_min, wl.kcal_burned) != (mins, kcal):
+                d_min, d_kcal = d_min + mins - wl.duration_min, d_kcal + kcal - wl.kcal_burned
+                wl.duration_min, wl.kcal_burned = mins, kcal
+                changed.append(wl)
+        WorkoutLog.objects.bulk_create(new)
+        if changed:
+            WorkoutLog.objects.bulk_update(changed, ["duration_min", "kcal_burned"])
+    elif existing:
+        d_min = -sum(wl.duration_min for wl in existing.values())
+        d_kcal = -sum(wl.kcal_burned for wl in existing.values())
+        WorkoutLog.objects.filter(id__in=[wl.id for wl in existing.values()]).delete()
+
+    add_to_daily_total(user.id, d, d_min, d_kcal)
+    return d
@@ -227,6 +227,16 @@ REST_FRAMEWORK = {
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
 }
 
+# 사용자 소유 목록 API 커서 페이지네이션 (utils.pagination.KeysetPagination)
+# - API_LIST_BARE=True 이면 기본 응답을 예전처럼 '맨 리스트'로 (클라이언트 전환 기간용)
+# - 요청 단위로는 ?paginate=false / ?paginate=true 로 덮어쓸 수 있음
+API_PAGE_SIZE = int(env_get("API_PAGE_SIZE", "50"))
+API_LIST_BARE_DEFAULT = env_get("API_LIST_BARE", "False").lower() == "true"
+
+# 식사 사진 썸네일(intakes.thumbnails): 백그라운드 스레드 수 / 동기 실행(테스트·디버그용)
+THUMBNAIL_WORKERS = int(env_get("THUMBNAIL_WORKERS", "2"))
+THUMBNAILS_SYNC = env_get("THUMBNAILS_SYNC", "False").lower() == "true"
+
 
 # 토큰 만료는 발표 직전에 env로 조절할 수 있도록 훅만 둠
 def _int_minutes(key: str, default: int):
@@ -415,6 +425,10 @@ else:
                 }
             }
 
+# PostgreSQL 이면 trigram 검색 lookup(name__trigram_similar) 등록용 앱 추가
+if DATABASES["default"]["ENGINE"] == "django.db.backends.postgresql":
+    INSTALLED_APPS.append("django.contrib.postgres")
+
 # ─────────────────────────────────────────────────────────────────────────────
 # 6.x) Redis 캐시 설정
 # - docker-compose.local.yml 에서 REDIS_URL 이 주입되면 Redis 사용
@@ -435,6 +449,12 @@ if REDIS_URL:
     }
     # AI/이미지 분석 같은 무거운 연산 캐시 시간 (기본 1시간)
     AI_MEAL_CACHE_TIMEOUT = int(env_get("AI_MEAL_CACHE_TIMEOUT", str(60 * 60)))
+    # by-date 조회 ETag(하루 단위 버전 카운터) — 프로세스 간 공유 캐시에서만 안전
+    DAY_ETAG_ENABLED = env_get("DAY_ETAG_ENABLED", "True").lower() == "true"
+    # 운동 하루 요약(/api/workouts/day/) 캐시 시간(초) — 쓰기 시 사용자 버전 증가로 무효화
+    WORKOUT_DAY_CACHE_TTL = int(env_get("WORKOUT_DAY_CACHE_TTL", str(60 * 5)))
+    # 운동 카탈로그 메모리 캐시 시간(초) — Exercise 변경 시 공유 버전 증가로 모든 프로세스 무효화
+    EXERCISE_CATALOG_TTL = int(env_get("EXERCISE_CATALOG_TTL", str(60 * 60)))
 else:
     CACHES = {
         "default": {
@@ -444,6 +464,27 @@ else:
     }
     # Redis를 안 쓰는 환경에서는 캐시 비활성화 느낌으로 0
     AI_MEAL_CACHE_TIMEOUT = 0
+    # LocMem은 프로세스마다 따로라 버전이 어긋날 수 있음 → 기본 끔
+    DAY_ETAG_ENABLED = env_get("DAY_ETAG_ENABLED", "False").lower() == "true"
+    # 무효화가 프로세스마다 따로라 기본 끔
+    WORKOUT_DAY_CACHE_TTL = int(env_get("WORKOUT_DAY_CACHE_TTL", "0"))
+    # 버전이 프로세스마다 따로 → 다른 프로세스 반영은 이 시간만큼 늦을 수 있음
+    EXERCISE_CATALOG_TTL = int(env_get("EXERCISE_CATALOG_TTL", "60"))
+
+# 운동 카탈로그/fixture 응답 브라우저 캐시(Cache-Control max-age, 초). 이후엔 ETag 로 재검증
+EXERCISE_HTTP_MAX_AGE = int(env_get("EXERCISE_HTTP_MAX_AGE", "60"))
+
+# 빠른 추가(최근/자주 먹은 음식): 사용자당 최대 개수, 점수 반감기(일)
+QUICK_FOODS_MAX = int(env_get("QUICK_FOODS_MAX", "30"))
+QUICK_FOODS_HALF_LIFE_DAYS = float(env_get("QUICK_FOODS_HALF_LIFE_DAYS", "14"))
+# 음식 검색(/api/foods/search/) 기본/최대 결과 수
+FOOD_SEARCH_LIMIT = int(env_get("FOOD_SEARCH_LIMIT", "20"))
+FOOD_SEARCH_MAX_LIMIT = int(env_get("FOOD_SEARCH_MAX_LIMIT", "50"))
+
+# meal-analyze 프리뷰 결과 보관 시간(초) — 이 안에 meal-commit 해야 함
+AI_PREVIEW_TOKEN_TTL = int(env_get("AI_PREVIEW_TOKEN_TTL", str(60 * 10)))
+# (폐지 예정) 토큰 없이 클라이언트가 보낸 macros/food_id 로 meal-commit 허용 여부 — 기본 거부
+AI_MEAL_COMMIT_ALLOW_CLIENT_MACROS = env_get("AI_MEAL_COMMIT_ALLOW_CLIENT_MACROS", "False").lower() == "true"
 
 # ─────────────────────────────────────────────────────────────────────────────
 # 7) 패스워드 정책
@@ -586,7 +627,9 @@ if USE_S3:
     AWS_SECRET_ACCESS_KEY = env_get("AWS_SECRET_ACCESS_KEY", None)
 
     # 퍼블릭 GET시 쿼리스트링 제거(가독성)
-    AWS_QUERYSTRING_AUTH = False
+    # 비공개 버킷이면 AWS_QUERYSTRING_AUTH=True → presigned URL (intakes.photo_urls 가 캐시)
+    AWS_QUERYSTRING_AUTH = _bool("AWS_QUERYSTRING_AUTH", "False")
+    AWS_QUERYSTRING_EXPIRE = int(env_get("AWS_QUERYSTRING_EXPIRE", "3600"))
     AWS_S3_SIGNATURE_VERSION = env_get("AWS_S3_SIGNATURE_VERSION", "s3v4")
 
     # Django 5 권장 STORAGES
@@ -23,7 +23,7 @@ def _round1(v: Any) -> float:
 
 # 선택: WorkoutLog가 존재하는 환경에서 운동 시간 합계 사용
 try:
-    from tasks.models import WorkoutLog
+    from tasks.workout_sync import daily_minutes
     HAS_WORKOUT_LOG = True
 except Exception:
     HAS_WORKOUT_LOG = False
@@ -88,16 +88,11 @@ def today_summary(request):
     except Exception:
         dailygoal = None
 
-    # ---- WorkoutLog 합계 (있으면) ----
+    # ---- 운동 합계: 완료 시 증분 갱신되는 하루 합계 행 (tasks/workout_sync.py) ----
     workout_minutes = 0.0
     if HAS_WORKOUT_LOG:
         try:
-            workout_minutes = float(
-                WorkoutLog.objects
-                .filter(user=user, date=today)
-                .aggregate(Sum("duration_min"))["duration_min__sum"]
-                or 0.0
-            )
+            workout_minutes = float(daily_minutes(user.id, today))
         except Exception:
             workout_minutes = 0.0
     workout_minutes = _round1(workout_minutes)
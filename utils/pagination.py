@@ -0,0 +1,145 @@
+"""
+utils/pagination.py
+
+사용자 소유 목록 API용 키셋(커서) 페이지네이션.
+
+- 정렬 키 (ordering 필드..., id) 의 마지막 값을 커서로 넘겨
+  `WHERE (키) < (마지막 값)` 로 다음 페이지를 가져온다 → OFFSET 없음, 깊은 페이지도 일정한 비용
+- 정렬은 뷰의 get_queryset()/OrderingFilter 가 정한 order_by 를 그대로 따르고,
+  마지막에 id 가 없으면 자동으로 붙여 동률을 깨뜨린다 (정렬 키는 NOT NULL 필드만 사용)
+- 응답: {"next": URL|null, "next_cursor": str|null, "results": [...]}
+- 호환: ?paginate=false (또는 settings.API_LIST_BARE_DEFAULT=True) 이면 예전처럼 맨 리스트
+"""
+import base64
+import json
+
+from django.conf import settings
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+FALSY = {"0", "false", "no", "off"}
+TRUTHY = {"1", "true", "yes", "on"}
+
+
+def _encode_cursor(ordering, values):
+    raw = json.dumps({"o": ordering, "v": values}, separators=(",", ":"), default=str)
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def _decode_cursor(token):
+    try:
+        pad = "=" * (-len(token) % 4)
+        data = json.loads(base64.urlsafe_b64decode(token + pad).decode("utf-8"))
+        return data["o"], data["v"]
+    except Exception:
+        raise NotFound("잘못된 cursor 값입니다.")
+
+
+def _resolve(obj, path):
+    for part in path.split("__"):
+        obj = getattr(obj, part)
+    return obj
+
+
+class KeysetPagination(BasePagination):
+    page_size = getattr(settings, "API_PAGE_SIZE", 50)
+    max_page_size = 500
+    cursor_query_param = "cursor"
+    page_size_query_param = "page_size"
+    bare_query_param = "paginate"
+
+    # ---------------- 설정/파라미터 ---------------- #
+    def is_bare(self, request):
+        flag = (request.query_params.get(self.bare_query_param) or "").lower()
+        if flag in FALSY:
+            return True
+        if flag in TRUTHY:
+            return False
+        return getattr(settings, "API_LIST_BARE_DEFAULT", False)
+
+    def get_page_size(self, request):
+        try:
+            size = int(request.query_params.get(self.page_size_query_param) or self.page_size)
+        except (TypeError, ValueError):
+            size = self.page_size
+        return max(1, min(size, self.max_page_size))
+
+    def get_ordering(self, queryset):
+        """order_by → ["-log_date", "-id"] 형태. 표현식 정렬은 지원하지 않으므로 -id 로 대체."""
+        ordering = [o for o in queryset.query.order_by if isinstance(o, str)]
+        if not ordering or len(ordering) != len(queryset.query.order_by):
+            ordering = ["-id"]
+        ordering = ["id" if o == "pk" else "-id" if o == "-pk" else o for o in ordering]
+        if ordering[-1].lstrip("-") != "id":
+            ordering.append("-id" if ordering[-1].startswith("-") else "id")
+        return ordering
+
+    # ---------------- 페이지 계산 ---------------- #
+    def _after(self, ordering, values):
+        """(f1, f2, ..., id) 사전식 비교를 OR 조건으로 전개."""
+        cond = Q()
+        for i, key in enumerate(ordering):
+            field = key.lstrip("-")
+            op = "lt" if key.startswith("-") else "gt"
+            term = Q(**{f"{field}__{op}": values[i]})
+            for prev_key, prev_val in zip(ordering[:i], values[:i]):
+                term &= Q(**{prev_key.lstrip("-"): prev_val})
+            cond |= term
+        # 첫 키에 범위 조건을 한 번 더 걸어 OR 전개에서도 인덱스 range scan 이 되도록
+        first = ordering[0]
+        op = "lte" if first.startswith("-") else "gte"
+        return Q(**{f"{first.lstrip('-')}__{op}": values[0]}) & cond
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if self.is_bare(request):
+            return None
+
+        self.request = request
+        self.ordering = self.get_ordering(queryset)
+        queryset = queryset.order_by(*self.ordering)
+
+        token = request.query_params.get(self.cursor_query_param)
+        if token:
+            ordering, values = _decode_cursor(token)
+            if ordering != self.ordering or len(values) != len(self.ordering) or None in values:
+                raise NotFound("잘못된 cursor 값입니다.")
+            queryset = queryset.filter(self._after(self.ordering, values))
+
+        size = self.get_page_size(request)
+        rows = list(queryset[: size + 1])
+        self.has_next = len(rows) > size
+        page = rows[:size]
+        self.next_cursor = None
+        if self.has_next and page:
+            last = page[-1]
+            self.next_cursor = _encode_cursor(
+                self.ordering, [_resolve(last, key.lstrip("-")) for key in self.ordering]
+            )
+        return page
+
+    def get_next_link(self):
+        if not self.next_cursor:
+            return None
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.cursor_query_param, self.next_cursor)
+
+    def get_paginated_response(self, data):
+        return Response({
+            "next": self.get_next_link(),
+            "next_cursor": self.next_cursor,
+            "results": data,
+        })
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "next_cursor": {"type": "string", "nullable": True},
+                "results": schema,
+            },
+        }